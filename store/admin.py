@@ -1,5 +1,6 @@
 from django.contrib import admin
-from . import models
+from django.db import transaction
+from . import jobs, models, rollups
 from django.contrib.auth.hashers import make_password
 # Register your models here.
 
@@ -13,9 +14,43 @@ class UserAdmin(admin.ModelAdmin):
 admin.site.register(models.User, UserAdmin)
 admin.site.register(models.ProductImage)
 admin.site.register(models.Product)
-admin.site.register(models.Order)
 admin.site.register(models.Customer)
 admin.site.register(models.Collection)
 admin.site.register(models.Review)
 admin.site.register(models.Cart)
 admin.site.register(models.CartItem)
+admin.site.register(models.TaxRate)
+
+
+@admin.register(models.Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ['id', 'customer', 'payment_status', 'placed_at',
+                    'item_count', 'total_price']
+    list_filter = ['payment_status']
+    # Written at checkout from the order lines and counted in the rollups.
+    readonly_fields = ['item_count', 'total_price']
+
+    def save_model(self, request, obj, form, change):
+        # Status changes are moved between the rollups by a signal; orders
+        # added here (without lines) are recorded like a checkout.
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            if not change:
+                rollups.record_order(obj, [])
+
+
+@admin.register(models.Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['name', 'attempts', 'run_at', 'created_at']
+    list_filter = ['name']
+
+
+@admin.register(models.DeadJob)
+class DeadJobAdmin(admin.ModelAdmin):
+    list_display = ['name', 'attempts', 'failed_at']
+    list_filter = ['name']
+    actions = ['requeue']
+
+    @admin.action(description='Requeue selected jobs')
+    def requeue(self, request, queryset):
+        jobs.requeue(list(queryset))
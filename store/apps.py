@@ -6,4 +6,6 @@ class StoreConfig(AppConfig):
     name = 'store'
 
     def ready(self) -> None:
+        import store.checks
         import store.signals
+        import store.tasks
@@ -0,0 +1,210 @@
+"""
+Async versions of the catalog and cart read endpoints, routed instead of
+the views in `views.py` when STORE_ASYNC_VIEWS is on (see `urls.py`).
+
+Only JSON GET/HEAD requests are handled here; writes, other formats and
+error responses are passed to the regular DRF view in a worker thread so
+both stacks answer with the same bodies and headers.
+"""
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.decorators import classonlymethod
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+
+from . import cache, serializers, tax, views
+from .models import Cart, CartItem, Collection
+
+
+class AsyncReadView:
+    view_class = None
+
+    @classonlymethod
+    def as_view(cls):
+        sync_view = sync_to_async(cls.view_class.as_view())
+
+        async def view(request, *args, **kwargs):
+            response = None
+            if request.method in ('GET', 'HEAD'):
+                response = await cls().dispatch(request, *args, **kwargs)
+            if response is None:
+                response = await sync_view(request, *args, **kwargs)
+            return response
+
+        view.view_class = cls.view_class
+        # csrf_exempt() would wrap the coroutine in a sync function.
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Return the response, or None to let the sync view answer."""
+        view = self.view_class()
+        view.setup(request, *args, **kwargs)
+        view.headers = view.default_response_headers
+        view.request = request = view.initialize_request(request, *args, **kwargs)
+        if not await self.initial(view, request):
+            return None
+        try:
+            response = await self.get(view, request, **kwargs)
+        except (APIException, Http404):
+            return None
+        if response is not None:
+            self.finalize_response(view, response)
+        return response
+
+    async def initial(self, view, request):
+        """Negotiate, authenticate and check permissions like `APIView.initial`."""
+        view.format_kwarg = view.get_format_suffix(**view.kwargs)
+        try:
+            renderer, media_type = view.perform_content_negotiation(request)
+        except APIException:
+            return False
+        if not isinstance(renderer, JSONRenderer):
+            return False
+        request.accepted_renderer, request.accepted_media_type = renderer, media_type
+        try:
+            if 'Authorization' in request.headers:
+                # JWT authentication loads the user.
+                await sync_to_async(view.perform_authentication)(request)
+            else:
+                view.perform_authentication(request)
+            view.check_permissions(request)
+        except APIException:
+            return False
+        return True
+
+    async def get(self, view, request, **kwargs):
+        raise NotImplementedError
+
+    def render(self, view, request, data):
+        renderer = request.accepted_renderer
+        return HttpResponse(
+            renderer.render(data, request.accepted_media_type, {'request': request}),
+            content_type=renderer.media_type)
+
+    def finalize_response(self, view, response):
+        # The Allow and Vary headers `APIView.finalize_response` adds.
+        headers = dict(view.headers)
+        vary = headers.pop('Vary', None)
+        if vary is not None:
+            patch_vary_headers(response, [vary])
+        for name, value in headers.items():
+            response[name] = value
+
+
+class CachedReadView(AsyncReadView):
+    """
+    Async counterpart of `CachedResponseMixin.get`. Hits and 304s only
+    touch the cache, through its async API; misses are built by `load()`.
+    """
+
+    async def get(self, view, request, **kwargs):
+        key, etag = await view.aget_etag(request, **kwargs)
+        response = cache.not_modified(request, etag)
+        if response is not None:
+            return response
+
+        entry = await cache.get_cache().aget(key)
+        if entry is not None:
+            await cache.arecord(view.cache_namespace, 'hit')
+            response = self.render(view, request, entry['data'])
+            response['X-Cache'] = 'HIT'
+        else:
+            data = await self.load(view, request, **kwargs)
+            if data is None:
+                return None
+            await cache.arecord(view.cache_namespace, 'miss')
+            entry = await view.astore_response(key, data)
+            response = self.render(view, request, data)
+            response['X-Cache'] = 'MISS'
+        return view.finalize_cached_response(request, response, etag, entry)
+
+    async def load(self, view, request, **kwargs):
+        """Return the response body, or None if the sync view should answer."""
+        raise NotImplementedError
+
+    def get_serializer_context(self, view, request, **extra):
+        return {'request': request, 'format': view.format_kwarg, 'view': view,
+                **extra}
+
+
+class ProductList(CachedReadView):
+    view_class = views.ProductList
+
+    async def load(self, view, request):
+        # Filtering, search and pagination are all synchronous DRF code, so
+        # only the cache lookup above is done on the event loop.
+        response = await sync_to_async(view.list)(request)
+        return response.data if response.status_code == 200 else None
+
+
+class ProductDetail(CachedReadView):
+    view_class = views.ProductDetail
+
+    async def load(self, view, request, pk):
+        product = await view.get_queryset().filter(pk=pk).afirst()
+        if product is None:
+            return None
+        rates = await sync_to_async(tax.rates_for)(tax.get_region(request))
+        return serializers.ProductSerializer(
+            product, context=self.get_serializer_context(
+                view, request, tax_rates=rates)).data
+
+
+class CollectionList(CachedReadView):
+    view_class = views.CollectionList
+
+    async def load(self, view, request):
+        collections = [collection async for collection in Collection.objects.all()]
+        return serializers.CollectionSerializer(
+            collections, many=True,
+            context=self.get_serializer_context(view, request)).data
+
+
+class CartRetrieve(AsyncReadView):
+    view_class = views.CartRetrieve
+
+    async def get(self, view, request, pk):
+        try:
+            UUID(pk)
+        except ValueError:
+            return None
+        state = tuple([row async for row in views.cart_state(pk)])
+        if not state:
+            return None
+        etag = views.format_cart_etag(pk, state, views.cart_totals_only(request))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            cart = await view.get_queryset().filter(pk=pk).afirst()
+            if cart is None:
+                return None
+            response = self.render(view, request, view.get_serializer_class()(
+                cart, context={'request': request, 'view': view}).data)
+        response.headers.setdefault('ETag', etag)
+        return response
+
+
+class CartItemsList(AsyncReadView):
+    view_class = views.CartItemsList
+
+    async def get(self, view, request, pk):
+        try:
+            UUID(pk)
+        except ValueError:
+            return None
+        if views.cart_totals_only(request):
+            cart = await Cart.objects.with_totals().filter(pk=pk).afirst()
+            if cart is None:
+                return None
+            return self.render(view, request,
+                               serializers.CartTotalSerializer(cart).data)
+        items = [item async for item in CartItem.objects.filter(cart_id=pk).priced()]
+        # An empty result is either an empty cart or a missing one; the sync
+        # view tells them apart.
+        if not items:
+            return None
+        return self.render(view, request, serializers.CartItemSerializer(
+            items, many=True, context={'request': request, 'view': view}).data)
@@ -0,0 +1,213 @@
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from types import ModuleType
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache as default_cache
+from django.db import connection, connections
+from django.test import AsyncClient, Client
+from django.urls import include, path
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .metrics import RequestTimings
+from .models import Cart, CartItem, User
+from .synthetic import WORDS
+from .urls import get_urlpatterns
+
+def build_scenarios(dataset, rng):
+    """
+    Return `{name: prepare}`; `prepare()` does any untimed setup and
+    returns the request to time.
+    """
+    client = Client()
+    product_ids = dataset['product_ids']
+    cart_ids = dataset['cart_ids']
+    buyer = User.objects.get(pk=dataset['user_ids'][0])
+    auth = {'HTTP_AUTHORIZATION':
+            f'Bearer {RefreshToken.for_user(buyer).access_token}'}
+
+    def get(path, **extra):
+        return lambda: lambda: client.get(path, **extra)
+
+    def product_list_filtered():
+        query = {'collection': rng.choice(dataset['collection_ids']),
+                 'unit_price__gt': rng.randint(1, 500),
+                 'ordering': rng.choice(['unit_price', '-unit_price', 'id'])}
+        return lambda: client.get('/api/products/', query)
+
+    def product_search():
+        query = {'search': f'{rng.choice(WORDS)} {rng.choice(WORDS)[:3]}'}
+        return lambda: client.get('/api/products/', query)
+
+    def product_detail():
+        path = f'/api/products/{rng.choice(product_ids)}/'
+        return lambda: client.get(path)
+
+    def cart_add():
+        path = f'/api/cart/{rng.choice(cart_ids)}/items/'
+        data = {'product_id': rng.choice(product_ids), 'quantity': 1}
+        return lambda: client.post(path, data)
+
+    def cart_read():
+        path = f'/api/cart/{rng.choice(cart_ids)}/'
+        return lambda: client.get(path)
+
+    def checkout():
+        cart = Cart.objects.create()
+        CartItem.objects.add_items(
+            cart.pk, {pk: rng.randint(1, 3) for pk in rng.sample(product_ids, 3)})
+        return lambda: client.post('/api/orders/', {'cart_id': cart.pk}, **auth)
+
+    return {
+        'product-list': get('/api/products/'),
+        'product-list-cursor': get('/api/products/?cursor='),
+        'product-list-filtered': product_list_filtered,
+        'product-search': product_search,
+        'product-detail': product_detail,
+        'cart-add': cart_add,
+        'cart-read': cart_read,
+        'checkout': checkout,
+        'order-history': get('/api/orders/', **auth),
+    }
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_scenario(prepare, iterations, warmup=0, cold_cache=False):
+    latencies, queries, errors = [], [], 0
+    for iteration in range(warmup + iterations):
+        request = prepare()
+        if cold_cache:
+            default_cache.clear()
+        timings = RequestTimings()
+        with connection.execute_wrapper(timings):
+            start = perf_counter()
+            response = request()
+            elapsed = perf_counter() - start
+        if iteration < warmup:
+            continue
+        latencies.append(elapsed)
+        queries.append(timings.queries)
+        if response.status_code >= 400:
+            errors += 1
+
+    total = sum(latencies)
+    return {
+        'iterations': iterations,
+        'errors': errors,
+        'throughput_rps': round(iterations / total, 2) if total else None,
+        'mean_ms': round(total / iterations * 1000, 3),
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 3),
+        'p90_ms': round(percentile(latencies, 0.9) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'queries_mean': round(sum(queries) / iterations, 2),
+        'queries_max': max(queries),
+    }
+
+
+def run_benchmarks(dataset, iterations, warmup=0, seed=0, only=None,
+                   cold_cache=False, progress=None):
+    rng = random.Random(seed)
+    results = {}
+    for name, prepare in build_scenarios(dataset, rng).items():
+        if only and name not in only:
+            continue
+        results[name] = run_scenario(prepare, iterations, warmup, cold_cache)
+        if progress is not None:
+            progress(name, results[name])
+    return results
+
+
+def compare(baseline, results):
+    """Yield `(scenario, metric, before, after, change_percent)`."""
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ('throughput_rps', 'p50_ms', 'p99_ms', 'queries_mean'):
+            before, after = previous.get(metric), current.get(metric)
+            if before and after is not None:
+                yield name, metric, before, after, (after - before) / before * 100
+
+
+def get_urlconf(async_reads):
+    """A ROOT_URLCONF serving the store API from the sync or async views."""
+    urlconf = ModuleType(f'store_urls_{"async" if async_reads else "sync"}')
+    urlconf.urlpatterns = [path('api/', include(get_urlpatterns(async_reads)))]
+    return urlconf
+
+
+def build_load_paths(dataset, rng, count):
+    """A random mix of `count` catalog and cart reads."""
+    product_ids = dataset['product_ids']
+    collection_ids = dataset['collection_ids']
+    cart_ids = dataset['cart_ids']
+    choices = [
+        lambda: '/api/products/',
+        lambda: f'/api/products/?collection={rng.choice(collection_ids)}',
+        lambda: f'/api/products/{rng.choice(product_ids)}/',
+        lambda: '/api/collections/',
+        lambda: f'/api/cart/{rng.choice(cart_ids)}/',
+        lambda: f'/api/cart/{rng.choice(cart_ids)}/items/',
+    ]
+    return [rng.choice(choices)() for _ in range(count)]
+
+
+def _summarize(samples, elapsed):
+    latencies = [latency for latency, _ in samples]
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for _, status in samples if status >= 400),
+        'throughput_rps': round(len(samples) / elapsed, 2),
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 3),
+        'p90_ms': round(percentile(latencies, 0.9) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def run_threaded_load(paths, concurrency):
+    """Thread-per-request: `concurrency` threads, each with a sync client."""
+    def worker(chunk):
+        client, samples = Client(), []
+        try:
+            for url in chunk:
+                start = perf_counter()
+                response = client.get(url)
+                samples.append((perf_counter() - start, response.status_code))
+        finally:
+            connections.close_all()
+        return samples
+
+    chunks = [paths[i::concurrency] for i in range(concurrency)]
+    start = perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        samples = [sample for chunk in pool.map(worker, chunks) for sample in chunk]
+    return _summarize(samples, perf_counter() - start)
+
+
+def run_async_load(paths, concurrency):
+    """`concurrency` coroutines on one event loop, each with an async client."""
+    async def worker(chunk):
+        client, samples = AsyncClient(), []
+        for url in chunk:
+            start = perf_counter()
+            response = await client.get(url)
+            samples.append((perf_counter() - start, response.status_code))
+        return samples
+
+    async def main():
+        try:
+            return await asyncio.gather(*(
+                worker(paths[i::concurrency]) for i in range(concurrency)))
+        finally:
+            await sync_to_async(connections.close_all)()
+
+    start = perf_counter()
+    samples = [sample for chunk in asyncio.run(main()) for sample in chunk]
+    return _summarize(samples, perf_counter() - start)
@@ -0,0 +1,293 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils.cache import (get_conditional_response, patch_cache_control,
+                                patch_vary_headers)
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+CACHE_ALIAS = getattr(settings, 'STORE_CACHE_ALIAS', 'default')
+RESPONSE_TIMEOUT = getattr(settings, 'STORE_RESPONSE_CACHE_TIMEOUT', 60 * 60)
+NAMESPACES = set()
+
+
+def get_cache():
+    return caches[CACHE_ALIAS]
+
+
+def _version_key(scope, ident=None):
+    if ident is None:
+        return f'store:version:{scope}'
+    return f'store:version:{scope}:{ident}'
+
+
+def get_versions(*scopes):
+    """
+    Return the current version of every `(scope, ident)` pair.
+
+    Missing counters are seeded from the clock rather than 1, so a counter
+    that was evicted can never come back with a value an old cached
+    response was stored under.
+    """
+    cache = get_cache()
+    keys = [_version_key(*scope) for scope in scopes]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(*scopes):
+    """`get_versions()` for views running on the event loop."""
+    cache = get_cache()
+    keys = [_version_key(*scope) for scope in scopes]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, time.time_ns(), None)
+            versions[key] = await cache.aget(key)
+    return [versions[key] for key in keys]
+
+
+def bump_version(scope, ident=None):
+    cache = get_cache()
+    key = _version_key(scope, ident)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def bump_product(product_id, *collection_ids):
+    bump_products([product_id], collection_ids)
+
+
+def bump_products(product_ids, collection_ids=()):
+    product_ids, collection_ids = set(product_ids), set(collection_ids)
+
+    def bump():
+        for product_id in product_ids:
+            bump_version('product', product_id)
+        bump_version('catalog')
+        for collection_id in collection_ids:
+            if collection_id is not None:
+                bump_version('collection', collection_id)
+    transaction.on_commit(bump)
+
+
+def bump_collection(collection_id):
+    def bump():
+        bump_version('collection', collection_id)
+        bump_version('collections')
+    transaction.on_commit(bump)
+
+
+def bump_reviews(*product_ids):
+    def bump():
+        for product_id in set(product_ids):
+            bump_version('reviews', product_id)
+    transaction.on_commit(bump)
+
+
+def bump_recommendations(product_ids, collection_ids):
+    def bump():
+        for product_id in set(product_ids):
+            bump_version('related', product_id)
+        for collection_id in set(collection_ids):
+            bump_version('bestsellers', collection_id)
+    transaction.on_commit(bump)
+
+
+def _stats_key(namespace, outcome):
+    return f'store:stats:{namespace}:{outcome}'
+
+
+def record(namespace, outcome):
+    cache = get_cache()
+    key = _stats_key(namespace, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, None)
+
+
+async def arecord(namespace, outcome):
+    cache = get_cache()
+    key = _stats_key(namespace, outcome)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aadd(key, 1, None)
+
+
+def get_stats(*namespaces):
+    cache = get_cache()
+    stats = {}
+    for namespace in namespaces:
+        stats[namespace] = {
+            outcome: cache.get(_stats_key(namespace, outcome), 0)
+            for outcome in ('hit', 'miss')
+        }
+    return stats
+
+
+def response_cache_key(request, namespace, versions, variant=()):
+    params = sorted(
+        (name, value)
+        for name in request.query_params
+        for value in request.query_params.getlist(name))
+    raw = json.dumps([request.scheme, request.get_host(), request.path,
+                      params, versions, list(variant)], default=str)
+    digest = hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    return f'store:response:2:{namespace}:{digest}'
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'The resource was modified since it was last fetched.'
+    default_code = 'precondition_failed'
+
+
+def response_etag(request, key):
+    renderer = getattr(request, 'accepted_renderer', None)
+    raw = f'{key}:{getattr(renderer, "format", "")}'
+    return '"%s"' % hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def not_modified(request, etag):
+    """Return a 304 if the request's If-None-Match matches `etag`."""
+    if not request.headers.get('If-None-Match'):
+        return None
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response['ETag'] = etag
+    return response
+
+
+class CachedResponseMixin:
+    """
+    Read-through cache for GET responses, keyed on the normalized query
+    string and the versions of the scopes returned by `get_cache_scopes()`
+    (by default the fixed `cache_scopes`).
+
+    Responses carry an ETag derived from the same key and a Last-Modified
+    of when the cached body was built, so conditional GETs are answered
+    with a 304 from the version counters alone. PUT/PATCH requests with
+    an If-Match header are only applied if it matches the current ETag.
+    """
+    cache_namespace = None
+    cache_scopes = ()
+    # Scopes shared with other resources (e.g. the tax rate table): they
+    # are part of the key but not bumped by updates through this view.
+    cache_extra_scopes = ()
+    cache_vary_headers = ()
+    # Lets browsers and shared caches reuse GET responses for this long
+    # (in seconds) without revalidating.
+    cache_max_age = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cache_namespace:
+            if (not cls.cache_scopes and cls.get_cache_scopes
+                    is CachedResponseMixin.get_cache_scopes):
+                # Without a scope nothing the view serves ever invalidates it.
+                raise ImproperlyConfigured(
+                    f'{cls.__name__} must set cache_scopes or override '
+                    'get_cache_scopes().')
+            NAMESPACES.add(cls.cache_namespace)
+
+    def get_cache_scopes(self, request, *args, **kwargs):
+        """The `(scope, ident)` pairs whose bumps invalidate the response."""
+        return list(self.cache_scopes)
+
+    def get_cache_variant(self, request):
+        """Request-derived values besides the query string the body depends on."""
+        return ()
+
+    def get_etag(self, request, *args, **kwargs):
+        versions = get_versions(*self.get_cache_scopes(request, *args, **kwargs),
+                                *self.cache_extra_scopes)
+        return self.get_etag_for_versions(request, versions)
+
+    async def aget_etag(self, request, *args, **kwargs):
+        versions = await aget_versions(
+            *self.get_cache_scopes(request, *args, **kwargs),
+            *self.cache_extra_scopes)
+        return self.get_etag_for_versions(request, versions)
+
+    def get_etag_for_versions(self, request, versions):
+        key = response_cache_key(request, self.cache_namespace, versions,
+                                 self.get_cache_variant(request))
+        return key, response_etag(request, key)
+
+    def get(self, request, *args, **kwargs):
+        key, etag = self.get_etag(request, *args, **kwargs)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        entry = get_cache().get(key)
+        if entry is not None:
+            record(self.cache_namespace, 'hit')
+            response = Response(entry['data'], headers={'X-Cache': 'HIT'})
+        else:
+            record(self.cache_namespace, 'miss')
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            entry = self.store_response(key, response.data)
+            response['X-Cache'] = 'MISS'
+        return self.finalize_cached_response(request, response, etag, entry)
+
+    def store_response(self, key, data):
+        entry = {'data': data, 'modified': int(time.time())}
+        get_cache().set(key, entry, RESPONSE_TIMEOUT)
+        return entry
+
+    async def astore_response(self, key, data):
+        entry = {'data': data, 'modified': int(time.time())}
+        await get_cache().aset(key, entry, RESPONSE_TIMEOUT)
+        return entry
+
+    def finalize_cached_response(self, request, response, etag, entry):
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(entry['modified'])
+        if self.cache_vary_headers:
+            patch_vary_headers(response, self.cache_vary_headers)
+        return get_conditional_response(
+            request, etag=etag, last_modified=entry['modified'], response=response)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (self.cache_max_age is not None and request.method in ('GET', 'HEAD')
+                and response.status_code in (200, 304)):
+            patch_cache_control(response, public=True, max_age=self.cache_max_age)
+        return response
+
+    def update(self, request, *args, **kwargs):
+        if 'If-Match' not in request.headers:
+            return super().update(request, *args, **kwargs)
+        lookup = self.lookup_url_kwarg or self.lookup_field
+        with transaction.atomic():
+            # Writers with the same If-Match queue on the row lock; the
+            # versions are bumped before commit (and again by the usual
+            # on-commit invalidation) so the next one sees a new ETag.
+            list(self.get_queryset().model.objects.select_for_update()
+                 .filter(**{self.lookup_field: self.kwargs[lookup]})
+                 .values_list('pk', flat=True))
+            _, etag = self.get_etag(request, **self.kwargs)
+            if get_conditional_response(request, etag=etag) is not None:
+                raise PreconditionFailed()
+            response = super().update(request, *args, **kwargs)
+            for scope in self.get_cache_scopes(request, **self.kwargs):
+                bump_version(*scope)
+        return response
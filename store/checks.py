@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, register
+from django.utils.module_loading import import_string
+
+from .cache import CACHE_ALIAS
+
+
+@register()
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Cached responses are invalidated by bumping version counters in the
+    cache, so every process has to see the same cache.
+    """
+    if getattr(settings, 'STORE_ALLOW_LOCAL_CACHE', False):
+        return []
+    config = settings.CACHES.get(CACHE_ALIAS)
+    if config is None:
+        return [Error(f'The {CACHE_ALIAS!r} cache used by the store is not configured.',
+                      id='store.E001')]
+    backend = import_string(config['BACKEND'])
+    if issubclass(backend, (LocMemCache, DummyCache)):
+        return [Error(
+            f'The store cache ({config["BACKEND"]}) is not shared between '
+            'processes, so a write only invalidates the responses cached '
+            'by the process that made it.',
+            hint='Configure Redis, Memcached or DatabaseCache, or set '
+                 'STORE_ALLOW_LOCAL_CACHE = True for single-process runs.',
+            id='store.E002')]
+    return []
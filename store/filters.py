@@ -1,11 +1,34 @@
-from django_filters import FilterSet
-from .models import Product
+from django_filters import FilterSet, NumberFilter
+from rest_framework.filters import SearchFilter
+from .models import Product, Review
+from .search import search_products
 
 
 class ProductFilter(FilterSet):
+    min_rating = NumberFilter(field_name='rating_average', lookup_expr='gte')
+
     class Meta:
         model = Product
         fields = {
             'collection': ['exact',],
             'unit_price': ['gt', 'lt']
         }
+
+
+class ReviewFilter(FilterSet):
+    min_rate = NumberFilter(field_name='rate', lookup_expr='gte')
+
+    class Meta:
+        model = Review
+        fields = ['rate']
+
+
+class ProductSearchFilter(SearchFilter):
+    """
+    `?search=` over the product search index (titles and descriptions,
+    see `search.product_terms`); views need no `search_fields`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        return search_products(queryset, query)
@@ -0,0 +1,116 @@
+import json
+from datetime import timedelta
+from functools import wraps
+from hashlib import sha256
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+HEADER = 'Idempotency-Key'
+KEY_TTL = getattr(settings, 'STORE_IDEMPOTENCY_KEY_TTL', timedelta(hours=24))
+IN_FLIGHT_TIMEOUT = getattr(
+    settings, 'STORE_IDEMPOTENCY_IN_FLIGHT_TIMEOUT', timedelta(minutes=1))
+
+
+def _digest(*parts):
+    return sha256(':'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+
+def _claim(key, fingerprint):
+    """
+    Return `(record, True)` when this request owns `key`, or the existing
+    record and False when another request already claimed it.
+    """
+    while True:
+        try:
+            with transaction.atomic():
+                return IdempotencyKey.objects.create(
+                    key=key, fingerprint=fingerprint), True
+        except IntegrityError:
+            record = IdempotencyKey.objects.filter(key=key).first()
+        if record is None:
+            continue
+
+        stale = timezone.now() - IN_FLIGHT_TIMEOUT
+        if record.status_code is None and record.created_at < stale:
+            # The request that claimed the key died before finishing.
+            taken = IdempotencyKey.objects.filter(
+                pk=record.pk, status_code__isnull=True,
+                created_at=record.created_at,
+            ).update(created_at=timezone.now(), fingerprint=fingerprint)
+            if taken:
+                return record, True
+        return record, False
+
+
+def _principal(view, request):
+    """
+    Who a key belongs to, or None when a replay could reach another client.
+    Anonymous keys are only honoured on views whose URL holds the client's
+    credential (e.g. the cart id), since the path is part of the key.
+    """
+    if request.user.is_authenticated:
+        return f'user:{request.user.pk}'
+    if getattr(view, 'idempotent_anonymous', False):
+        return 'anonymous'
+    return None
+
+
+def idempotent(handler):
+    """
+    Replay the stored response of a view method for repeated requests that
+    carry the same `Idempotency-Key` header.
+    """
+    @wraps(handler)
+    def wrapper(view, request, *args, **kwargs):
+        client_key = request.headers.get(HEADER)
+        principal = _principal(view, request)
+        if not client_key or principal is None:
+            return handler(view, request, *args, **kwargs)
+
+        key = _digest(principal, request.method, request.path, client_key)
+        # The principal is part of the fingerprint too, so a record is
+        # never replayed to anyone but the client that made it.
+        fingerprint = _digest(
+            principal, json.dumps(request.data, sort_keys=True, default=str))
+        record, owned = _claim(key, fingerprint)
+
+        if not owned:
+            if record.fingerprint != fingerprint:
+                return Response(
+                    {'error': f'{HEADER} was already used for a different request.'},
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+            if record.status_code is None:
+                return Response(
+                    {'error': f'A request with this {HEADER} is still in progress.'},
+                    status=status.HTTP_409_CONFLICT)
+            return Response(json.loads(record.response_body),
+                            status=record.status_code,
+                            headers={'Idempotent-Replayed': 'true'})
+
+        try:
+            response = handler(view, request, *args, **kwargs)
+        except Exception:
+            IdempotencyKey.objects.filter(pk=record.pk).delete()
+            raise
+
+        if response.status_code >= 500:
+            IdempotencyKey.objects.filter(pk=record.pk).delete()
+        else:
+            IdempotencyKey.objects.filter(pk=record.pk).update(
+                status_code=response.status_code,
+                response_body=JSONRenderer().render(response.data).decode('utf-8'))
+        return response
+    return wrapper
+
+
+def purge_expired(ttl=KEY_TTL):
+    deleted, _ = IdempotencyKey.objects.filter(
+        created_at__lt=timezone.now() - ttl).delete()
+    return deleted
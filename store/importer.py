@@ -0,0 +1,169 @@
+from itertools import islice
+from uuid import uuid4
+
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ParseError, ValidationError
+
+from . import cache, search
+from .models import Collection, Product
+from .serializers import ProductImportSerializer
+
+SEARCH_FIELDS = {'title', 'description'}
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.errors = []
+
+    def as_dict(self):
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'errors': self.errors,
+        }
+
+
+def _field(name):
+    return 'collection_id' if name == 'collection' else name
+
+
+def _validate(chunk, first_row):
+    """
+    Return the `(row number, validated data)` pairs, the rejected rows and
+    the existing products the chunk refers to.
+    """
+    ids, collection_ids = set(), set()
+    for row in chunk:
+        if isinstance(row, dict):
+            ids.add(row.get('id'))
+            collection_ids.add(row.get('collection'))
+    serializer = ProductImportSerializer(context={
+        'products': Product.objects.in_bulk(
+            [pk for pk in ids if str(pk).isdigit()]),
+        'collection_ids': set(Collection.objects.filter(
+            pk__in=[pk for pk in collection_ids if str(pk).isdigit()])
+            .values_list('pk', flat=True)),
+    })
+
+    valid, errors = [], []
+    for number, row in enumerate(chunk, first_row):
+        if isinstance(row, ParseError):
+            errors.append({'row': number, 'errors': {'non_field_errors': [row.detail]}})
+            continue
+        if not isinstance(row, dict):
+            errors.append({'row': number, 'errors': {
+                'non_field_errors': ['Expected an object.']}})
+            continue
+        try:
+            valid.append((number, serializer.run_validation(row)))
+        except ValidationError as exc:
+            errors.append({'row': number, 'errors': exc.detail})
+    return valid, errors, serializer.context['products']
+
+
+def _create(products):
+    """
+    bulk_create() the products and return them with their ids. Backends
+    that cannot return ids from a bulk insert (MySQL) insert them under
+    slugs unique to this call, read them back by those slugs (other
+    writers' new products are never picked up) and then restore the
+    imported slugs.
+    """
+    if connection.features.can_return_rows_from_bulk_insert:
+        return Product.objects.bulk_create(products)
+    marker = uuid4().hex
+    slugs = {}
+    for number, product in enumerate(products):
+        slug = f'{marker}-{number}'
+        slugs[slug], product.slug = product.slug, slug
+    Product.objects.bulk_create(products)
+    created = list(Product.objects.filter(slug__in=slugs).order_by('pk'))
+    for product in created:
+        product.slug = slugs[product.slug]
+    Product.objects.bulk_update(created, ['slug'])
+    return created
+
+
+def _apply(valid, products, result):
+    now = timezone.now()
+    created, changed, fields = [], {}, set()
+    reindexed, collection_ids = set(), set()
+
+    for _, data in valid:
+        data = {_field(name): value for name, value in data.items()}
+        pk = data.pop('id', None)
+        if pk is None:
+            created.append(Product(**data))
+            collection_ids.add(data['collection_id'])
+            continue
+
+        product = products[pk]
+        updates = {name: value for name, value in data.items()
+                   if getattr(product, name) != value}
+        if not updates:
+            if pk not in changed:
+                result.unchanged += 1
+            continue
+        if 'collection_id' in updates:
+            collection_ids.add(product.collection_id)
+        for name, value in updates.items():
+            setattr(product, name, value)
+        # bulk_update() does not apply auto_now, so last_update is set here
+        # and only for rows that actually changed.
+        product.last_update = now
+        fields.update(updates)
+        if SEARCH_FIELDS & set(updates):
+            reindexed.add(pk)
+        changed[pk] = product
+
+    if not created and not changed:
+        return
+    with transaction.atomic():
+        if created:
+            created = _create(created)
+        if changed:
+            Product.objects.bulk_update(
+                list(changed.values()), sorted(fields | {'last_update'}))
+
+        indexed = created + [changed[pk] for pk in sorted(reindexed)]
+        if indexed:
+            search.index_products(indexed)
+        collection_ids.update(product.collection_id
+                              for product in changed.values())
+        cache.bump_products(
+            [product.pk for product in created] + list(changed), collection_ids)
+
+    result.created += len(created)
+    result.updated += len(changed)
+
+
+def import_products(rows, chunk_size=1000, dry_run=False, progress=None):
+    """
+    Create or update products from an iterable of row dicts.
+
+    Rows are validated and written `chunk_size` at a time, each chunk in
+    its own transaction. Invalid rows are skipped and reported with their
+    1-based row number; the rest of the chunk is still applied.
+    """
+    result = ImportResult()
+    rows = iter(rows)
+    processed = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return result
+        valid, errors, products = _validate(chunk, processed + 1)
+        result.errors.extend(errors)
+        if dry_run:
+            result.updated += sum(1 for _, data in valid if 'id' in data)
+            result.created += sum(1 for _, data in valid if 'id' not in data)
+        else:
+            _apply(valid, products, result)
+        processed += len(chunk)
+        if progress is not None:
+            progress(processed)
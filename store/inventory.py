@@ -0,0 +1,55 @@
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from . import cache
+from .models import Product
+
+
+class InsufficientStock(Exception):
+    def __init__(self, shortages):
+        self.shortages = shortages
+        super().__init__(shortages)
+
+
+def _shortages(quantities, available):
+    return [
+        {'product_id': pk, 'requested': quantities[pk],
+         'available': available.get(pk, 0)}
+        for pk in sorted(quantities)
+        if available.get(pk, 0) < quantities[pk]
+    ]
+
+
+def reserve(quantities):
+    """
+    Take `quantities` ({product_id: quantity}) out of stock.
+
+    Must run inside transaction.atomic(). Rows are locked in primary key
+    order so concurrent checkouts cannot deadlock, then decremented with a
+    single UPDATE that also re-checks `inventory >= quantity` per row.
+    Raises InsufficientStock listing every short line.
+    """
+    product_ids = sorted(quantities)
+    locked = Product.objects.select_for_update().filter(pk__in=product_ids) \
+        .order_by('pk').values_list('pk', 'inventory', 'collection_id')
+    available, collections = {}, {}
+    for pk, inventory, collection_id in locked:
+        available[pk] = inventory
+        collections[pk] = collection_id
+
+    shortages = _shortages(quantities, available)
+    if shortages:
+        raise InsufficientStock(shortages)
+
+    requested = Case(
+        *[When(pk=pk, then=Value(quantities[pk])) for pk in product_ids],
+        output_field=IntegerField())
+    updated = Product.objects.filter(pk__in=product_ids, inventory__gte=requested) \
+        .update(inventory=F('inventory') - requested, last_update=timezone.now())
+    if updated != len(product_ids):
+        available = dict(Product.objects.filter(pk__in=product_ids)
+                         .values_list('pk', 'inventory'))
+        raise InsufficientStock(_shortages(quantities, available))
+
+    for pk in product_ids:
+        cache.bump_product(pk, collections[pk])
@@ -0,0 +1,108 @@
+import logging
+import random
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import DeadJob, Job
+
+logger = logging.getLogger(__name__)
+
+# How long a claimed job is hidden from other workers.
+LEASE = getattr(settings, 'STORE_JOBS_LEASE', timedelta(minutes=5))
+BACKOFF_BASE = getattr(settings, 'STORE_JOBS_BACKOFF_BASE', timedelta(seconds=10))
+BACKOFF_MAX = getattr(settings, 'STORE_JOBS_BACKOFF_MAX', timedelta(hours=1))
+MAX_ATTEMPTS = getattr(settings, 'STORE_JOBS_MAX_ATTEMPTS', 5)
+
+_tasks = {}
+
+
+def task(func):
+    """Register `func` so it can be queued with `enqueue()`."""
+    _tasks[f'{func.__module__}.{func.__name__}'] = func
+    func.job_name = f'{func.__module__}.{func.__name__}'
+    return func
+
+
+def enqueue(func, max_attempts=MAX_ATTEMPTS, **payload):
+    """
+    Queue `func(**payload)`; the payload must be JSON serializable.
+
+    The row is written in the caller's transaction, so the job only becomes
+    visible to workers once that commits and is dropped if it rolls back.
+    """
+    if getattr(func, 'job_name', None) not in _tasks:
+        raise ValueError(f'{func!r} is not a registered task')
+    return Job.objects.create(
+        name=func.job_name, payload=payload, max_attempts=max_attempts)
+
+
+def backoff(attempts):
+    """Delay before retry number `attempts`: exponential with 10% jitter."""
+    delay = min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX)
+    return delay * random.uniform(0.9, 1.1)
+
+
+def claim(limit):
+    """Lease up to `limit` due jobs to this worker, oldest first."""
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(Job.objects.select_for_update(skip_locked=True)
+                   .filter(run_at__lte=now).order_by('run_at')
+                   .values_list('pk', flat=True)[:limit])
+        Job.objects.filter(pk__in=ids).update(
+            run_at=now + LEASE, attempts=F('attempts') + 1)
+    return list(Job.objects.filter(pk__in=ids).order_by('run_at', 'pk'))
+
+
+def run(job):
+    """Run a claimed job; return True if it succeeded."""
+    try:
+        func = _tasks.get(job.name)
+        if func is None:
+            raise LookupError(f'Unknown task {job.name}')
+        func(**job.payload)
+    except Exception:
+        fail(job, traceback.format_exc())
+        return False
+    Job.objects.filter(pk=job.pk).delete()
+    return True
+
+
+def fail(job, error):
+    if job.attempts >= job.max_attempts:
+        logger.error('Job %s failed %d times, moving it to the dead letter '
+                     'table:\n%s', job, job.attempts, error)
+        with transaction.atomic():
+            DeadJob.objects.create(
+                name=job.name, payload=job.payload, attempts=job.attempts,
+                last_error=error, created_at=job.created_at)
+            Job.objects.filter(pk=job.pk).delete()
+        return
+    logger.warning('Job %s failed (attempt %d of %d):\n%s',
+                   job, job.attempts, job.max_attempts, error)
+    Job.objects.filter(pk=job.pk).update(
+        run_at=timezone.now() + backoff(job.attempts), last_error=error)
+
+
+def run_pending(limit=100):
+    """Run the jobs that are due now; return `(succeeded, failed)`."""
+    succeeded = failed = 0
+    for job in claim(limit):
+        if run(job):
+            succeeded += 1
+        else:
+            failed += 1
+    return succeeded, failed
+
+
+def requeue(dead_jobs):
+    """Move dead jobs back to the queue with their attempts reset."""
+    with transaction.atomic():
+        Job.objects.bulk_create([
+            Job(name=job.name, payload=job.payload) for job in dead_jobs])
+        DeadJob.objects.filter(pk__in=[job.pk for job in dead_jobs]).delete()
@@ -0,0 +1,102 @@
+import json
+import platform
+import subprocess
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import (setup_test_environment,
+                               teardown_test_environment)
+
+from store import benchmarks, synthetic
+
+
+class Command(BaseCommand):
+    help = ('Seeds a synthetic dataset into a throwaway test database and '
+            'measures the store API hot paths')
+
+    def add_arguments(self, parser):
+        for name, default in synthetic.DEFAULT_SIZES.items():
+            parser.add_argument(f'--{name}', type=int, default=default)
+        parser.add_argument('--iterations', type=int, default=200)
+        parser.add_argument('--warmup', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--scenario', action='append', dest='scenarios',
+                            help='run only this scenario (repeatable)')
+        parser.add_argument('--cold-cache', action='store_true',
+                            help='clear the cache before every request')
+        parser.add_argument('--output', help='write JSON results to this file')
+        parser.add_argument('--compare', metavar='BASELINE',
+                            help='JSON results of a previous run to diff against')
+        parser.add_argument('--max-regression', type=float, metavar='PERCENT',
+                            help='fail if p50 latency or query count grows by more than this')
+
+    def handle(self, *args, **options):
+        sizes = {name: options[name] for name in synthetic.DEFAULT_SIZES}
+        baseline = None
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)
+
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False)
+        try:
+            self.stdout.write(f'Seeding {sizes}...')
+            dataset = synthetic.generate(sizes, options['seed'])
+            results = benchmarks.run_benchmarks(
+                dataset, options['iterations'], options['warmup'],
+                options['seed'], options['scenarios'], options['cold_cache'],
+                self.write_result)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = {
+            'commit': self.get_commit(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'sizes': sizes,
+            'iterations': options['iterations'],
+            'warmup': options['warmup'],
+            'seed': options['seed'],
+            'cold_cache': options['cold_cache'],
+            'results': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f'Results written to {options["output"]}')
+
+        if baseline is not None:
+            self.compare(baseline, results, options['max_regression'])
+
+    def write_result(self, name, result):
+        self.stdout.write(
+            f'{name:<24} {result["throughput_rps"]:>9} req/s  '
+            f'p50 {result["p50_ms"]:>8} ms  p99 {result["p99_ms"]:>8} ms  '
+            f'queries {result["queries_mean"]:>6}  errors {result["errors"]}')
+
+    def compare(self, baseline, results, max_regression):
+        regressions = []
+        self.stdout.write(f'Compared to {baseline.get("commit") or "baseline"}:')
+        for name, metric, before, after, change in benchmarks.compare(
+                baseline.get('results', {}), results):
+            self.stdout.write(
+                f'  {name:<24} {metric:<15} {before:>9} -> {after:<9} ({change:+.1f}%)')
+            if (max_regression is not None
+                    and metric in ('p50_ms', 'queries_mean')
+                    and change > max_regression):
+                regressions.append(f'{name} {metric} {change:+.1f}%')
+        if regressions:
+            raise CommandError('Regressions: ' + ', '.join(regressions))
+
+    def get_commit(self):
+        try:
+            return subprocess.check_output(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                stderr=subprocess.DEVNULL, text=True).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
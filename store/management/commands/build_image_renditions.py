@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from store import jobs, tasks
+from store.models import ProductImage
+
+
+class Command(BaseCommand):
+    help = ('Queues rendition jobs for product images that have none yet '
+            '(or for every image with --all); run_jobs generates them')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help='regenerate existing renditions too')
+
+    def handle(self, *args, **options):
+        images = ProductImage.objects.exclude(image='').exclude(image=None)
+        if not options['all']:
+            images = images.filter(renditions={})
+        with transaction.atomic():
+            queued = 0
+            for image_id in images.values_list('pk', flat=True).iterator():
+                jobs.enqueue(tasks.generate_image_renditions, image_id=image_id)
+                queued += 1
+        self.stdout.write(self.style.SUCCESS(
+            f'Queued renditions for {queued} images.'))
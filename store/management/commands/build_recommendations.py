@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from store import recommendations
+
+
+class Command(BaseCommand):
+    help = ('Folds orders placed since the last run into the "frequently bought '
+            'together" counts and collection bestsellers; run it periodically')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='orders read per transaction')
+        parser.add_argument('--reset', action='store_true',
+                            help='drop the counts and recompute them from every order')
+
+    def handle(self, *args, **options):
+        def progress(processed):
+            self.stdout.write(f'Processed {processed} orders...')
+
+        if options['reset']:
+            recommendations.reset()
+        processed = recommendations.update(options['batch_size'], progress)
+        self.stdout.write(self.style.SUCCESS(
+            f'Recommendations updated from {processed} orders.'))
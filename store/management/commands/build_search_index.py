@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from store import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the product search index from scratch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        def progress(indexed):
+            self.stdout.write(f'Indexed {indexed} products...')
+
+        with transaction.atomic():
+            indexed = search.rebuild_index(options['chunk_size'], progress)
+        self.stdout.write(self.style.SUCCESS(
+            f'Search index rebuilt for {indexed} products.'))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from store import query_plans
+
+
+class Command(BaseCommand):
+    help = ('Runs EXPLAIN over the representative query of each store '
+            'endpoint and flags full table scans')
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', metavar='name',
+                            help=f'plans to check: {", ".join(query_plans.PLANS)}')
+        parser.add_argument('--check', action='store_true',
+                            help='exit with an error if any plan scans a table')
+
+    def handle(self, *args, **options):
+        unknown = set(options['names']) - set(query_plans.PLANS)
+        if unknown:
+            raise CommandError(f'Unknown plans: {", ".join(sorted(unknown))}')
+
+        flagged = []
+        for name, output, scans in query_plans.check(options['names']):
+            if scans:
+                flagged.append(name)
+                self.stdout.write(self.style.WARNING(
+                    f'{name}: full scan of {", ".join(scans)}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'{name}: ok'))
+            if options['verbosity'] > 1 or scans:
+                self.stdout.write('  ' + output.replace('\n', '\n  '))
+
+        if flagged and options['check']:
+            raise CommandError(f'Full table scans in: {", ".join(flagged)}')
@@ -0,0 +1,47 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ParseError
+
+from store import importer
+from store.parsers import CSVParser, NDJSONParser
+
+PARSERS = {'csv': CSVParser, 'ndjson': NDJSONParser}
+
+
+class Command(BaseCommand):
+    help = 'Creates or updates products from a CSV or NDJSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument(
+            '--format', choices=sorted(PARSERS),
+            help='file format (guessed from the extension by default)')
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true',
+                            help='validate the file without writing anything')
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or \
+            os.path.splitext(options['path'])[1].lstrip('.').lower()
+        if file_format not in PARSERS:
+            raise CommandError(
+                f'Unknown format "{file_format}", pass --format csv or ndjson.')
+
+        def progress(processed):
+            self.stdout.write(f'Processed {processed} rows...')
+
+        with open(options['path'], 'rb') as f:
+            rows = PARSERS[file_format]().parse(f)
+            try:
+                result = importer.import_products(
+                    rows, options['chunk_size'], options['dry_run'], progress)
+            except ParseError as exc:
+                raise CommandError(exc.detail)
+
+        for error in result.errors:
+            self.stderr.write(f'Row {error["row"]}: {error["errors"]}')
+        style = self.style.WARNING if result.errors else self.style.SUCCESS
+        self.stdout.write(style(
+            f'{result.created} created, {result.updated} updated, '
+            f'{result.unchanged} unchanged, {len(result.errors)} rejected.'))
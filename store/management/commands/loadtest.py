@@ -0,0 +1,78 @@
+import json
+import random
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import (override_settings, setup_test_environment,
+                               teardown_test_environment)
+
+from store import benchmarks, synthetic
+
+MODES = {
+    'threads': (False, benchmarks.run_threaded_load),
+    'async': (True, benchmarks.run_async_load),
+}
+
+
+class Command(BaseCommand):
+    help = ('Seeds a synthetic dataset into a throwaway test database and '
+            'compares concurrent catalog and cart reads served by the sync '
+            'views from threads against the async views on an event loop')
+
+    def add_arguments(self, parser):
+        for name, default in synthetic.DEFAULT_SIZES.items():
+            parser.add_argument(f'--{name}', type=int, default=default)
+        parser.add_argument('--requests', type=int, default=2000)
+        parser.add_argument('--concurrency', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=200)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--mode', action='append', dest='modes',
+                            choices=sorted(MODES),
+                            help='run only this mode (repeatable)')
+        parser.add_argument('--output', help='write JSON results to this file')
+
+    def handle(self, *args, **options):
+        sizes = {name: options[name] for name in synthetic.DEFAULT_SIZES}
+        modes = options['modes'] or list(MODES)
+
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False)
+        try:
+            self.stdout.write(f'Seeding {sizes}...')
+            dataset = synthetic.generate(sizes, options['seed'])
+            results = {}
+            for mode in modes:
+                results[mode] = self.run_mode(mode, dataset, options)
+                self.write_result(mode, results[mode])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({'sizes': sizes, 'requests': options['requests'],
+                           'concurrency': options['concurrency'],
+                           'seed': options['seed'], 'results': results},
+                          f, indent=2)
+            self.stdout.write(f'Results written to {options["output"]}')
+
+    def run_mode(self, mode, dataset, options):
+        async_reads, run = MODES[mode]
+        # Both modes replay the same requests against a cold response cache.
+        rng = random.Random(options['seed'])
+        warmup = benchmarks.build_load_paths(dataset, rng, options['warmup'])
+        paths = benchmarks.build_load_paths(dataset, rng, options['requests'])
+        cache.clear()
+        with override_settings(ROOT_URLCONF=benchmarks.get_urlconf(async_reads)):
+            if warmup:
+                run(warmup, options['concurrency'])
+            return run(paths, options['concurrency'])
+
+    def write_result(self, mode, result):
+        self.stdout.write(
+            f'{mode:<8} {result["throughput_rps"]:>9} req/s  '
+            f'p50 {result["p50_ms"]:>8} ms  p99 {result["p99_ms"]:>8} ms  '
+            f'errors {result["errors"]}')
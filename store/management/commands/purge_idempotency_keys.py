@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from store import idempotency
+
+
+class Command(BaseCommand):
+    help = 'Deletes stored Idempotency-Key responses older than their TTL'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than', type=float, metavar='HOURS',
+            help='override STORE_IDEMPOTENCY_KEY_TTL')
+
+    def handle(self, *args, **options):
+        ttl = idempotency.KEY_TTL
+        if options['older_than'] is not None:
+            ttl = timedelta(hours=options['older_than'])
+        deleted = idempotency.purge_expired(ttl)
+        self.stdout.write(self.style.SUCCESS(
+            f'Purged {deleted} idempotency keys.'))
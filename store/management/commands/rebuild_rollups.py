@@ -0,0 +1,21 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from store import rollups
+
+
+class Command(BaseCommand):
+    help = ('Recomputes the daily sales rollups behind /api/reports/ from the '
+            'orders, e.g. to backfill them or repair drift')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', type=date.fromisoformat,
+                            help='first day (YYYY-MM-DD) to recompute; all by default')
+
+    def handle(self, *args, **options):
+        rollups.rebuild(since=options['since'])
+        since = options['since']
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt sales rollups since {since}.' if since
+            else 'Rebuilt all sales rollups.'))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from store import cache
+from store.models import Collection
+
+
+class Command(BaseCommand):
+    help = 'Repairs drift in the stored Collection.product_count counters'
+
+    def handle(self, *args, **options):
+        drifted = Collection.objects.reconcile_product_count()
+        if drifted:
+            cache.bump_products([], drifted)
+            self.stdout.write(self.style.WARNING(
+                f'Repaired product_count of collections: {", ".join(map(str, drifted))}'))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                'All collection product counts are in sync.'))
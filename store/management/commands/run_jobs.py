@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from store import jobs
+
+
+class Command(BaseCommand):
+    help = ('Runs queued background jobs (emails, image renditions and other '
+            'side effects), retrying failures with backoff')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='exit once no job is due instead of polling')
+        parser.add_argument('--workers', type=int, default=1,
+                            help='worker threads claiming jobs concurrently')
+        parser.add_argument('--batch-size', type=int, default=10)
+        parser.add_argument('--sleep', type=float, default=1.0,
+                            help='seconds to wait when the queue is empty')
+
+    def handle(self, *args, **options):
+        stop = Event()
+        if options['workers'] == 1:
+            return self.work(stop, options)
+        # Jobs are leased when claimed, so workers never run the same one.
+        with ThreadPoolExecutor(options['workers']) as pool:
+            futures = [pool.submit(self.work_in_thread, stop, options)
+                       for _ in range(options['workers'])]
+            try:
+                for future in futures:
+                    future.result()
+            except KeyboardInterrupt:
+                stop.set()
+
+    def work(self, stop, options):
+        try:
+            while not stop.is_set():
+                close_old_connections()
+                succeeded, failed = jobs.run_pending(options['batch_size'])
+                if succeeded or failed:
+                    self.stdout.write(f'Ran {succeeded + failed} jobs, {failed} failed')
+                    continue
+                if options['once']:
+                    return
+                stop.wait(options['sleep'])
+        except KeyboardInterrupt:
+            pass
+
+    def work_in_thread(self, stop, options):
+        try:
+            self.work(stop, options)
+        finally:
+            connection.close()
@@ -1,16 +1,16 @@
 insert into
-  store_collection (id, title, featured_product_id)
+  store_collection (id, title, featured_product_id, product_count)
 values
-  (1, 'Flowers', null),
-  (2, 'Grocery', null),
-  (3, 'Beauty', null),
-  (4, 'Cleaning', null),
-  (5, 'Stationary', null),
-  (6, 'Pets', null),
-  (7, 'Baking', null),
-  (8, 'Spices', null),
-  (9, 'Toys', null),
-  (10, 'Magazines', null);
+  (1, 'Flowers', null, 0),
+  (2, 'Grocery', null, 0),
+  (3, 'Beauty', null, 0),
+  (4, 'Cleaning', null, 0),
+  (5, 'Stationary', null, 0),
+  (6, 'Pets', null, 0),
+  (7, 'Baking', null, 0),
+  (8, 'Spices', null, 0),
+  (9, 'Toys', null, 0),
+  (10, 'Magazines', null, 0);
 
 insert into
   store_product (
@@ -21,7 +21,15 @@ insert into
     inventory,
     last_update,
     collection_id,
-    slug
+    slug,
+    rating_count,
+    rating_sum,
+    rating_average,
+    rating_1,
+    rating_2,
+    rating_3,
+    rating_4,
+    rating_5
   )
 values
   (
@@ -32,7 +40,15 @@ values
     11,
     '2020-09-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     2,
@@ -42,7 +58,15 @@ values
     40,
     '2020-07-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     3,
@@ -52,7 +76,15 @@ values
     29,
     '2021-04-05 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     4,
@@ -62,7 +94,15 @@ values
     40,
     '2020-07-20 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     5,
@@ -72,7 +112,15 @@ values
     56,
     '2020-08-18 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     6,
@@ -82,7 +130,15 @@ values
     18,
     '2020-10-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     7,
@@ -92,7 +148,15 @@ values
     48,
     '2020-08-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     8,
@@ -102,7 +166,15 @@ values
     55,
     '2021-06-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     9,
@@ -112,7 +184,15 @@ values
     45,
     '2021-03-03 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     10,
@@ -122,7 +202,15 @@ values
     69,
     '2021-04-18 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     11,
@@ -132,7 +220,15 @@ values
     71,
     '2021-01-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     12,
@@ -142,7 +238,15 @@ values
     55,
     '2020-12-28 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     13,
@@ -152,7 +256,15 @@ values
     41,
     '2020-07-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     14,
@@ -162,7 +274,15 @@ values
     24,
     '2020-08-29 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     15,
@@ -172,7 +292,15 @@ values
     35,
     '2020-07-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     16,
@@ -182,7 +310,15 @@ values
     63,
     '2020-07-16 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     17,
@@ -192,7 +328,15 @@ values
     60,
     '2021-03-05 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     18,
@@ -202,7 +346,15 @@ values
     85,
     '2020-07-26 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     19,
@@ -212,7 +364,15 @@ values
     10,
     '2021-05-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     20,
@@ -222,7 +382,15 @@ values
     97,
     '2020-08-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     21,
@@ -232,7 +400,15 @@ values
     49,
     '2021-01-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     22,
@@ -242,7 +418,15 @@ values
     56,
     '2020-11-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     23,
@@ -252,7 +436,15 @@ values
     63,
     '2021-01-22 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     24,
@@ -262,7 +454,15 @@ values
     64,
     '2020-10-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     25,
@@ -272,7 +472,15 @@ values
     96,
     '2021-05-05 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     26,
@@ -282,7 +490,15 @@ values
     0,
     '2021-03-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     27,
@@ -292,7 +508,15 @@ values
     84,
     '2020-10-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     28,
@@ -302,7 +526,15 @@ values
     90,
     '2021-02-11 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     29,
@@ -312,7 +544,15 @@ values
     82,
     '2021-02-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     30,
@@ -322,7 +562,15 @@ values
     66,
     '2021-03-01 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     31,
@@ -332,7 +580,15 @@ values
     79,
     '2021-05-26 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     32,
@@ -342,7 +598,15 @@ values
     83,
     '2021-06-03 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     33,
@@ -352,7 +616,15 @@ values
     8,
     '2021-03-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     34,
@@ -362,7 +634,15 @@ values
     45,
     '2020-08-23 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     35,
@@ -372,7 +652,15 @@ values
     76,
     '2020-10-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     36,
@@ -382,7 +670,15 @@ values
     2,
     '2021-06-07 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     37,
@@ -392,7 +688,15 @@ values
     12,
     '2020-11-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     38,
@@ -402,7 +706,15 @@ values
     98,
     '2021-04-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     39,
@@ -412,7 +724,15 @@ values
     61,
     '2020-09-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     40,
@@ -422,7 +742,15 @@ values
     8,
     '2021-04-07 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     41,
@@ -432,7 +760,15 @@ values
     54,
     '2020-12-22 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     42,
@@ -442,7 +778,15 @@ values
     52,
     '2020-08-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     43,
@@ -452,7 +796,15 @@ values
     38,
     '2021-05-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     44,
@@ -462,7 +814,15 @@ values
     88,
     '2021-02-10 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     45,
@@ -472,7 +832,15 @@ values
     93,
     '2020-09-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     46,
@@ -482,7 +850,15 @@ values
     92,
     '2020-07-14 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     47,
@@ -492,7 +868,15 @@ values
     15,
     '2021-04-28 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     48,
@@ -502,7 +886,15 @@ values
     94,
     '2021-06-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     49,
@@ -512,7 +904,15 @@ values
     16,
     '2020-07-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     50,
@@ -522,7 +922,15 @@ values
     14,
     '2020-06-11 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     51,
@@ -532,7 +940,15 @@ values
     94,
     '2021-05-05 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     52,
@@ -542,7 +958,15 @@ values
     44,
     '2020-06-14 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     53,
@@ -552,7 +976,15 @@ values
     58,
     '2021-01-19 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     54,
@@ -562,7 +994,15 @@ values
     93,
     '2021-04-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     55,
@@ -572,7 +1012,15 @@ values
     43,
     '2020-09-06 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     56,
@@ -582,7 +1030,15 @@ values
     60,
     '2021-05-09 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     57,
@@ -592,7 +1048,15 @@ values
     5,
     '2021-01-01 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     58,
@@ -602,7 +1066,15 @@ values
     11,
     '2021-04-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     59,
@@ -612,7 +1084,15 @@ values
     13,
     '2020-08-14 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     60,
@@ -622,7 +1102,15 @@ values
     100,
     '2020-07-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     61,
@@ -632,7 +1120,15 @@ values
     43,
     '2020-09-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     62,
@@ -642,7 +1138,15 @@ values
     34,
     '2020-10-14 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     63,
@@ -652,7 +1156,15 @@ values
     34,
     '2020-09-22 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     64,
@@ -662,7 +1174,15 @@ values
     32,
     '2021-02-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     65,
@@ -672,7 +1192,15 @@ values
     12,
     '2021-03-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     66,
@@ -682,7 +1210,15 @@ values
     31,
     '2020-06-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     67,
@@ -692,7 +1228,15 @@ values
     33,
     '2021-01-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     68,
@@ -702,7 +1246,15 @@ values
     7,
     '2021-04-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     69,
@@ -712,7 +1264,15 @@ values
     6,
     '2021-02-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     70,
@@ -722,7 +1282,15 @@ values
     15,
     '2020-12-10 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     71,
@@ -732,7 +1300,15 @@ values
     25,
     '2020-08-19 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     72,
@@ -742,7 +1318,15 @@ values
     43,
     '2020-10-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     73,
@@ -752,7 +1336,15 @@ values
     50,
     '2020-11-02 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     74,
@@ -762,7 +1354,15 @@ values
     72,
     '2021-04-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     75,
@@ -772,7 +1372,15 @@ values
     53,
     '2020-10-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     76,
@@ -782,7 +1390,15 @@ values
     72,
     '2020-12-08 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     77,
@@ -792,7 +1408,15 @@ values
     93,
     '2020-07-06 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     78,
@@ -802,7 +1426,15 @@ values
     39,
     '2020-08-29 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     79,
@@ -812,7 +1444,15 @@ values
     24,
     '2021-05-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     80,
@@ -822,7 +1462,15 @@ values
     70,
     '2020-07-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     81,
@@ -832,7 +1480,15 @@ values
     29,
     '2020-12-15 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     82,
@@ -842,7 +1498,15 @@ values
     67,
     '2020-10-25 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     83,
@@ -852,7 +1516,15 @@ values
     17,
     '2020-07-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     84,
@@ -862,7 +1534,15 @@ values
     11,
     '2020-12-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     85,
@@ -872,7 +1552,15 @@ values
     58,
     '2021-06-07 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     86,
@@ -882,7 +1570,15 @@ values
     88,
     '2021-05-04 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     87,
@@ -892,7 +1588,15 @@ values
     52,
     '2020-10-10 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     88,
@@ -902,7 +1606,15 @@ values
     59,
     '2020-06-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     89,
@@ -912,7 +1624,15 @@ values
     92,
     '2020-10-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     90,
@@ -922,7 +1642,15 @@ values
     48,
     '2020-12-28 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     91,
@@ -932,7 +1660,15 @@ values
     32,
     '2021-05-15 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     92,
@@ -942,7 +1678,15 @@ values
     26,
     '2020-07-16 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     93,
@@ -952,7 +1696,15 @@ values
     87,
     '2020-12-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     94,
@@ -962,7 +1714,15 @@ values
     71,
     '2020-07-16 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     95,
@@ -972,7 +1732,15 @@ values
     15,
     '2020-06-21 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     96,
@@ -982,7 +1750,15 @@ values
     2,
     '2020-10-19 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     97,
@@ -992,7 +1768,15 @@ values
     31,
     '2021-02-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     98,
@@ -1002,7 +1786,15 @@ values
     38,
     '2020-08-11 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     99,
@@ -1012,7 +1804,15 @@ values
     96,
     '2021-03-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     100,
@@ -1022,7 +1822,15 @@ values
     40,
     '2021-02-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     101,
@@ -1032,7 +1840,15 @@ values
     32,
     '2020-06-27 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     102,
@@ -1042,7 +1858,15 @@ values
     66,
     '2021-03-02 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     103,
@@ -1052,7 +1876,15 @@ values
     77,
     '2020-07-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     104,
@@ -1062,7 +1894,15 @@ values
     62,
     '2020-09-03 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     105,
@@ -1072,7 +1912,15 @@ values
     24,
     '2020-06-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     106,
@@ -1082,7 +1930,15 @@ values
     22,
     '2020-07-30 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     107,
@@ -1092,7 +1948,15 @@ values
     10,
     '2021-04-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     108,
@@ -1102,7 +1966,15 @@ values
     13,
     '2020-10-23 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     109,
@@ -1112,7 +1984,15 @@ values
     95,
     '2021-01-08 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     110,
@@ -1122,7 +2002,15 @@ values
     7,
     '2021-04-06 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     111,
@@ -1132,7 +2020,15 @@ values
     94,
     '2021-04-14 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     112,
@@ -1142,7 +2038,15 @@ values
     59,
     '2021-02-26 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     113,
@@ -1152,7 +2056,15 @@ values
     80,
     '2020-08-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     114,
@@ -1162,7 +2074,15 @@ values
     66,
     '2020-08-06 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     115,
@@ -1172,7 +2092,15 @@ values
     45,
     '2021-02-03 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     116,
@@ -1182,7 +2110,15 @@ values
     59,
     '2020-12-29 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     117,
@@ -1192,7 +2128,15 @@ values
     97,
     '2020-11-25 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     118,
@@ -1202,7 +2146,15 @@ values
     3,
     '2021-04-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     119,
@@ -1212,7 +2164,15 @@ values
     79,
     '2020-11-03 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     120,
@@ -1222,7 +2182,15 @@ values
     44,
     '2020-06-22 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     121,
@@ -1232,7 +2200,15 @@ values
     84,
     '2021-01-11 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     122,
@@ -1242,7 +2218,15 @@ values
     96,
     '2020-09-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     123,
@@ -1252,7 +2236,15 @@ values
     55,
     '2021-04-24 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     124,
@@ -1262,7 +2254,15 @@ values
     72,
     '2020-11-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     125,
@@ -1272,7 +2272,15 @@ values
     74,
     '2021-03-06 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     126,
@@ -1282,7 +2290,15 @@ values
     5,
     '2021-01-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     127,
@@ -1292,7 +2308,15 @@ values
     45,
     '2021-01-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     128,
@@ -1302,7 +2326,15 @@ values
     74,
     '2021-04-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     129,
@@ -1312,7 +2344,15 @@ values
     42,
     '2021-01-30 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     130,
@@ -1322,7 +2362,15 @@ values
     27,
     '2020-07-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     131,
@@ -1332,7 +2380,15 @@ values
     26,
     '2021-05-13 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     132,
@@ -1342,7 +2398,15 @@ values
     79,
     '2020-09-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     133,
@@ -1352,7 +2416,15 @@ values
     15,
     '2021-01-08 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     134,
@@ -1362,7 +2434,15 @@ values
     94,
     '2020-08-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     135,
@@ -1372,7 +2452,15 @@ values
     17,
     '2021-05-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     136,
@@ -1382,7 +2470,15 @@ values
     71,
     '2021-03-22 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     137,
@@ -1392,7 +2488,15 @@ values
     46,
     '2020-07-03 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     138,
@@ -1402,7 +2506,15 @@ values
     58,
     '2020-12-29 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     139,
@@ -1412,7 +2524,15 @@ values
     31,
     '2020-06-21 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     140,
@@ -1422,7 +2542,15 @@ values
     35,
     '2021-01-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     141,
@@ -1432,7 +2560,15 @@ values
     98,
     '2021-02-08 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     142,
@@ -1442,7 +2578,15 @@ values
     97,
     '2020-08-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     143,
@@ -1452,7 +2596,15 @@ values
     18,
     '2021-01-03 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     144,
@@ -1462,7 +2614,15 @@ values
     50,
     '2021-04-14 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     145,
@@ -1472,7 +2632,15 @@ values
     31,
     '2020-09-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     146,
@@ -1482,7 +2650,15 @@ values
     65,
     '2020-11-27 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     147,
@@ -1492,7 +2668,15 @@ values
     71,
     '2020-07-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     148,
@@ -1502,7 +2686,15 @@ values
     49,
     '2020-10-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     149,
@@ -1512,7 +2704,15 @@ values
     92,
     '2020-08-21 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     150,
@@ -1522,7 +2722,15 @@ values
     10,
     '2020-09-16 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     151,
@@ -1532,7 +2740,15 @@ values
     27,
     '2021-04-19 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     152,
@@ -1542,7 +2758,15 @@ values
     15,
     '2020-07-17 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     153,
@@ -1552,7 +2776,15 @@ values
     69,
     '2021-06-07 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     154,
@@ -1562,7 +2794,15 @@ values
     41,
     '2020-07-31 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     155,
@@ -1572,7 +2812,15 @@ values
     56,
     '2020-09-05 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     156,
@@ -1582,7 +2830,15 @@ values
     86,
     '2020-08-18 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     157,
@@ -1592,7 +2848,15 @@ values
     29,
     '2020-09-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     158,
@@ -1602,7 +2866,15 @@ values
     28,
     '2021-02-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     159,
@@ -1612,7 +2884,15 @@ values
     7,
     '2020-10-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     160,
@@ -1622,7 +2902,15 @@ values
     91,
     '2021-01-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     161,
@@ -1632,7 +2920,15 @@ values
     10,
     '2020-08-10 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     162,
@@ -1642,7 +2938,15 @@ values
     85,
     '2021-05-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     163,
@@ -1652,7 +2956,15 @@ values
     8,
     '2021-04-23 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     164,
@@ -1662,7 +2974,15 @@ values
     51,
     '2021-06-08 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     165,
@@ -1672,7 +2992,15 @@ values
     64,
     '2021-01-18 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     166,
@@ -1682,7 +3010,15 @@ values
     100,
     '2020-09-27 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     167,
@@ -1692,7 +3028,15 @@ values
     64,
     '2021-03-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     168,
@@ -1702,7 +3046,15 @@ values
     45,
     '2020-11-28 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     169,
@@ -1712,7 +3064,15 @@ values
     95,
     '2020-11-09 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     170,
@@ -1722,7 +3082,15 @@ values
     39,
     '2020-06-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     171,
@@ -1732,7 +3100,15 @@ values
     9,
     '2021-03-07 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     172,
@@ -1742,7 +3118,15 @@ values
     87,
     '2021-02-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     173,
@@ -1752,7 +3136,15 @@ values
     52,
     '2020-07-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     174,
@@ -1762,7 +3154,15 @@ values
     78,
     '2021-05-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     175,
@@ -1772,7 +3172,15 @@ values
     3,
     '2021-05-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     176,
@@ -1782,7 +3190,15 @@ values
     34,
     '2020-08-03 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     177,
@@ -1792,7 +3208,15 @@ values
     4,
     '2020-07-23 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     178,
@@ -1802,7 +3226,15 @@ values
     94,
     '2021-04-14 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     179,
@@ -1812,7 +3244,15 @@ values
     20,
     '2021-05-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     180,
@@ -1822,7 +3262,15 @@ values
     92,
     '2021-03-14 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     181,
@@ -1832,7 +3280,15 @@ values
     69,
     '2020-12-29 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     182,
@@ -1842,7 +3298,15 @@ values
     65,
     '2021-04-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     183,
@@ -1852,7 +3316,15 @@ values
     68,
     '2021-02-25 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     184,
@@ -1862,7 +3334,15 @@ values
     9,
     '2021-05-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     185,
@@ -1872,7 +3352,15 @@ values
     88,
     '2021-02-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     186,
@@ -1882,7 +3370,15 @@ values
     67,
     '2021-02-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     187,
@@ -1892,7 +3388,15 @@ values
     76,
     '2021-01-01 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     188,
@@ -1902,7 +3406,15 @@ values
     1,
     '2020-11-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     189,
@@ -1912,7 +3424,15 @@ values
     24,
     '2020-11-01 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     190,
@@ -1922,7 +3442,15 @@ values
     6,
     '2021-02-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     191,
@@ -1932,7 +3460,15 @@ values
     18,
     '2020-12-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     192,
@@ -1942,7 +3478,15 @@ values
     72,
     '2020-10-04 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     193,
@@ -1952,7 +3496,15 @@ values
     51,
     '2021-05-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     194,
@@ -1962,7 +3514,15 @@ values
     51,
     '2020-11-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     195,
@@ -1972,7 +3532,15 @@ values
     43,
     '2020-07-18 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     196,
@@ -1982,7 +3550,15 @@ values
     2,
     '2020-08-07 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     197,
@@ -1992,7 +3568,15 @@ values
     93,
     '2021-06-07 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     198,
@@ -2002,7 +3586,15 @@ values
     11,
     '2021-06-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     199,
@@ -2012,7 +3604,15 @@ values
     79,
     '2021-04-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     200,
@@ -2022,7 +3622,15 @@ values
     86,
     '2021-02-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     201,
@@ -2032,7 +3640,15 @@ values
     98,
     '2021-03-05 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     202,
@@ -2042,7 +3658,15 @@ values
     20,
     '2021-01-31 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     203,
@@ -2052,7 +3676,15 @@ values
     77,
     '2020-08-02 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     204,
@@ -2062,7 +3694,15 @@ values
     71,
     '2020-08-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     205,
@@ -2072,7 +3712,15 @@ values
     38,
     '2021-01-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     206,
@@ -2082,7 +3730,15 @@ values
     87,
     '2020-11-21 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     207,
@@ -2092,7 +3748,15 @@ values
     78,
     '2021-06-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     208,
@@ -2102,7 +3766,15 @@ values
     77,
     '2020-11-08 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     209,
@@ -2112,7 +3784,15 @@ values
     9,
     '2021-05-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     210,
@@ -2122,7 +3802,15 @@ values
     6,
     '2021-04-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     211,
@@ -2132,7 +3820,15 @@ values
     95,
     '2020-09-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     212,
@@ -2142,7 +3838,15 @@ values
     80,
     '2020-09-11 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     213,
@@ -2152,7 +3856,15 @@ values
     23,
     '2020-07-19 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     214,
@@ -2162,7 +3874,15 @@ values
     10,
     '2021-03-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     215,
@@ -2172,7 +3892,15 @@ values
     54,
     '2020-09-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     216,
@@ -2182,7 +3910,15 @@ values
     25,
     '2020-10-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     217,
@@ -2192,7 +3928,15 @@ values
     52,
     '2020-12-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     218,
@@ -2202,7 +3946,15 @@ values
     34,
     '2021-04-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     219,
@@ -2212,7 +3964,15 @@ values
     41,
     '2020-10-28 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     220,
@@ -2222,7 +3982,15 @@ values
     30,
     '2020-09-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     221,
@@ -2232,7 +4000,15 @@ values
     33,
     '2021-03-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     222,
@@ -2242,7 +4018,15 @@ values
     46,
     '2020-11-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     223,
@@ -2252,7 +4036,15 @@ values
     30,
     '2021-04-14 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     224,
@@ -2262,7 +4054,15 @@ values
     46,
     '2021-05-24 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     225,
@@ -2272,7 +4072,15 @@ values
     54,
     '2021-03-19 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     226,
@@ -2282,7 +4090,15 @@ values
     26,
     '2021-05-15 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     227,
@@ -2292,7 +4108,15 @@ values
     40,
     '2020-10-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     228,
@@ -2302,7 +4126,15 @@ values
     45,
     '2021-02-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     229,
@@ -2312,7 +4144,15 @@ values
     95,
     '2021-04-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     230,
@@ -2322,7 +4162,15 @@ values
     49,
     '2021-05-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     231,
@@ -2332,7 +4180,15 @@ values
     67,
     '2021-01-14 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     232,
@@ -2342,7 +4198,15 @@ values
     50,
     '2020-11-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     233,
@@ -2352,7 +4216,15 @@ values
     97,
     '2021-04-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     234,
@@ -2362,7 +4234,15 @@ values
     54,
     '2021-02-01 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     235,
@@ -2372,7 +4252,15 @@ values
     74,
     '2020-11-28 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     236,
@@ -2382,7 +4270,15 @@ values
     13,
     '2020-10-22 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     237,
@@ -2392,7 +4288,15 @@ values
     22,
     '2020-12-24 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     238,
@@ -2402,7 +4306,15 @@ values
     98,
     '2020-08-11 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     239,
@@ -2412,7 +4324,15 @@ values
     48,
     '2020-07-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     240,
@@ -2422,7 +4342,15 @@ values
     94,
     '2021-03-30 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     241,
@@ -2432,7 +4360,15 @@ values
     96,
     '2020-09-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     242,
@@ -2442,7 +4378,15 @@ values
     69,
     '2020-11-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     243,
@@ -2452,7 +4396,15 @@ values
     73,
     '2021-05-16 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     244,
@@ -2462,7 +4414,15 @@ values
     92,
     '2020-08-28 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     245,
@@ -2472,7 +4432,15 @@ values
     71,
     '2021-04-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     246,
@@ -2482,7 +4450,15 @@ values
     65,
     '2021-02-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     247,
@@ -2492,7 +4468,15 @@ values
     97,
     '2020-11-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     248,
@@ -2502,7 +4486,15 @@ values
     78,
     '2021-02-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     249,
@@ -2512,7 +4504,15 @@ values
     54,
     '2021-02-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     250,
@@ -2522,7 +4522,15 @@ values
     7,
     '2020-10-22 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     251,
@@ -2532,7 +4540,15 @@ values
     5,
     '2021-04-01 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     252,
@@ -2542,7 +4558,15 @@ values
     85,
     '2020-06-10 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     253,
@@ -2552,7 +4576,15 @@ values
     0,
     '2021-02-08 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     254,
@@ -2562,7 +4594,15 @@ values
     87,
     '2021-01-22 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     255,
@@ -2572,7 +4612,15 @@ values
     93,
     '2020-12-29 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     256,
@@ -2582,7 +4630,15 @@ values
     44,
     '2020-10-09 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     257,
@@ -2592,7 +4648,15 @@ values
     84,
     '2021-01-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     258,
@@ -2602,7 +4666,15 @@ values
     2,
     '2021-02-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     259,
@@ -2612,7 +4684,15 @@ values
     15,
     '2021-04-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     260,
@@ -2622,7 +4702,15 @@ values
     88,
     '2021-05-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     261,
@@ -2632,7 +4720,15 @@ values
     48,
     '2020-07-07 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     262,
@@ -2642,7 +4738,15 @@ values
     99,
     '2020-07-16 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     263,
@@ -2652,7 +4756,15 @@ values
     27,
     '2021-01-20 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     264,
@@ -2662,7 +4774,15 @@ values
     100,
     '2021-05-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     265,
@@ -2672,7 +4792,15 @@ values
     86,
     '2021-03-03 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     266,
@@ -2682,7 +4810,15 @@ values
     5,
     '2021-05-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     267,
@@ -2692,7 +4828,15 @@ values
     26,
     '2020-12-21 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     268,
@@ -2702,7 +4846,15 @@ values
     86,
     '2021-04-16 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     269,
@@ -2712,7 +4864,15 @@ values
     59,
     '2020-08-07 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     270,
@@ -2722,7 +4882,15 @@ values
     56,
     '2020-12-07 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     271,
@@ -2732,7 +4900,15 @@ values
     84,
     '2021-05-01 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     272,
@@ -2742,7 +4918,15 @@ values
     81,
     '2020-11-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     273,
@@ -2752,7 +4936,15 @@ values
     92,
     '2021-03-29 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     274,
@@ -2762,7 +4954,15 @@ values
     80,
     '2020-10-10 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     275,
@@ -2772,7 +4972,15 @@ values
     50,
     '2021-05-23 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     276,
@@ -2782,7 +4990,15 @@ values
     93,
     '2021-05-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     277,
@@ -2792,7 +5008,15 @@ values
     70,
     '2020-12-29 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     278,
@@ -2802,7 +5026,15 @@ values
     16,
     '2020-08-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     279,
@@ -2812,7 +5044,15 @@ values
     87,
     '2020-06-28 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     280,
@@ -2822,7 +5062,15 @@ values
     24,
     '2021-05-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     281,
@@ -2832,7 +5080,15 @@ values
     34,
     '2020-08-29 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     282,
@@ -2842,7 +5098,15 @@ values
     63,
     '2021-05-17 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     283,
@@ -2852,7 +5116,15 @@ values
     81,
     '2021-01-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     284,
@@ -2862,7 +5134,15 @@ values
     67,
     '2020-10-19 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     285,
@@ -2872,7 +5152,15 @@ values
     25,
     '2020-11-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     286,
@@ -2882,7 +5170,15 @@ values
     13,
     '2020-12-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     287,
@@ -2892,7 +5188,15 @@ values
     38,
     '2021-01-11 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     288,
@@ -2902,7 +5206,15 @@ values
     71,
     '2021-04-05 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     289,
@@ -2912,7 +5224,15 @@ values
     8,
     '2021-02-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     290,
@@ -2922,7 +5242,15 @@ values
     68,
     '2020-12-13 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     291,
@@ -2932,7 +5260,15 @@ values
     95,
     '2020-08-11 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     292,
@@ -2942,7 +5278,15 @@ values
     91,
     '2021-05-30 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     293,
@@ -2952,7 +5296,15 @@ values
     82,
     '2021-01-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     294,
@@ -2962,7 +5314,15 @@ values
     48,
     '2020-08-15 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     295,
@@ -2972,7 +5332,15 @@ values
     16,
     '2020-06-12 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     296,
@@ -2982,7 +5350,15 @@ values
     28,
     '2020-12-03 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     297,
@@ -2992,7 +5368,15 @@ values
     80,
     '2021-02-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     298,
@@ -3002,7 +5386,15 @@ values
     86,
     '2021-03-26 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     299,
@@ -3012,7 +5404,15 @@ values
     80,
     '2020-10-30 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     300,
@@ -3022,7 +5422,15 @@ values
     75,
     '2020-11-13 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     301,
@@ -3032,7 +5440,15 @@ values
     95,
     '2020-07-30 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     302,
@@ -3042,7 +5458,15 @@ values
     100,
     '2020-08-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     303,
@@ -3052,7 +5476,15 @@ values
     42,
     '2020-08-22 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     304,
@@ -3062,7 +5494,15 @@ values
     24,
     '2020-12-09 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     305,
@@ -3072,7 +5512,15 @@ values
     20,
     '2021-04-12 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     306,
@@ -3082,7 +5530,15 @@ values
     65,
     '2020-07-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     307,
@@ -3092,7 +5548,15 @@ values
     5,
     '2020-11-04 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     308,
@@ -3102,7 +5566,15 @@ values
     81,
     '2021-05-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     309,
@@ -3112,7 +5584,15 @@ values
     80,
     '2021-04-30 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     310,
@@ -3122,7 +5602,15 @@ values
     87,
     '2020-12-12 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     311,
@@ -3132,7 +5620,15 @@ values
     70,
     '2020-07-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     312,
@@ -3142,7 +5638,15 @@ values
     80,
     '2021-03-02 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     313,
@@ -3152,7 +5656,15 @@ values
     61,
     '2021-02-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     314,
@@ -3162,7 +5674,15 @@ values
     14,
     '2020-12-04 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     315,
@@ -3172,7 +5692,15 @@ values
     10,
     '2020-08-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     316,
@@ -3182,7 +5710,15 @@ values
     48,
     '2021-05-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     317,
@@ -3192,7 +5728,15 @@ values
     67,
     '2020-10-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     318,
@@ -3202,7 +5746,15 @@ values
     88,
     '2021-02-18 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     319,
@@ -3212,7 +5764,15 @@ values
     11,
     '2021-01-30 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     320,
@@ -3222,7 +5782,15 @@ values
     7,
     '2021-02-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     321,
@@ -3232,7 +5800,15 @@ values
     35,
     '2020-09-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     322,
@@ -3242,7 +5818,15 @@ values
     38,
     '2020-08-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     323,
@@ -3252,7 +5836,15 @@ values
     6,
     '2021-02-07 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     324,
@@ -3262,7 +5854,15 @@ values
     62,
     '2021-03-31 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     325,
@@ -3272,7 +5872,15 @@ values
     55,
     '2021-03-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     326,
@@ -3282,7 +5890,15 @@ values
     98,
     '2021-03-17 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     327,
@@ -3292,7 +5908,15 @@ values
     100,
     '2020-08-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     328,
@@ -3302,7 +5926,15 @@ values
     96,
     '2020-09-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     329,
@@ -3312,7 +5944,15 @@ values
     89,
     '2020-10-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     330,
@@ -3322,7 +5962,15 @@ values
     43,
     '2021-05-16 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     331,
@@ -3332,7 +5980,15 @@ values
     95,
     '2020-07-08 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     332,
@@ -3342,7 +5998,15 @@ values
     54,
     '2021-02-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     333,
@@ -3352,7 +6016,15 @@ values
     73,
     '2021-01-27 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     334,
@@ -3362,7 +6034,15 @@ values
     75,
     '2021-05-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     335,
@@ -3372,7 +6052,15 @@ values
     19,
     '2021-02-04 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     336,
@@ -3382,7 +6070,15 @@ values
     46,
     '2020-06-10 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     337,
@@ -3392,7 +6088,15 @@ values
     29,
     '2020-10-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     338,
@@ -3402,7 +6106,15 @@ values
     29,
     '2021-05-23 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     339,
@@ -3412,7 +6124,15 @@ values
     97,
     '2020-06-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     340,
@@ -3422,7 +6142,15 @@ values
     73,
     '2021-02-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     341,
@@ -3432,7 +6160,15 @@ values
     72,
     '2020-10-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     342,
@@ -3442,7 +6178,15 @@ values
     44,
     '2020-08-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     343,
@@ -3452,7 +6196,15 @@ values
     44,
     '2021-03-11 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     344,
@@ -3462,7 +6214,15 @@ values
     9,
     '2020-11-28 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     345,
@@ -3472,7 +6232,15 @@ values
     79,
     '2021-03-01 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     346,
@@ -3482,7 +6250,15 @@ values
     32,
     '2021-01-29 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     347,
@@ -3492,7 +6268,15 @@ values
     84,
     '2020-06-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     348,
@@ -3502,7 +6286,15 @@ values
     64,
     '2020-09-23 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     349,
@@ -3512,7 +6304,15 @@ values
     59,
     '2021-05-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     350,
@@ -3522,7 +6322,15 @@ values
     19,
     '2020-08-27 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     351,
@@ -3532,7 +6340,15 @@ values
     56,
     '2021-05-11 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     352,
@@ -3542,7 +6358,15 @@ values
     71,
     '2021-05-18 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     353,
@@ -3552,7 +6376,15 @@ values
     56,
     '2020-09-25 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     354,
@@ -3562,7 +6394,15 @@ values
     80,
     '2021-04-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     355,
@@ -3572,7 +6412,15 @@ values
     33,
     '2020-07-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     356,
@@ -3582,7 +6430,15 @@ values
     12,
     '2020-07-28 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     357,
@@ -3592,7 +6448,15 @@ values
     41,
     '2020-10-11 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     358,
@@ -3602,7 +6466,15 @@ values
     32,
     '2020-08-19 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     359,
@@ -3612,7 +6484,15 @@ values
     95,
     '2021-05-13 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     360,
@@ -3622,7 +6502,15 @@ values
     84,
     '2020-08-05 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     361,
@@ -3632,7 +6520,15 @@ values
     89,
     '2020-11-30 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     362,
@@ -3642,7 +6538,15 @@ values
     93,
     '2020-11-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     363,
@@ -3652,7 +6556,15 @@ values
     92,
     '2020-08-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     364,
@@ -3662,7 +6574,15 @@ values
     28,
     '2021-06-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     365,
@@ -3672,7 +6592,15 @@ values
     68,
     '2021-04-02 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     366,
@@ -3682,7 +6610,15 @@ values
     76,
     '2020-10-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     367,
@@ -3692,7 +6628,15 @@ values
     31,
     '2021-03-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     368,
@@ -3702,7 +6646,15 @@ values
     36,
     '2020-09-08 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     369,
@@ -3712,7 +6664,15 @@ values
     17,
     '2020-12-27 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     370,
@@ -3722,7 +6682,15 @@ values
     65,
     '2020-07-21 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     371,
@@ -3732,7 +6700,15 @@ values
     61,
     '2020-12-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     372,
@@ -3742,7 +6718,15 @@ values
     21,
     '2021-02-18 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     373,
@@ -3752,7 +6736,15 @@ values
     67,
     '2021-04-18 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     374,
@@ -3762,7 +6754,15 @@ values
     39,
     '2020-10-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     375,
@@ -3772,7 +6772,15 @@ values
     43,
     '2020-11-02 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     376,
@@ -3782,7 +6790,15 @@ values
     15,
     '2020-10-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     377,
@@ -3792,7 +6808,15 @@ values
     63,
     '2020-09-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     378,
@@ -3802,7 +6826,15 @@ values
     87,
     '2020-08-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     379,
@@ -3812,7 +6844,15 @@ values
     69,
     '2021-04-02 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     380,
@@ -3822,7 +6862,15 @@ values
     76,
     '2020-08-03 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     381,
@@ -3832,7 +6880,15 @@ values
     45,
     '2020-09-04 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     382,
@@ -3842,7 +6898,15 @@ values
     13,
     '2020-07-09 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     383,
@@ -3852,7 +6916,15 @@ values
     85,
     '2021-04-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     384,
@@ -3862,7 +6934,15 @@ values
     30,
     '2020-10-26 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     385,
@@ -3872,7 +6952,15 @@ values
     65,
     '2020-11-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     386,
@@ -3882,7 +6970,15 @@ values
     100,
     '2021-03-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     387,
@@ -3892,7 +6988,15 @@ values
     97,
     '2020-08-19 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     388,
@@ -3902,7 +7006,15 @@ values
     75,
     '2021-02-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     389,
@@ -3912,7 +7024,15 @@ values
     11,
     '2020-12-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     390,
@@ -3922,7 +7042,15 @@ values
     36,
     '2020-12-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     391,
@@ -3932,7 +7060,15 @@ values
     59,
     '2021-01-21 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     392,
@@ -3942,7 +7078,15 @@ values
     8,
     '2021-05-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     393,
@@ -3952,7 +7096,15 @@ values
     51,
     '2021-04-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     394,
@@ -3962,7 +7114,15 @@ values
     11,
     '2020-11-08 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     395,
@@ -3972,7 +7132,15 @@ values
     19,
     '2020-08-08 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     396,
@@ -3982,7 +7150,15 @@ values
     24,
     '2021-05-13 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     397,
@@ -3992,7 +7168,15 @@ values
     91,
     '2020-08-03 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     398,
@@ -4002,7 +7186,15 @@ values
     19,
     '2020-08-17 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     399,
@@ -4012,7 +7204,15 @@ values
     8,
     '2020-10-29 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     400,
@@ -4022,7 +7222,15 @@ values
     3,
     '2021-03-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     401,
@@ -4032,7 +7240,15 @@ values
     49,
     '2021-01-05 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     402,
@@ -4042,7 +7258,15 @@ values
     96,
     '2020-11-26 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     403,
@@ -4052,7 +7276,15 @@ values
     49,
     '2020-11-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     404,
@@ -4062,7 +7294,15 @@ values
     52,
     '2021-05-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     405,
@@ -4072,7 +7312,15 @@ values
     14,
     '2021-04-16 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     406,
@@ -4082,7 +7330,15 @@ values
     46,
     '2021-04-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     407,
@@ -4092,7 +7348,15 @@ values
     11,
     '2020-11-07 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     408,
@@ -4102,7 +7366,15 @@ values
     14,
     '2021-04-10 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     409,
@@ -4112,7 +7384,15 @@ values
     59,
     '2020-09-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     410,
@@ -4122,7 +7402,15 @@ values
     58,
     '2020-11-18 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     411,
@@ -4132,7 +7420,15 @@ values
     91,
     '2020-11-21 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     412,
@@ -4142,7 +7438,15 @@ values
     44,
     '2021-03-23 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     413,
@@ -4152,7 +7456,15 @@ values
     35,
     '2021-01-23 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     414,
@@ -4162,7 +7474,15 @@ values
     68,
     '2020-12-15 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     415,
@@ -4172,7 +7492,15 @@ values
     48,
     '2021-05-16 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     416,
@@ -4182,7 +7510,15 @@ values
     62,
     '2020-08-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     417,
@@ -4192,7 +7528,15 @@ values
     95,
     '2021-04-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     418,
@@ -4202,7 +7546,15 @@ values
     92,
     '2020-12-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     419,
@@ -4212,7 +7564,15 @@ values
     96,
     '2020-12-04 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     420,
@@ -4222,7 +7582,15 @@ values
     42,
     '2021-02-15 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     421,
@@ -4232,7 +7600,15 @@ values
     12,
     '2020-10-23 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     422,
@@ -4242,7 +7618,15 @@ values
     34,
     '2020-09-13 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     423,
@@ -4252,7 +7636,15 @@ values
     83,
     '2020-07-31 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     424,
@@ -4262,7 +7654,15 @@ values
     95,
     '2021-01-26 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     425,
@@ -4272,7 +7672,15 @@ values
     65,
     '2021-01-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     426,
@@ -4282,7 +7690,15 @@ values
     30,
     '2021-04-14 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     427,
@@ -4292,7 +7708,15 @@ values
     30,
     '2021-01-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     428,
@@ -4302,7 +7726,15 @@ values
     65,
     '2021-05-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     429,
@@ -4312,7 +7744,15 @@ values
     79,
     '2020-12-09 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     430,
@@ -4322,7 +7762,15 @@ values
     30,
     '2021-05-11 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     431,
@@ -4332,7 +7780,15 @@ values
     73,
     '2020-09-08 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     432,
@@ -4342,7 +7798,15 @@ values
     48,
     '2021-04-24 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     433,
@@ -4352,7 +7816,15 @@ values
     9,
     '2020-12-18 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     434,
@@ -4362,7 +7834,15 @@ values
     76,
     '2021-02-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     435,
@@ -4372,7 +7852,15 @@ values
     86,
     '2020-10-16 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     436,
@@ -4382,7 +7870,15 @@ values
     77,
     '2021-04-27 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     437,
@@ -4392,7 +7888,15 @@ values
     11,
     '2021-01-22 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     438,
@@ -4402,7 +7906,15 @@ values
     30,
     '2020-12-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     439,
@@ -4412,7 +7924,15 @@ values
     93,
     '2020-09-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     440,
@@ -4422,7 +7942,15 @@ values
     29,
     '2021-05-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     441,
@@ -4432,7 +7960,15 @@ values
     99,
     '2020-10-19 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     442,
@@ -4442,7 +7978,15 @@ values
     51,
     '2021-01-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     443,
@@ -4452,7 +7996,15 @@ values
     35,
     '2020-10-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     444,
@@ -4462,7 +8014,15 @@ values
     19,
     '2020-11-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     445,
@@ -4472,7 +8032,15 @@ values
     83,
     '2021-01-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     446,
@@ -4482,7 +8050,15 @@ values
     8,
     '2020-07-28 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     447,
@@ -4492,7 +8068,15 @@ values
     16,
     '2021-01-21 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     448,
@@ -4502,7 +8086,15 @@ values
     76,
     '2021-01-27 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     449,
@@ -4512,7 +8104,15 @@ values
     65,
     '2021-04-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     450,
@@ -4522,7 +8122,15 @@ values
     90,
     '2020-09-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     451,
@@ -4532,7 +8140,15 @@ values
     71,
     '2021-02-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     452,
@@ -4542,7 +8158,15 @@ values
     11,
     '2020-10-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     453,
@@ -4552,7 +8176,15 @@ values
     23,
     '2020-10-31 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     454,
@@ -4562,7 +8194,15 @@ values
     29,
     '2021-06-05 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     455,
@@ -4572,7 +8212,15 @@ values
     92,
     '2021-03-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     456,
@@ -4582,7 +8230,15 @@ values
     25,
     '2020-08-01 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     457,
@@ -4592,7 +8248,15 @@ values
     34,
     '2021-01-30 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     458,
@@ -4602,7 +8266,15 @@ values
     87,
     '2021-04-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     459,
@@ -4612,7 +8284,15 @@ values
     5,
     '2020-09-24 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     460,
@@ -4622,7 +8302,15 @@ values
     32,
     '2020-09-29 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     461,
@@ -4632,7 +8320,15 @@ values
     35,
     '2020-07-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     462,
@@ -4642,7 +8338,15 @@ values
     100,
     '2020-12-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     463,
@@ -4652,7 +8356,15 @@ values
     85,
     '2020-06-19 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     464,
@@ -4662,7 +8374,15 @@ values
     55,
     '2020-08-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     465,
@@ -4672,7 +8392,15 @@ values
     93,
     '2021-05-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     466,
@@ -4682,7 +8410,15 @@ values
     82,
     '2020-08-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     467,
@@ -4692,7 +8428,15 @@ values
     22,
     '2020-10-21 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     468,
@@ -4702,7 +8446,15 @@ values
     51,
     '2020-12-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     469,
@@ -4712,7 +8464,15 @@ values
     8,
     '2021-02-25 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     470,
@@ -4722,7 +8482,15 @@ values
     34,
     '2020-07-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     471,
@@ -4732,7 +8500,15 @@ values
     51,
     '2021-01-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     472,
@@ -4742,7 +8518,15 @@ values
     81,
     '2020-07-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     473,
@@ -4752,7 +8536,15 @@ values
     70,
     '2020-06-16 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     474,
@@ -4762,7 +8554,15 @@ values
     79,
     '2020-11-05 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     475,
@@ -4772,7 +8572,15 @@ values
     61,
     '2021-01-13 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     476,
@@ -4782,7 +8590,15 @@ values
     16,
     '2020-12-14 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     477,
@@ -4792,7 +8608,15 @@ values
     80,
     '2020-08-05 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     478,
@@ -4802,7 +8626,15 @@ values
     35,
     '2021-04-26 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     479,
@@ -4812,7 +8644,15 @@ values
     25,
     '2021-02-09 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     480,
@@ -4822,7 +8662,15 @@ values
     41,
     '2020-08-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     481,
@@ -4832,7 +8680,15 @@ values
     93,
     '2021-05-01 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     482,
@@ -4842,7 +8698,15 @@ values
     87,
     '2021-04-08 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     483,
@@ -4852,7 +8716,15 @@ values
     42,
     '2020-06-24 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     484,
@@ -4862,7 +8734,15 @@ values
     75,
     '2021-01-05 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     485,
@@ -4872,7 +8752,15 @@ values
     17,
     '2020-09-27 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     486,
@@ -4882,7 +8770,15 @@ values
     21,
     '2021-03-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     487,
@@ -4892,7 +8788,15 @@ values
     75,
     '2020-12-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     488,
@@ -4902,7 +8806,15 @@ values
     20,
     '2020-07-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     489,
@@ -4912,7 +8824,15 @@ values
     18,
     '2020-08-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     490,
@@ -4922,7 +8842,15 @@ values
     64,
     '2020-12-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     491,
@@ -4932,7 +8860,15 @@ values
     43,
     '2020-11-04 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     492,
@@ -4942,7 +8878,15 @@ values
     13,
     '2021-02-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     493,
@@ -4952,7 +8896,15 @@ values
     86,
     '2021-05-11 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     494,
@@ -4962,7 +8914,15 @@ values
     39,
     '2020-09-12 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     495,
@@ -4972,7 +8932,15 @@ values
     82,
     '2021-03-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     496,
@@ -4982,7 +8950,15 @@ values
     59,
     '2020-09-30 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     497,
@@ -4992,7 +8968,15 @@ values
     97,
     '2021-02-22 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     498,
@@ -5002,7 +8986,15 @@ values
     3,
     '2020-08-27 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     499,
@@ -5012,7 +9004,15 @@ values
     77,
     '2020-09-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     500,
@@ -5022,7 +9022,15 @@ values
     75,
     '2020-10-22 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     501,
@@ -5032,7 +9040,15 @@ values
     51,
     '2021-06-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     502,
@@ -5042,7 +9058,15 @@ values
     29,
     '2020-07-25 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     503,
@@ -5052,7 +9076,15 @@ values
     15,
     '2020-11-08 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     504,
@@ -5062,7 +9094,15 @@ values
     46,
     '2020-09-27 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     505,
@@ -5072,7 +9112,15 @@ values
     67,
     '2020-07-25 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     506,
@@ -5082,7 +9130,15 @@ values
     52,
     '2021-05-26 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     507,
@@ -5092,7 +9148,15 @@ values
     58,
     '2021-03-25 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     508,
@@ -5102,7 +9166,15 @@ values
     40,
     '2021-02-28 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     509,
@@ -5112,7 +9184,15 @@ values
     80,
     '2021-04-09 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     510,
@@ -5122,7 +9202,15 @@ values
     77,
     '2021-04-04 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     511,
@@ -5132,7 +9220,15 @@ values
     44,
     '2021-02-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     512,
@@ -5142,7 +9238,15 @@ values
     100,
     '2021-04-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     513,
@@ -5152,7 +9256,15 @@ values
     30,
     '2021-03-04 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     514,
@@ -5162,7 +9274,15 @@ values
     65,
     '2020-10-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     515,
@@ -5172,7 +9292,15 @@ values
     44,
     '2020-12-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     516,
@@ -5182,7 +9310,15 @@ values
     64,
     '2020-08-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     517,
@@ -5192,7 +9328,15 @@ values
     21,
     '2021-03-28 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     518,
@@ -5202,7 +9346,15 @@ values
     43,
     '2021-04-23 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     519,
@@ -5212,7 +9364,15 @@ values
     87,
     '2021-04-21 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     520,
@@ -5222,7 +9382,15 @@ values
     47,
     '2021-03-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     521,
@@ -5232,7 +9400,15 @@ values
     1,
     '2021-05-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     522,
@@ -5242,7 +9418,15 @@ values
     38,
     '2020-09-15 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     523,
@@ -5252,7 +9436,15 @@ values
     37,
     '2020-11-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     524,
@@ -5262,7 +9454,15 @@ values
     82,
     '2021-01-29 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     525,
@@ -5272,7 +9472,15 @@ values
     64,
     '2020-07-10 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     526,
@@ -5282,7 +9490,15 @@ values
     54,
     '2020-10-04 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     527,
@@ -5292,7 +9508,15 @@ values
     89,
     '2021-02-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     528,
@@ -5302,7 +9526,15 @@ values
     71,
     '2021-03-27 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     529,
@@ -5312,7 +9544,15 @@ values
     29,
     '2020-07-01 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     530,
@@ -5322,7 +9562,15 @@ values
     57,
     '2020-12-11 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     531,
@@ -5332,7 +9580,15 @@ values
     6,
     '2021-05-04 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     532,
@@ -5342,7 +9598,15 @@ values
     88,
     '2020-08-25 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     533,
@@ -5352,7 +9616,15 @@ values
     69,
     '2020-12-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     534,
@@ -5362,7 +9634,15 @@ values
     61,
     '2020-11-10 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     535,
@@ -5372,7 +9652,15 @@ values
     82,
     '2021-02-04 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     536,
@@ -5382,7 +9670,15 @@ values
     90,
     '2020-11-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     537,
@@ -5392,7 +9688,15 @@ values
     65,
     '2020-06-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     538,
@@ -5402,7 +9706,15 @@ values
     70,
     '2020-06-24 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     539,
@@ -5412,7 +9724,15 @@ values
     97,
     '2020-08-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     540,
@@ -5422,7 +9742,15 @@ values
     41,
     '2021-04-05 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     541,
@@ -5432,7 +9760,15 @@ values
     11,
     '2020-09-09 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     542,
@@ -5442,7 +9778,15 @@ values
     15,
     '2021-01-15 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     543,
@@ -5452,7 +9796,15 @@ values
     97,
     '2021-04-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     544,
@@ -5462,7 +9814,15 @@ values
     77,
     '2020-12-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     545,
@@ -5472,7 +9832,15 @@ values
     51,
     '2020-11-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     546,
@@ -5482,7 +9850,15 @@ values
     52,
     '2020-10-21 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     547,
@@ -5492,7 +9868,15 @@ values
     23,
     '2020-12-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     548,
@@ -5502,7 +9886,15 @@ values
     84,
     '2021-01-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     549,
@@ -5512,7 +9904,15 @@ values
     1,
     '2021-04-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     550,
@@ -5522,7 +9922,15 @@ values
     94,
     '2020-09-04 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     551,
@@ -5532,7 +9940,15 @@ values
     45,
     '2020-10-01 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     552,
@@ -5542,7 +9958,15 @@ values
     69,
     '2021-01-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     553,
@@ -5552,7 +9976,15 @@ values
     71,
     '2021-02-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     554,
@@ -5562,7 +9994,15 @@ values
     2,
     '2021-06-02 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     555,
@@ -5572,7 +10012,15 @@ values
     37,
     '2021-01-24 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     556,
@@ -5582,7 +10030,15 @@ values
     81,
     '2021-03-21 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     557,
@@ -5592,7 +10048,15 @@ values
     48,
     '2021-06-02 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     558,
@@ -5602,7 +10066,15 @@ values
     32,
     '2021-05-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     559,
@@ -5612,7 +10084,15 @@ values
     13,
     '2020-11-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     560,
@@ -5622,7 +10102,15 @@ values
     75,
     '2020-07-28 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     561,
@@ -5632,7 +10120,15 @@ values
     82,
     '2020-09-22 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     562,
@@ -5642,7 +10138,15 @@ values
     97,
     '2020-11-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     563,
@@ -5652,7 +10156,15 @@ values
     15,
     '2020-08-01 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     564,
@@ -5662,7 +10174,15 @@ values
     85,
     '2020-09-28 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     565,
@@ -5672,7 +10192,15 @@ values
     58,
     '2020-12-01 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     566,
@@ -5682,7 +10210,15 @@ values
     77,
     '2021-04-04 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     567,
@@ -5692,7 +10228,15 @@ values
     44,
     '2020-07-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     568,
@@ -5702,7 +10246,15 @@ values
     50,
     '2020-08-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     569,
@@ -5712,7 +10264,15 @@ values
     78,
     '2021-02-22 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     570,
@@ -5722,7 +10282,15 @@ values
     24,
     '2021-04-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     571,
@@ -5732,7 +10300,15 @@ values
     44,
     '2021-01-19 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     572,
@@ -5742,7 +10318,15 @@ values
     27,
     '2020-12-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     573,
@@ -5752,7 +10336,15 @@ values
     32,
     '2020-06-12 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     574,
@@ -5762,7 +10354,15 @@ values
     41,
     '2021-03-28 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     575,
@@ -5772,7 +10372,15 @@ values
     64,
     '2021-04-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     576,
@@ -5782,7 +10390,15 @@ values
     89,
     '2020-07-05 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     577,
@@ -5792,7 +10408,15 @@ values
     48,
     '2020-12-10 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     578,
@@ -5802,7 +10426,15 @@ values
     66,
     '2020-10-11 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     579,
@@ -5812,7 +10444,15 @@ values
     74,
     '2020-09-16 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     580,
@@ -5822,7 +10462,15 @@ values
     62,
     '2021-03-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     581,
@@ -5832,7 +10480,15 @@ values
     40,
     '2020-10-05 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     582,
@@ -5842,7 +10498,15 @@ values
     49,
     '2021-03-18 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     583,
@@ -5852,7 +10516,15 @@ values
     7,
     '2021-03-20 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     584,
@@ -5862,7 +10534,15 @@ values
     69,
     '2020-08-17 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     585,
@@ -5872,7 +10552,15 @@ values
     82,
     '2020-09-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     586,
@@ -5882,7 +10570,15 @@ values
     76,
     '2021-02-01 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     587,
@@ -5892,7 +10588,15 @@ values
     8,
     '2021-03-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     588,
@@ -5902,7 +10606,15 @@ values
     63,
     '2020-07-31 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     589,
@@ -5912,7 +10624,15 @@ values
     89,
     '2021-04-15 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     590,
@@ -5922,7 +10642,15 @@ values
     5,
     '2021-01-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     591,
@@ -5932,7 +10660,15 @@ values
     44,
     '2021-03-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     592,
@@ -5942,7 +10678,15 @@ values
     56,
     '2020-08-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     593,
@@ -5952,7 +10696,15 @@ values
     74,
     '2020-10-14 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     594,
@@ -5962,7 +10714,15 @@ values
     52,
     '2021-05-24 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     595,
@@ -5972,7 +10732,15 @@ values
     86,
     '2020-07-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     596,
@@ -5982,7 +10750,15 @@ values
     100,
     '2020-08-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     597,
@@ -5992,7 +10768,15 @@ values
     49,
     '2021-03-02 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     598,
@@ -6002,7 +10786,15 @@ values
     35,
     '2020-09-23 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     599,
@@ -6012,7 +10804,15 @@ values
     27,
     '2020-09-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     600,
@@ -6022,7 +10822,15 @@ values
     96,
     '2020-11-30 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     601,
@@ -6032,7 +10840,15 @@ values
     17,
     '2021-04-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     602,
@@ -6042,7 +10858,15 @@ values
     84,
     '2021-01-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     603,
@@ -6052,7 +10876,15 @@ values
     48,
     '2020-12-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     604,
@@ -6062,7 +10894,15 @@ values
     13,
     '2020-06-18 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     605,
@@ -6072,7 +10912,15 @@ values
     49,
     '2020-08-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     606,
@@ -6082,7 +10930,15 @@ values
     2,
     '2021-04-13 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     607,
@@ -6092,7 +10948,15 @@ values
     55,
     '2020-06-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     608,
@@ -6102,7 +10966,15 @@ values
     30,
     '2020-10-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     609,
@@ -6112,7 +10984,15 @@ values
     35,
     '2021-04-12 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     610,
@@ -6122,7 +11002,15 @@ values
     81,
     '2020-11-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     611,
@@ -6132,7 +11020,15 @@ values
     10,
     '2021-02-15 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     612,
@@ -6142,7 +11038,15 @@ values
     7,
     '2020-10-04 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     613,
@@ -6152,7 +11056,15 @@ values
     33,
     '2020-07-26 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     614,
@@ -6162,7 +11074,15 @@ values
     57,
     '2021-05-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     615,
@@ -6172,7 +11092,15 @@ values
     94,
     '2021-04-02 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     616,
@@ -6182,7 +11110,15 @@ values
     79,
     '2020-12-05 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     617,
@@ -6192,7 +11128,15 @@ values
     76,
     '2021-06-04 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     618,
@@ -6202,7 +11146,15 @@ values
     36,
     '2020-11-27 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     619,
@@ -6212,7 +11164,15 @@ values
     33,
     '2020-09-02 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     620,
@@ -6222,7 +11182,15 @@ values
     95,
     '2021-06-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     621,
@@ -6232,7 +11200,15 @@ values
     77,
     '2021-05-31 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     622,
@@ -6242,7 +11218,15 @@ values
     14,
     '2020-07-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     623,
@@ -6252,7 +11236,15 @@ values
     68,
     '2021-01-19 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     624,
@@ -6262,7 +11254,15 @@ values
     48,
     '2021-01-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     625,
@@ -6272,7 +11272,15 @@ values
     30,
     '2021-04-23 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     626,
@@ -6282,7 +11290,15 @@ values
     52,
     '2020-11-17 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     627,
@@ -6292,7 +11308,15 @@ values
     38,
     '2020-07-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     628,
@@ -6302,7 +11326,15 @@ values
     35,
     '2020-09-30 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     629,
@@ -6312,7 +11344,15 @@ values
     66,
     '2020-06-21 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     630,
@@ -6322,7 +11362,15 @@ values
     13,
     '2021-02-13 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     631,
@@ -6332,7 +11380,15 @@ values
     89,
     '2020-09-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     632,
@@ -6342,7 +11398,15 @@ values
     92,
     '2020-06-14 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     633,
@@ -6352,7 +11416,15 @@ values
     12,
     '2021-01-07 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     634,
@@ -6362,7 +11434,15 @@ values
     30,
     '2021-02-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     635,
@@ -6372,7 +11452,15 @@ values
     54,
     '2021-05-22 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     636,
@@ -6382,7 +11470,15 @@ values
     42,
     '2021-01-12 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     637,
@@ -6392,7 +11488,15 @@ values
     85,
     '2021-04-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     638,
@@ -6402,7 +11506,15 @@ values
     74,
     '2021-05-31 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     639,
@@ -6412,7 +11524,15 @@ values
     91,
     '2021-03-05 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     640,
@@ -6422,7 +11542,15 @@ values
     43,
     '2020-10-03 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     641,
@@ -6432,7 +11560,15 @@ values
     31,
     '2020-09-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     642,
@@ -6442,7 +11578,15 @@ values
     55,
     '2020-06-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     643,
@@ -6452,7 +11596,15 @@ values
     76,
     '2020-12-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     644,
@@ -6462,7 +11614,15 @@ values
     21,
     '2021-04-02 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     645,
@@ -6472,7 +11632,15 @@ values
     64,
     '2020-07-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     646,
@@ -6482,7 +11650,15 @@ values
     42,
     '2020-10-31 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     647,
@@ -6492,7 +11668,15 @@ values
     78,
     '2020-06-13 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     648,
@@ -6502,7 +11686,15 @@ values
     82,
     '2020-07-16 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     649,
@@ -6512,7 +11704,15 @@ values
     69,
     '2021-02-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     650,
@@ -6522,7 +11722,15 @@ values
     89,
     '2021-01-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     651,
@@ -6532,7 +11740,15 @@ values
     82,
     '2021-02-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     652,
@@ -6542,7 +11758,15 @@ values
     98,
     '2020-09-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     653,
@@ -6552,7 +11776,15 @@ values
     21,
     '2021-02-16 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     654,
@@ -6562,7 +11794,15 @@ values
     93,
     '2021-05-01 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     655,
@@ -6572,7 +11812,15 @@ values
     14,
     '2020-08-07 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     656,
@@ -6582,7 +11830,15 @@ values
     14,
     '2020-11-06 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     657,
@@ -6592,7 +11848,15 @@ values
     95,
     '2020-11-25 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     658,
@@ -6602,7 +11866,15 @@ values
     21,
     '2020-10-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     659,
@@ -6612,7 +11884,15 @@ values
     76,
     '2020-09-06 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     660,
@@ -6622,7 +11902,15 @@ values
     57,
     '2020-06-19 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     661,
@@ -6632,7 +11920,15 @@ values
     31,
     '2020-09-19 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     662,
@@ -6642,7 +11938,15 @@ values
     83,
     '2020-08-01 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     663,
@@ -6652,7 +11956,15 @@ values
     97,
     '2020-08-25 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     664,
@@ -6662,7 +11974,15 @@ values
     8,
     '2020-09-12 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     665,
@@ -6672,7 +11992,15 @@ values
     23,
     '2020-06-18 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     666,
@@ -6682,7 +12010,15 @@ values
     74,
     '2020-07-09 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     667,
@@ -6692,7 +12028,15 @@ values
     53,
     '2021-06-08 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     668,
@@ -6702,7 +12046,15 @@ values
     44,
     '2021-05-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     669,
@@ -6712,7 +12064,15 @@ values
     41,
     '2020-07-12 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     670,
@@ -6722,7 +12082,15 @@ values
     56,
     '2021-05-19 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     671,
@@ -6732,7 +12100,15 @@ values
     79,
     '2020-08-03 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     672,
@@ -6742,7 +12118,15 @@ values
     31,
     '2021-05-23 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     673,
@@ -6752,7 +12136,15 @@ values
     42,
     '2020-12-13 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     674,
@@ -6762,7 +12154,15 @@ values
     60,
     '2021-02-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     675,
@@ -6772,7 +12172,15 @@ values
     18,
     '2020-10-01 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     676,
@@ -6782,7 +12190,15 @@ values
     5,
     '2021-05-04 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     677,
@@ -6792,7 +12208,15 @@ values
     5,
     '2021-04-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     678,
@@ -6802,7 +12226,15 @@ values
     24,
     '2020-12-08 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     679,
@@ -6812,7 +12244,15 @@ values
     58,
     '2020-06-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     680,
@@ -6822,7 +12262,15 @@ values
     88,
     '2021-04-28 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     681,
@@ -6832,7 +12280,15 @@ values
     13,
     '2021-06-06 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     682,
@@ -6842,7 +12298,15 @@ values
     97,
     '2021-05-29 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     683,
@@ -6852,7 +12316,15 @@ values
     13,
     '2020-08-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     684,
@@ -6862,7 +12334,15 @@ values
     68,
     '2021-05-04 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     685,
@@ -6872,7 +12352,15 @@ values
     77,
     '2021-01-19 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     686,
@@ -6882,7 +12370,15 @@ values
     32,
     '2021-06-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     687,
@@ -6892,7 +12388,15 @@ values
     82,
     '2020-12-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     688,
@@ -6902,7 +12406,15 @@ values
     0,
     '2021-04-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     689,
@@ -6912,7 +12424,15 @@ values
     49,
     '2020-08-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     690,
@@ -6922,7 +12442,15 @@ values
     23,
     '2020-11-28 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     691,
@@ -6932,7 +12460,15 @@ values
     52,
     '2020-06-11 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     692,
@@ -6942,7 +12478,15 @@ values
     93,
     '2021-03-28 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     693,
@@ -6952,7 +12496,15 @@ values
     11,
     '2021-05-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     694,
@@ -6962,7 +12514,15 @@ values
     52,
     '2020-07-28 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     695,
@@ -6972,7 +12532,15 @@ values
     67,
     '2021-01-03 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     696,
@@ -6982,7 +12550,15 @@ values
     47,
     '2020-10-24 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     697,
@@ -6992,7 +12568,15 @@ values
     46,
     '2020-07-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     698,
@@ -7002,7 +12586,15 @@ values
     75,
     '2020-11-02 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     699,
@@ -7012,7 +12604,15 @@ values
     14,
     '2020-07-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     700,
@@ -7022,7 +12622,15 @@ values
     98,
     '2020-07-20 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     701,
@@ -7032,7 +12640,15 @@ values
     44,
     '2020-11-18 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     702,
@@ -7042,7 +12658,15 @@ values
     36,
     '2020-09-10 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     703,
@@ -7052,7 +12676,15 @@ values
     94,
     '2020-11-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     704,
@@ -7062,7 +12694,15 @@ values
     76,
     '2020-12-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     705,
@@ -7072,7 +12712,15 @@ values
     4,
     '2020-09-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     706,
@@ -7082,7 +12730,15 @@ values
     41,
     '2020-08-26 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     707,
@@ -7092,7 +12748,15 @@ values
     44,
     '2020-11-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     708,
@@ -7102,7 +12766,15 @@ values
     58,
     '2020-09-15 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     709,
@@ -7112,7 +12784,15 @@ values
     28,
     '2020-11-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     710,
@@ -7122,7 +12802,15 @@ values
     35,
     '2020-07-18 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     711,
@@ -7132,7 +12820,15 @@ values
     68,
     '2020-09-04 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     712,
@@ -7142,7 +12838,15 @@ values
     89,
     '2020-07-08 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     713,
@@ -7152,7 +12856,15 @@ values
     75,
     '2020-07-17 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     714,
@@ -7162,7 +12874,15 @@ values
     72,
     '2021-01-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     715,
@@ -7172,7 +12892,15 @@ values
     7,
     '2020-11-05 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     716,
@@ -7182,7 +12910,15 @@ values
     17,
     '2021-04-13 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     717,
@@ -7192,7 +12928,15 @@ values
     4,
     '2020-07-29 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     718,
@@ -7202,7 +12946,15 @@ values
     12,
     '2020-12-27 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     719,
@@ -7212,7 +12964,15 @@ values
     49,
     '2020-12-14 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     720,
@@ -7222,7 +12982,15 @@ values
     4,
     '2020-08-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     721,
@@ -7232,7 +13000,15 @@ values
     91,
     '2021-02-22 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     722,
@@ -7242,7 +13018,15 @@ values
     44,
     '2021-03-26 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     723,
@@ -7252,7 +13036,15 @@ values
     17,
     '2021-04-06 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     724,
@@ -7262,7 +13054,15 @@ values
     76,
     '2020-10-27 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     725,
@@ -7272,7 +13072,15 @@ values
     21,
     '2020-09-10 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     726,
@@ -7282,7 +13090,15 @@ values
     85,
     '2021-03-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     727,
@@ -7292,7 +13108,15 @@ values
     52,
     '2020-10-04 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     728,
@@ -7302,7 +13126,15 @@ values
     4,
     '2021-01-18 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     729,
@@ -7312,7 +13144,15 @@ values
     48,
     '2020-12-19 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     730,
@@ -7322,7 +13162,15 @@ values
     39,
     '2021-02-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     731,
@@ -7332,7 +13180,15 @@ values
     83,
     '2020-12-30 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     732,
@@ -7342,7 +13198,15 @@ values
     82,
     '2020-08-09 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     733,
@@ -7352,7 +13216,15 @@ values
     38,
     '2020-09-15 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     734,
@@ -7362,7 +13234,15 @@ values
     82,
     '2021-03-25 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     735,
@@ -7372,7 +13252,15 @@ values
     44,
     '2020-08-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     736,
@@ -7382,7 +13270,15 @@ values
     93,
     '2020-11-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     737,
@@ -7392,7 +13288,15 @@ values
     73,
     '2021-03-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     738,
@@ -7402,7 +13306,15 @@ values
     46,
     '2021-01-15 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     739,
@@ -7412,7 +13324,15 @@ values
     46,
     '2020-07-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     740,
@@ -7422,7 +13342,15 @@ values
     6,
     '2021-01-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     741,
@@ -7432,7 +13360,15 @@ values
     8,
     '2021-04-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     742,
@@ -7442,7 +13378,15 @@ values
     0,
     '2020-10-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     743,
@@ -7452,7 +13396,15 @@ values
     46,
     '2020-07-05 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     744,
@@ -7462,7 +13414,15 @@ values
     63,
     '2020-10-21 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     745,
@@ -7472,7 +13432,15 @@ values
     75,
     '2020-06-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     746,
@@ -7482,7 +13450,15 @@ values
     26,
     '2020-12-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     747,
@@ -7492,7 +13468,15 @@ values
     22,
     '2020-08-26 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     748,
@@ -7502,7 +13486,15 @@ values
     93,
     '2020-09-13 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     749,
@@ -7512,7 +13504,15 @@ values
     49,
     '2021-04-09 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     750,
@@ -7522,7 +13522,15 @@ values
     81,
     '2021-02-06 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     751,
@@ -7532,7 +13540,15 @@ values
     17,
     '2020-12-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     752,
@@ -7542,7 +13558,15 @@ values
     24,
     '2021-04-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     753,
@@ -7552,7 +13576,15 @@ values
     81,
     '2020-11-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     754,
@@ -7562,7 +13594,15 @@ values
     3,
     '2020-07-23 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     755,
@@ -7572,7 +13612,15 @@ values
     53,
     '2020-12-12 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     756,
@@ -7582,7 +13630,15 @@ values
     93,
     '2021-05-06 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     757,
@@ -7592,7 +13648,15 @@ values
     78,
     '2020-08-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     758,
@@ -7602,7 +13666,15 @@ values
     3,
     '2020-10-04 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     759,
@@ -7612,7 +13684,15 @@ values
     78,
     '2021-02-19 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     760,
@@ -7622,7 +13702,15 @@ values
     32,
     '2020-06-25 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     761,
@@ -7632,7 +13720,15 @@ values
     1,
     '2020-10-26 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     762,
@@ -7642,7 +13738,15 @@ values
     5,
     '2021-04-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     763,
@@ -7652,7 +13756,15 @@ values
     35,
     '2021-01-27 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     764,
@@ -7662,7 +13774,15 @@ values
     74,
     '2021-06-01 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     765,
@@ -7672,7 +13792,15 @@ values
     34,
     '2020-11-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     766,
@@ -7682,7 +13810,15 @@ values
     90,
     '2021-05-26 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     767,
@@ -7692,7 +13828,15 @@ values
     81,
     '2021-05-18 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     768,
@@ -7702,7 +13846,15 @@ values
     89,
     '2020-07-21 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     769,
@@ -7712,7 +13864,15 @@ values
     55,
     '2021-01-27 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     770,
@@ -7722,7 +13882,15 @@ values
     10,
     '2021-02-28 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     771,
@@ -7732,7 +13900,15 @@ values
     37,
     '2020-10-27 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     772,
@@ -7742,7 +13918,15 @@ values
     80,
     '2021-01-08 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     773,
@@ -7752,7 +13936,15 @@ values
     18,
     '2020-08-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     774,
@@ -7762,7 +13954,15 @@ values
     12,
     '2021-01-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     775,
@@ -7772,7 +13972,15 @@ values
     63,
     '2020-12-07 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     776,
@@ -7782,7 +13990,15 @@ values
     70,
     '2021-01-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     777,
@@ -7792,7 +14008,15 @@ values
     60,
     '2020-06-13 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     778,
@@ -7802,7 +14026,15 @@ values
     22,
     '2021-01-18 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     779,
@@ -7812,7 +14044,15 @@ values
     18,
     '2020-12-13 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     780,
@@ -7822,7 +14062,15 @@ values
     2,
     '2020-12-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     781,
@@ -7832,7 +14080,15 @@ values
     47,
     '2021-01-16 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     782,
@@ -7842,7 +14098,15 @@ values
     43,
     '2021-06-07 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     783,
@@ -7852,7 +14116,15 @@ values
     64,
     '2021-03-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     784,
@@ -7862,7 +14134,15 @@ values
     71,
     '2020-11-28 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     785,
@@ -7872,7 +14152,15 @@ values
     26,
     '2020-10-15 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     786,
@@ -7882,7 +14170,15 @@ values
     57,
     '2020-11-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     787,
@@ -7892,7 +14188,15 @@ values
     87,
     '2020-11-30 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     788,
@@ -7902,7 +14206,15 @@ values
     63,
     '2021-05-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     789,
@@ -7912,7 +14224,15 @@ values
     61,
     '2021-04-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     790,
@@ -7922,7 +14242,15 @@ values
     47,
     '2020-09-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     791,
@@ -7932,7 +14260,15 @@ values
     68,
     '2020-09-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     792,
@@ -7942,7 +14278,15 @@ values
     53,
     '2021-04-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     793,
@@ -7952,7 +14296,15 @@ values
     74,
     '2021-05-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     794,
@@ -7962,7 +14314,15 @@ values
     70,
     '2020-09-26 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     795,
@@ -7972,7 +14332,15 @@ values
     81,
     '2021-04-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     796,
@@ -7982,7 +14350,15 @@ values
     53,
     '2020-10-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     797,
@@ -7992,7 +14368,15 @@ values
     97,
     '2020-09-04 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     798,
@@ -8002,7 +14386,15 @@ values
     84,
     '2021-02-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     799,
@@ -8012,7 +14404,15 @@ values
     66,
     '2020-09-15 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     800,
@@ -8022,7 +14422,15 @@ values
     89,
     '2020-10-28 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     801,
@@ -8032,7 +14440,15 @@ values
     61,
     '2020-07-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     802,
@@ -8042,7 +14458,15 @@ values
     58,
     '2020-12-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     803,
@@ -8052,7 +14476,15 @@ values
     59,
     '2020-12-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     804,
@@ -8062,7 +14494,15 @@ values
     91,
     '2021-01-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     805,
@@ -8072,7 +14512,15 @@ values
     59,
     '2021-03-23 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     806,
@@ -8082,7 +14530,15 @@ values
     23,
     '2020-11-23 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     807,
@@ -8092,7 +14548,15 @@ values
     90,
     '2021-05-04 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     808,
@@ -8102,7 +14566,15 @@ values
     18,
     '2021-02-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     809,
@@ -8112,7 +14584,15 @@ values
     81,
     '2020-09-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     810,
@@ -8122,7 +14602,15 @@ values
     67,
     '2021-02-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     811,
@@ -8132,7 +14620,15 @@ values
     96,
     '2021-01-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     812,
@@ -8142,7 +14638,15 @@ values
     84,
     '2021-01-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     813,
@@ -8152,7 +14656,15 @@ values
     73,
     '2021-05-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     814,
@@ -8162,7 +14674,15 @@ values
     87,
     '2021-03-05 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     815,
@@ -8172,7 +14692,15 @@ values
     45,
     '2020-06-22 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     816,
@@ -8182,7 +14710,15 @@ values
     89,
     '2020-09-05 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     817,
@@ -8192,7 +14728,15 @@ values
     39,
     '2021-02-14 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     818,
@@ -8202,7 +14746,15 @@ values
     93,
     '2020-08-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     819,
@@ -8212,7 +14764,15 @@ values
     55,
     '2021-01-16 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     820,
@@ -8222,7 +14782,15 @@ values
     26,
     '2021-02-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     821,
@@ -8232,7 +14800,15 @@ values
     68,
     '2021-03-20 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     822,
@@ -8242,7 +14818,15 @@ values
     27,
     '2021-01-28 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     823,
@@ -8252,7 +14836,15 @@ values
     50,
     '2021-04-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     824,
@@ -8262,7 +14854,15 @@ values
     61,
     '2021-01-17 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     825,
@@ -8272,7 +14872,15 @@ values
     62,
     '2020-07-28 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     826,
@@ -8282,7 +14890,15 @@ values
     65,
     '2020-10-29 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     827,
@@ -8292,7 +14908,15 @@ values
     66,
     '2020-06-30 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     828,
@@ -8302,7 +14926,15 @@ values
     29,
     '2021-04-27 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     829,
@@ -8312,7 +14944,15 @@ values
     44,
     '2020-11-05 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     830,
@@ -8322,7 +14962,15 @@ values
     100,
     '2020-10-04 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     831,
@@ -8332,7 +14980,15 @@ values
     68,
     '2020-07-25 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     832,
@@ -8342,7 +14998,15 @@ values
     27,
     '2020-10-01 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     833,
@@ -8352,7 +15016,15 @@ values
     31,
     '2021-05-31 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     834,
@@ -8362,7 +15034,15 @@ values
     10,
     '2020-11-18 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     835,
@@ -8372,7 +15052,15 @@ values
     42,
     '2020-07-22 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     836,
@@ -8382,7 +15070,15 @@ values
     15,
     '2021-02-16 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     837,
@@ -8392,7 +15088,15 @@ values
     9,
     '2020-12-17 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     838,
@@ -8402,7 +15106,15 @@ values
     89,
     '2020-07-24 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     839,
@@ -8412,7 +15124,15 @@ values
     64,
     '2020-11-13 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     840,
@@ -8422,7 +15142,15 @@ values
     48,
     '2020-11-23 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     841,
@@ -8432,7 +15160,15 @@ values
     86,
     '2020-07-17 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     842,
@@ -8442,7 +15178,15 @@ values
     43,
     '2021-01-16 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     843,
@@ -8452,7 +15196,15 @@ values
     66,
     '2021-04-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     844,
@@ -8462,7 +15214,15 @@ values
     56,
     '2021-04-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     845,
@@ -8472,7 +15232,15 @@ values
     26,
     '2020-09-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     846,
@@ -8482,7 +15250,15 @@ values
     66,
     '2021-01-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     847,
@@ -8492,7 +15268,15 @@ values
     12,
     '2020-12-22 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     848,
@@ -8502,7 +15286,15 @@ values
     72,
     '2021-03-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     849,
@@ -8512,7 +15304,15 @@ values
     69,
     '2021-05-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     850,
@@ -8522,7 +15322,15 @@ values
     11,
     '2020-07-11 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     851,
@@ -8532,7 +15340,15 @@ values
     31,
     '2020-11-26 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     852,
@@ -8542,7 +15358,15 @@ values
     52,
     '2020-10-27 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     853,
@@ -8552,7 +15376,15 @@ values
     51,
     '2020-09-02 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     854,
@@ -8562,7 +15394,15 @@ values
     74,
     '2021-05-03 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     855,
@@ -8572,7 +15412,15 @@ values
     91,
     '2021-04-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     856,
@@ -8582,7 +15430,15 @@ values
     26,
     '2021-06-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     857,
@@ -8592,7 +15448,15 @@ values
     77,
     '2021-04-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     858,
@@ -8602,7 +15466,15 @@ values
     98,
     '2021-05-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     859,
@@ -8612,7 +15484,15 @@ values
     11,
     '2021-03-24 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     860,
@@ -8622,7 +15502,15 @@ values
     24,
     '2020-07-21 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     861,
@@ -8632,7 +15520,15 @@ values
     12,
     '2020-08-29 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     862,
@@ -8642,7 +15538,15 @@ values
     41,
     '2020-06-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     863,
@@ -8652,7 +15556,15 @@ values
     60,
     '2021-04-28 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     864,
@@ -8662,7 +15574,15 @@ values
     94,
     '2021-04-30 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     865,
@@ -8672,7 +15592,15 @@ values
     6,
     '2020-07-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     866,
@@ -8682,7 +15610,15 @@ values
     6,
     '2021-01-04 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     867,
@@ -8692,7 +15628,15 @@ values
     74,
     '2020-07-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     868,
@@ -8702,7 +15646,15 @@ values
     34,
     '2021-05-09 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     869,
@@ -8712,7 +15664,15 @@ values
     63,
     '2021-02-24 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     870,
@@ -8722,7 +15682,15 @@ values
     96,
     '2020-10-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     871,
@@ -8732,7 +15700,15 @@ values
     84,
     '2021-05-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     872,
@@ -8742,7 +15718,15 @@ values
     50,
     '2020-12-08 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     873,
@@ -8752,7 +15736,15 @@ values
     60,
     '2021-01-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     874,
@@ -8762,7 +15754,15 @@ values
     42,
     '2021-04-23 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     875,
@@ -8772,7 +15772,15 @@ values
     57,
     '2020-06-30 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     876,
@@ -8782,7 +15790,15 @@ values
     31,
     '2021-05-06 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     877,
@@ -8792,7 +15808,15 @@ values
     59,
     '2020-07-15 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     878,
@@ -8802,7 +15826,15 @@ values
     78,
     '2020-06-18 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     879,
@@ -8812,7 +15844,15 @@ values
     42,
     '2020-11-24 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     880,
@@ -8822,7 +15862,15 @@ values
     36,
     '2020-09-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     881,
@@ -8832,7 +15880,15 @@ values
     14,
     '2020-07-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     882,
@@ -8842,7 +15898,15 @@ values
     95,
     '2021-01-02 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     883,
@@ -8852,7 +15916,15 @@ values
     8,
     '2020-12-06 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     884,
@@ -8862,7 +15934,15 @@ values
     88,
     '2020-12-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     885,
@@ -8872,7 +15952,15 @@ values
     79,
     '2020-09-19 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     886,
@@ -8882,7 +15970,15 @@ values
     81,
     '2020-09-06 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     887,
@@ -8892,7 +15988,15 @@ values
     32,
     '2021-03-19 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     888,
@@ -8902,7 +16006,15 @@ values
     31,
     '2021-01-31 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     889,
@@ -8912,7 +16024,15 @@ values
     63,
     '2020-07-16 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     890,
@@ -8922,7 +16042,15 @@ values
     8,
     '2021-01-31 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     891,
@@ -8932,7 +16060,15 @@ values
     99,
     '2021-05-05 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     892,
@@ -8942,7 +16078,15 @@ values
     27,
     '2021-01-25 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     893,
@@ -8952,7 +16096,15 @@ values
     73,
     '2021-02-23 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     894,
@@ -8962,7 +16114,15 @@ values
     17,
     '2020-07-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     895,
@@ -8972,7 +16132,15 @@ values
     51,
     '2021-03-24 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     896,
@@ -8982,7 +16150,15 @@ values
     60,
     '2021-01-09 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     897,
@@ -8992,7 +16168,15 @@ values
     23,
     '2021-03-14 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     898,
@@ -9002,7 +16186,15 @@ values
     5,
     '2020-07-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     899,
@@ -9012,7 +16204,15 @@ values
     70,
     '2020-09-23 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     900,
@@ -9022,7 +16222,15 @@ values
     40,
     '2020-11-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     901,
@@ -9032,7 +16240,15 @@ values
     40,
     '2021-03-10 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     902,
@@ -9042,7 +16258,15 @@ values
     22,
     '2020-12-20 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     903,
@@ -9052,7 +16276,15 @@ values
     93,
     '2021-02-24 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     904,
@@ -9062,7 +16294,15 @@ values
     97,
     '2020-07-16 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     905,
@@ -9072,7 +16312,15 @@ values
     32,
     '2020-10-23 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     906,
@@ -9082,7 +16330,15 @@ values
     62,
     '2020-07-17 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     907,
@@ -9092,7 +16348,15 @@ values
     39,
     '2020-11-10 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     908,
@@ -9102,7 +16366,15 @@ values
     78,
     '2020-12-13 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     909,
@@ -9112,7 +16384,15 @@ values
     56,
     '2021-05-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     910,
@@ -9122,7 +16402,15 @@ values
     93,
     '2020-10-23 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     911,
@@ -9132,7 +16420,15 @@ values
     97,
     '2020-11-28 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     912,
@@ -9142,7 +16438,15 @@ values
     87,
     '2021-03-31 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     913,
@@ -9152,7 +16456,15 @@ values
     32,
     '2020-12-05 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     914,
@@ -9162,7 +16474,15 @@ values
     90,
     '2020-06-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     915,
@@ -9172,7 +16492,15 @@ values
     92,
     '2020-11-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     916,
@@ -9182,7 +16510,15 @@ values
     1,
     '2021-05-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     917,
@@ -9192,7 +16528,15 @@ values
     96,
     '2020-12-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     918,
@@ -9202,7 +16546,15 @@ values
     45,
     '2020-08-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     919,
@@ -9212,7 +16564,15 @@ values
     73,
     '2020-09-18 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     920,
@@ -9222,7 +16582,15 @@ values
     63,
     '2021-05-30 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     921,
@@ -9232,7 +16600,15 @@ values
     16,
     '2020-12-17 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     922,
@@ -9242,7 +16618,15 @@ values
     49,
     '2020-12-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     923,
@@ -9252,7 +16636,15 @@ values
     46,
     '2020-11-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     924,
@@ -9262,7 +16654,15 @@ values
     22,
     '2020-12-08 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     925,
@@ -9272,7 +16672,15 @@ values
     87,
     '2020-09-05 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     926,
@@ -9282,7 +16690,15 @@ values
     16,
     '2021-02-10 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     927,
@@ -9292,7 +16708,15 @@ values
     17,
     '2020-07-21 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     928,
@@ -9302,7 +16726,15 @@ values
     15,
     '2021-06-09 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     929,
@@ -9312,7 +16744,15 @@ values
     28,
     '2020-08-18 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     930,
@@ -9322,7 +16762,15 @@ values
     7,
     '2021-04-03 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     931,
@@ -9332,7 +16780,15 @@ values
     43,
     '2020-09-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     932,
@@ -9342,7 +16798,15 @@ values
     26,
     '2021-03-16 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     933,
@@ -9352,7 +16816,15 @@ values
     8,
     '2020-09-07 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     934,
@@ -9362,7 +16834,15 @@ values
     63,
     '2020-07-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     935,
@@ -9372,7 +16852,15 @@ values
     45,
     '2020-08-19 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     936,
@@ -9382,7 +16870,15 @@ values
     59,
     '2021-01-09 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     937,
@@ -9392,7 +16888,15 @@ values
     88,
     '2020-10-06 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     938,
@@ -9402,7 +16906,15 @@ values
     27,
     '2021-01-16 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     939,
@@ -9412,7 +16924,15 @@ values
     68,
     '2020-09-30 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     940,
@@ -9422,7 +16942,15 @@ values
     87,
     '2020-08-14 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     941,
@@ -9432,7 +16960,15 @@ values
     84,
     '2021-03-04 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     942,
@@ -9442,7 +16978,15 @@ values
     47,
     '2021-05-30 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     943,
@@ -9452,7 +16996,15 @@ values
     95,
     '2020-09-05 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     944,
@@ -9462,7 +17014,15 @@ values
     88,
     '2021-01-06 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     945,
@@ -9472,7 +17032,15 @@ values
     7,
     '2020-12-22 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     946,
@@ -9482,7 +17050,15 @@ values
     46,
     '2021-05-26 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     947,
@@ -9492,7 +17068,15 @@ values
     100,
     '2020-08-29 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     948,
@@ -9502,7 +17086,15 @@ values
     3,
     '2020-08-19 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     949,
@@ -9512,7 +17104,15 @@ values
     82,
     '2021-02-02 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     950,
@@ -9522,7 +17122,15 @@ values
     34,
     '2020-10-01 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     951,
@@ -9532,7 +17140,15 @@ values
     56,
     '2020-06-28 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     952,
@@ -9542,7 +17158,15 @@ values
     35,
     '2020-06-18 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     953,
@@ -9552,7 +17176,15 @@ values
     85,
     '2020-08-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     954,
@@ -9562,7 +17194,15 @@ values
     65,
     '2021-02-08 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     955,
@@ -9572,7 +17212,15 @@ values
     7,
     '2021-03-09 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     956,
@@ -9582,7 +17230,15 @@ values
     36,
     '2021-06-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     957,
@@ -9592,7 +17248,15 @@ values
     88,
     '2020-11-29 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     958,
@@ -9602,7 +17266,15 @@ values
     93,
     '2020-06-14 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     959,
@@ -9612,7 +17284,15 @@ values
     46,
     '2020-07-29 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     960,
@@ -9622,7 +17302,15 @@ values
     45,
     '2021-05-28 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     961,
@@ -9632,7 +17320,15 @@ values
     46,
     '2020-10-25 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     962,
@@ -9642,7 +17338,15 @@ values
     91,
     '2021-03-16 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     963,
@@ -9652,7 +17356,15 @@ values
     53,
     '2021-04-20 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     964,
@@ -9662,7 +17374,15 @@ values
     72,
     '2020-09-11 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     965,
@@ -9672,7 +17392,15 @@ values
     0,
     '2021-04-29 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     966,
@@ -9682,7 +17410,15 @@ values
     74,
     '2021-01-03 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     967,
@@ -9692,7 +17428,15 @@ values
     62,
     '2020-09-07 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     968,
@@ -9702,7 +17446,15 @@ values
     98,
     '2020-10-16 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     969,
@@ -9712,7 +17464,15 @@ values
     94,
     '2021-04-21 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     970,
@@ -9722,7 +17482,15 @@ values
     28,
     '2020-08-21 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     971,
@@ -9732,7 +17500,15 @@ values
     46,
     '2020-12-01 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     972,
@@ -9742,7 +17518,15 @@ values
     19,
     '2020-09-26 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     973,
@@ -9752,7 +17536,15 @@ values
     3,
     '2021-03-24 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     974,
@@ -9762,7 +17554,15 @@ values
     66,
     '2020-08-07 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     975,
@@ -9772,7 +17572,15 @@ values
     90,
     '2021-01-29 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     976,
@@ -9782,7 +17590,15 @@ values
     35,
     '2020-11-27 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     977,
@@ -9792,7 +17608,15 @@ values
     100,
     '2020-07-14 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     978,
@@ -9802,7 +17626,15 @@ values
     0,
     '2021-02-17 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     979,
@@ -9812,7 +17644,15 @@ values
     82,
     '2020-09-17 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     980,
@@ -9822,7 +17662,15 @@ values
     91,
     '2020-11-19 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     981,
@@ -9832,7 +17680,15 @@ values
     65,
     '2020-08-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     982,
@@ -9842,7 +17698,15 @@ values
     42,
     '2020-09-08 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     983,
@@ -9852,7 +17716,15 @@ values
     81,
     '2020-06-20 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     984,
@@ -9862,7 +17734,15 @@ values
     99,
     '2021-02-24 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     985,
@@ -9872,7 +17752,15 @@ values
     77,
     '2021-03-12 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     986,
@@ -9882,7 +17770,15 @@ values
     57,
     '2021-01-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     987,
@@ -9892,7 +17788,15 @@ values
     1,
     '2020-06-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     988,
@@ -9902,7 +17806,15 @@ values
     64,
     '2020-07-16 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     989,
@@ -9912,7 +17824,15 @@ values
     30,
     '2021-01-06 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     990,
@@ -9922,7 +17842,15 @@ values
     53,
     '2021-01-05 00:00:00',
     5,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     991,
@@ -9932,7 +17860,15 @@ values
     36,
     '2020-07-08 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     992,
@@ -9942,7 +17878,15 @@ values
     59,
     '2020-10-27 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     993,
@@ -9952,7 +17896,15 @@ values
     51,
     '2021-04-20 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     994,
@@ -9962,7 +17914,15 @@ values
     44,
     '2020-08-31 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     995,
@@ -9972,7 +17932,15 @@ values
     61,
     '2021-03-19 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     996,
@@ -9982,7 +17950,15 @@ values
     68,
     '2020-06-20 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     997,
@@ -9992,7 +17968,15 @@ values
     7,
     '2021-05-02 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     998,
@@ -10002,7 +17986,15 @@ values
     98,
     '2020-06-29 00:00:00',
     3,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     999,
@@ -10012,7 +18004,15 @@ values
     5,
     '2020-08-16 00:00:00',
     6,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   ),
   (
     1000,
@@ -10022,5 +18022,13 @@ values
     39,
     '2020-12-12 00:00:00',
     4,
-    '-'
+    '-',
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0
   );
\ No newline at end of file
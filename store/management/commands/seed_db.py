@@ -1,17 +1,91 @@
 from django.core.management.base import BaseCommand
-from django.db import connection
-from pathlib import Path
+from django.db import connection, transaction
+from store import search, synthetic
+from store.models import Collection
 import os
 
 
+def iter_statements(lines):
+    """
+    Yield the `;`-terminated statements of an SQL script one at a time,
+    ignoring semicolons inside quoted strings and `--` comments.
+    """
+    statement, quote = [], None
+    for line in lines:
+        start = position = 0
+        while position < len(line):
+            char = line[position]
+            if quote:
+                if char == '\\':
+                    position += 1
+                elif char == quote:
+                    quote = None
+            elif char in ('"', "'", '`'):
+                quote = char
+            elif char == '-' and line.startswith('--', position):
+                line = line[:position] + '\n'
+                break
+            elif char == ';':
+                statement.append(line[start:position])
+                sql = ''.join(statement).strip()
+                if sql:
+                    yield sql
+                statement, start = [], position + 1
+            position += 1
+        statement.append(line[start:])
+    sql = ''.join(statement).strip()
+    if sql:
+        yield sql
+
+
 class Command(BaseCommand):
     help = 'Populates the database with collections and products'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--synthetic', action='store_true',
+            help='generate random data instead of loading seed.sql')
+        for name, default in synthetic.DEFAULT_SIZES.items():
+            parser.add_argument(
+                f'--{name}', type=int, default=default,
+                help=f'number of {name} to generate (default {default})')
+        parser.add_argument('--seed', type=int, default=0,
+                            help='random seed of the synthetic data')
+        parser.add_argument('--chunk-size', type=int, default=5000)
+
     def handle(self, *args, **options):
-        print('Populating the database...')
+        if options['synthetic']:
+            self.generate(options)
+        else:
+            self.load_seed_file(options)
+
+    def load_seed_file(self, options):
+        self.stdout.write('Populating the database...')
         current_dir = os.path.dirname(__file__)
         file_path = os.path.join(current_dir, 'seed.sql')
-        sql = Path(file_path).read_text()
 
-        with connection.cursor() as cursor:
-            cursor.execute(sql)
+        with open(file_path) as f, transaction.atomic(), connection.cursor() as cursor:
+            for count, sql in enumerate(iter_statements(f), 1):
+                cursor.execute(sql)
+                self.stdout.write(f'Executed {count} statements...')
+
+        self.stdout.write('Counting collection products...')
+        Collection.objects.reconcile_product_count()
+
+        self.stdout.write('Building the search index...')
+        search.rebuild_index(options['chunk_size'])
+
+    def generate(self, options):
+        sizes = {name: options[name] for name in synthetic.DEFAULT_SIZES}
+        self.stdout.write(f'Generating {sizes} with seed {options["seed"]}...')
+
+        def progress(label, done, total):
+            if total:
+                self.stdout.write(f'{label}: {done}/{total}')
+            else:
+                self.stdout.write(f'{label}: {done}')
+
+        dataset = synthetic.generate(
+            sizes, options['seed'], options['chunk_size'], progress)
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {len(dataset["product_ids"])} products.'))
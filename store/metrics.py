@@ -0,0 +1,165 @@
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+
+from rest_framework.serializers import BaseSerializer
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+_current = ContextVar('store_request_timings', default=None)
+
+
+class RequestTimings:
+    """Per-request DB and serializer timings, also a DB execute wrapper."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.statements = Counter()
+        self._serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += perf_counter() - start
+            self.queries += 1
+            self.statements[sql] += 1
+
+    def activate(self):
+        return _current.set(self)
+
+    @staticmethod
+    def deactivate(token):
+        _current.reset(token)
+
+
+def instrument_serializers():
+    """Time top-level `serializer.data` evaluation for the active request."""
+    original = BaseSerializer.data.fget
+    if getattr(original, 'instrumented', False):
+        return
+
+    def data(self):
+        timings = _current.get()
+        if timings is None or timings._serializing:
+            return original(self)
+        timings._serializing = True
+        start = perf_counter()
+        try:
+            return original(self)
+        finally:
+            timings.serializer_time += perf_counter() - start
+            timings._serializing = False
+
+    data.instrumented = True
+    BaseSerializer.data = property(data)
+
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class RouteMetrics:
+    __slots__ = ('duration', 'queries', 'db_duration', 'serializer_duration')
+
+    def __init__(self):
+        self.duration = Histogram(LATENCY_BUCKETS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.db_duration = Histogram(LATENCY_BUCKETS)
+        self.serializer_duration = Histogram(LATENCY_BUCKETS)
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(**labels):
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class Registry:
+    histograms = [
+        ('duration', 'store_http_request_duration_seconds',
+         'Request latency in seconds.'),
+        ('queries', 'store_http_request_db_queries',
+         'Database queries per request.'),
+        ('db_duration', 'store_http_request_db_duration_seconds',
+         'Time spent in database queries per request.'),
+        ('serializer_duration', 'store_http_request_serializer_duration_seconds',
+         'Time spent producing serializer data per request.'),
+    ]
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._routes = {}
+            self._requests = Counter()
+
+    def observe(self, route, method, status, duration, timings):
+        with self._lock:
+            metrics = self._routes.get((route, method))
+            if metrics is None:
+                metrics = self._routes[(route, method)] = RouteMetrics()
+            metrics.duration.observe(duration)
+            metrics.queries.observe(timings.queries)
+            metrics.db_duration.observe(timings.db_time)
+            metrics.serializer_duration.observe(timings.serializer_time)
+            self._requests[(route, method, status)] += 1
+
+    def render(self, extra=()):
+        lines = []
+        with self._lock:
+            lines.append('# HELP store_http_requests_total Requests handled.')
+            lines.append('# TYPE store_http_requests_total counter')
+            for (route, method, status), count in sorted(self._requests.items()):
+                labels = _labels(route=route, method=method, status=status)
+                lines.append(f'store_http_requests_total{{{labels}}} {count}')
+
+            for attr, name, description in self.histograms:
+                lines.append(f'# HELP {name} {description}')
+                lines.append(f'# TYPE {name} histogram')
+                for (route, method), metrics in sorted(self._routes.items()):
+                    histogram = getattr(metrics, attr)
+                    labels = _labels(route=route, method=method)
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+                        cumulative += count
+                        lines.append(
+                            f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_sum{{{labels}}} {histogram.sum}')
+                    lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+        lines.extend(extra)
+        return '\n'.join(lines) + '\n'
+
+
+def response_cache_lines(stats):
+    lines = ['# HELP store_response_cache_total Response cache lookups.',
+             '# TYPE store_response_cache_total counter']
+    for namespace, outcomes in sorted(stats.items()):
+        for outcome, count in sorted(outcomes.items()):
+            labels = _labels(namespace=namespace, outcome=outcome)
+            lines.append(f'store_response_cache_total{{{labels}}} {count}')
+    return lines
+
+
+registry = Registry()
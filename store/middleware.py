@@ -0,0 +1,78 @@
+import logging
+from contextlib import ExitStack
+from time import perf_counter
+
+from asgiref.sync import (iscoroutinefunction, markcoroutinefunction,
+                          sync_to_async)
+from django.conf import settings
+from django.db import connections
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        metrics.instrument_serializers()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = metrics.RequestTimings()
+        token = timings.activate()
+        start = perf_counter()
+        try:
+            with ExitStack() as stack:
+                self.wrap_connections(stack, timings)
+                response = self.get_response(request)
+        finally:
+            metrics.RequestTimings.deactivate(token)
+        self.observe(request, response, perf_counter() - start, timings)
+        return response
+
+    async def __acall__(self, request):
+        timings = metrics.RequestTimings()
+        token = timings.activate()
+        start = perf_counter()
+        # Connections are per thread: the ORM runs in the thread-sensitive
+        # sync_to_async thread, so the wrappers are installed there.
+        stack = ExitStack()
+        await sync_to_async(self.wrap_connections)(stack, timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+            metrics.RequestTimings.deactivate(token)
+        self.observe(request, response, perf_counter() - start, timings)
+        return response
+
+    def wrap_connections(self, stack, timings):
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(timings))
+
+    def observe(self, request, response, duration, timings):
+        match = request.resolver_match
+        route = (match.url_name or match.view_name) if match else 'unmatched'
+        metrics.registry.observe(
+            route, request.method, response.status_code, duration, timings)
+        self.check_query_budget(request, route, timings)
+
+    def check_query_budget(self, request, route, timings):
+        budget = getattr(settings, 'STORE_METRICS_QUERY_BUDGET', 25)
+        repeat_limit = getattr(settings, 'STORE_METRICS_REPEATED_QUERY_LIMIT', 10)
+        if timings.queries > budget:
+            logger.warning('%s %s (%s) ran %d queries, over the budget of %d',
+                           request.method, request.path, route,
+                           timings.queries, budget)
+        sql, count = max(timings.statements.items(),
+                         key=lambda item: item[1], default=(None, 0))
+        if count > repeat_limit:
+            logger.warning('Possible N+1 in %s %s (%s): ran %d times: %s',
+                           request.method, request.path, route, count, sql)
@@ -0,0 +1,60 @@
+# Generated by Django 4.1.7 on 2026-10-17 05:58
+
+import re
+from collections import Counter
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# A frozen copy of the tokenizer in store.search as of this migration, so
+# later changes to the live index cannot change what this one builds.
+TOKEN_RE = re.compile(r'\w+')
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+
+
+def product_terms(product, max_length):
+    weights = Counter()
+    for text, weight in ((product.title, TITLE_WEIGHT),
+                         (product.description, DESCRIPTION_WEIGHT)):
+        for token in TOKEN_RE.findall((text or '').lower()):
+            weights[token[:max_length]] += weight
+    return weights
+
+
+def build_search_index(apps, schema_editor):
+    Product = apps.get_model('store', 'Product')
+    ProductSearchTerm = apps.get_model('store', 'ProductSearchTerm')
+    max_length = ProductSearchTerm._meta.get_field('term').max_length
+    terms = []
+    for product in Product.objects.only('id', 'title', 'description').iterator():
+        terms.extend(
+            ProductSearchTerm(term=term, product_id=product.pk, weight=weight)
+            for term, weight in product_terms(product, max_length).items())
+        if len(terms) >= 5000:
+            ProductSearchTerm.objects.bulk_create(terms)
+            terms = []
+    ProductSearchTerm.objects.bulk_create(terms)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0002_alter_productimage_image'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveIntegerField()),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='store.product')),
+            ],
+            options={
+                'unique_together': {('term', 'product')},
+            },
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.1.7 on 2026-10-17 05:59
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_products(apps, schema_editor):
+    Collection = apps.get_model('store', 'Collection')
+    Product = apps.get_model('store', 'Product')
+    Collection.objects.update(product_count=Coalesce(Subquery(
+        Product.objects.filter(collection=OuterRef('pk')).order_by()
+        .values('collection').annotate(count=Count('pk')).values('count')), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0003_productsearchterm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collection',
+            name='product_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_products, migrations.RunPython.noop),
+    ]
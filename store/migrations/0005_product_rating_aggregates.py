@@ -0,0 +1,79 @@
+# Generated by Django 4.1.7 on 2026-10-17 06:00
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def aggregate_ratings(apps, schema_editor):
+    Product = apps.get_model('store', 'Product')
+    Review = apps.get_model('store', 'Review')
+    products = {}
+    rows = Review.objects.order_by().values('product_id', 'rate') \
+        .annotate(count=Count('pk'))
+    for row in rows:
+        product = products.setdefault(
+            row['product_id'], Product(pk=row['product_id']))
+        setattr(product, f"rating_{row['rate']}", row['count'])
+        product.rating_count = (product.rating_count or 0) + row['count']
+        product.rating_sum = (product.rating_sum or 0) + row['rate'] * row['count']
+    for product in products.values():
+        product.rating_average = (
+            Decimal(product.rating_sum) / product.rating_count).quantize(Decimal('0.01'))
+    Product.objects.bulk_update(
+        products.values(),
+        ['rating_count', 'rating_sum', 'rating_average', 'rating_1',
+         'rating_2', 'rating_3', 'rating_4', 'rating_5'],
+        batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0004_collection_product_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='rating_1',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_2',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_3',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_4',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_5',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_average',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=3),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(aggregate_ratings, migrations.RunPython.noop),
+    ]
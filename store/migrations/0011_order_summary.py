@@ -0,0 +1,41 @@
+# Generated by Django 4.1.7 on 2026-10-17 06:37
+
+from django.db import migrations, models
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def summarize_orders(apps, schema_editor):
+    Order = apps.get_model('store', 'Order')
+    OrderItem = apps.get_model('store', 'OrderItem')
+    items = OrderItem.objects.filter(order=OuterRef('pk')).order_by() \
+        .values('order')
+    Order.objects.update(
+        item_count=Coalesce(Subquery(
+            items.annotate(count=Sum('quantity')).values('count')), 0),
+        total_price=Coalesce(Subquery(
+            items.annotate(total=Sum(F('quantity') * F('unit_price'),
+                                     output_field=DecimalField()))
+            .values('total')), 0, output_field=DecimalField()),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0010_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='total_price',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.RunPython(summarize_orders, migrations.RunPython.noop),
+    ]
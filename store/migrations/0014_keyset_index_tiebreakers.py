@@ -0,0 +1,29 @@
+# Generated by Django 4.1.7 on 2026-10-17 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0013_recommendations'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='order_customer_placed_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='review',
+            name='review_product_date_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['customer', '-placed_at', '-id'], name='order_customer_placed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['product', '-date', '-id'], name='review_product_date_idx'),
+        ),
+    ]
@@ -1,6 +1,11 @@
-from django.db import models
+from collections import Counter
+
+from django.db import connections, models, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 from uuid import uuid4
@@ -10,23 +15,93 @@ from uuid import uuid4
 class User(AbstractUser):
     email = models.EmailField(unique=True)
 
+    class Meta(AbstractUser.Meta):
+        # Customer listings are ordered by the user's name.
+        indexes = [models.Index(fields=['first_name', 'last_name'],
+                                name='user_name_idx')]
+
 
 class Promotion(models.Model):
     description = models.CharField(max_length=255)
     discount = models.FloatField()
 
 
+class CollectionQuerySet(models.QuerySet):
+    def adjust_product_count(self, deltas):
+        # Rows are updated in id order so concurrent writers lock them in
+        # the same sequence.
+        for collection_id in sorted(pk for pk in deltas if pk is not None):
+            delta = deltas[collection_id]
+            if delta:
+                self.filter(pk=collection_id).update(
+                    product_count=F('product_count') + delta)
+
+    def reconcile_product_count(self):
+        counted = Coalesce(Subquery(
+            Product.objects.filter(collection=OuterRef('pk')).order_by()
+            .values('collection').annotate(count=Count('pk')).values('count')), 0)
+        drifted = list(self.exclude(product_count=counted)
+                       .values_list('pk', flat=True))
+        if drifted:
+            Collection.objects.filter(pk__in=drifted).update(
+                product_count=counted)
+        return drifted
+
+
 class Collection(models.Model):
     title = models.CharField(max_length=255)
     featured_product = models.ForeignKey(
         'Product', on_delete=models.SET_NULL, null=True,
         related_name='feature_product_collection', blank=True)
+    product_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = CollectionQuerySet.as_manager()
 
     def __str__(self) -> str:
         return self.title
 
     class Meta:
         ordering = ['title']
+        indexes = [models.Index(fields=['title'], name='collection_title_idx')]
+
+
+class ProductQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        with transaction.atomic(using=self.db):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            collections = Counter(obj.collection_id for obj in objs)
+            if kwargs.get('ignore_conflicts') or kwargs.get('update_conflicts'):
+                Collection.objects.filter(
+                    pk__in=collections).reconcile_product_count()
+            else:
+                Collection.objects.adjust_product_count(collections)
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        if 'collection' not in fields and 'collection_id' not in fields:
+            return super().bulk_update(objs, fields, *args, **kwargs)
+        with transaction.atomic(using=self.db):
+            affected = set(self.filter(pk__in=[obj.pk for obj in objs])
+                           .order_by().values_list('collection_id', flat=True))
+            rows = super().bulk_update(objs, fields, *args, **kwargs)
+            affected.update(obj.collection_id for obj in objs)
+            Collection.objects.filter(pk__in=affected).reconcile_product_count()
+            ProductSales.objects.filter(collection__in=affected).reconcile_collection()
+        return rows
+
+    def update(self, **kwargs):
+        if 'collection' not in kwargs and 'collection_id' not in kwargs:
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            affected = set(self.order_by().values_list('collection_id', flat=True))
+            rows = super().update(**kwargs)
+            collection = kwargs.get('collection', kwargs.get('collection_id'))
+            if not hasattr(collection, 'resolve_expression'):
+                # bulk_update() passes a Case(); it reconciles on its own.
+                affected.add(getattr(collection, 'pk', collection))
+            Collection.objects.filter(pk__in=affected).reconcile_product_count()
+            ProductSales.objects.filter(collection__in=affected).reconcile_collection()
+        return rows
 
 
 class Product(models.Model):
@@ -42,18 +117,82 @@ class Product(models.Model):
     collection = models.ForeignKey(
         Collection, on_delete=models.PROTECT, related_name='products')
     promotions = models.ManyToManyField(Promotion, blank=True)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+    rating_average = models.DecimalField(
+        max_digits=3, decimal_places=2, default=0, editable=False)
+    rating_1 = models.PositiveIntegerField(default=0, editable=False)
+    rating_2 = models.PositiveIntegerField(default=0, editable=False)
+    rating_3 = models.PositiveIntegerField(default=0, editable=False)
+    rating_4 = models.PositiveIntegerField(default=0, editable=False)
+    rating_5 = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = ProductQuerySet.as_manager()
 
     def __str__(self) -> str:
         return self.title + "   ...... id : " + str(self.id)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_collection_id = instance.__dict__.get('collection_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        # post_save handlers keep collection counters in sync, so they run
+        # inside the same transaction as the row write.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        self._loaded_collection_id = self.collection_id
+
     class Meta:
         ordering = ['title']
+        # The pk is the tie-breaker of keyset pages and stable orderings.
+        indexes = [
+            models.Index(fields=['title', 'id'], name='product_title_idx'),
+            models.Index(fields=['unit_price', 'id'], name='product_price_idx'),
+            models.Index(fields=['collection', 'title', 'id'],
+                         name='product_collection_title_idx'),
+        ]
+
+
+class ProductSearchTerm(models.Model):
+    term = models.CharField(max_length=64)
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name='search_terms')
+    weight = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = [['term', 'product']]
+
+
+class TaxRate(models.Model):
+    """
+    Tax rate of a region, optionally overridden per collection. A row
+    without a collection is the region's rate for every other collection.
+    """
+    region = models.CharField(max_length=16)
+    collection = models.ForeignKey(
+        Collection, on_delete=models.CASCADE, null=True, blank=True,
+        related_name='tax_rates')
+    rate = models.DecimalField(
+        max_digits=5, decimal_places=4,
+        validators=[MinValueValidator(0), MaxValueValidator(1)])
+
+    def __str__(self) -> str:
+        return f'{self.region} {self.collection or "*"}: {self.rate}'
+
+    class Meta:
+        unique_together = [['region', 'collection']]
 
 
 class ProductImage(models.Model):
     product = models.ForeignKey(
         Product, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to='store/images', null=True, blank=True)
+    # {name: {'name': storage path, 'width': px, 'height': px}} of the
+    # resized WebP copies made by store.renditions.
+    renditions = models.JSONField(default=dict, blank=True)
 
 
 class Customer(models.Model):
@@ -80,6 +219,21 @@ class Customer(models.Model):
         ordering = ['user__first_name', 'user__last_name']
 
 
+class OrderQuerySet(models.QuerySet):
+    def summarize(self):
+        """Recompute item_count and total_price from the order items."""
+        items = OrderItem.objects.filter(order=OuterRef('pk')).order_by() \
+            .values('order')
+        return self.update(
+            item_count=Coalesce(Subquery(
+                items.annotate(count=Sum('quantity')).values('count')), 0),
+            total_price=Coalesce(Subquery(
+                items.annotate(total=Sum(F('quantity') * F('unit_price'),
+                                         output_field=models.DecimalField()))
+                .values('total')), 0, output_field=models.DecimalField()),
+        )
+
+
 class Order(models.Model):
     PAYMENT_STATUS_PENDING = 'P'
     PAYMENT_STATUS_COMPLETE = 'C'
@@ -95,11 +249,31 @@ class Order(models.Model):
         max_length=1, choices=PAYMENT_STATUS_CHOICES, default=PAYMENT_STATUS_PENDING)
     customer = models.ForeignKey(
         Customer, on_delete=models.PROTECT, related_name='orders')
+    # Summary written at checkout so order history needs no item rows.
+    item_count = models.PositiveIntegerField(default=0)
+    total_price = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    objects = OrderQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        # post_save handlers move the order between the sales rollups, so
+        # they run inside the same transaction as the row write (without a
+        # savepoint: checkout already runs in one).
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
 
     class Meta:
         permissions = [
             ('cancel_order', 'Can cancel order')
         ]
+        indexes = [
+            # Order history pages on (placed_at, id), so the index ends in
+            # the keyset tie-breaker too.
+            models.Index(fields=['customer', '-placed_at', '-id'],
+                         name='order_customer_placed_idx'),
+            models.Index(fields=['payment_status', '-placed_at'],
+                         name='order_status_placed_idx'),
+        ]
 
 
 class OrderItem(models.Model):
@@ -118,10 +292,90 @@ class Address(models.Model):
         Customer, on_delete=models.CASCADE)
 
 
+class CartQuerySet(models.QuerySet):
+    def with_totals(self):
+        """Annotate item_count and total_price, summed by the database."""
+        return self.annotate(
+            item_count=Coalesce(Sum('items__quantity'), 0),
+            total_price=Coalesce(
+                Sum(F('items__quantity') * F('items__product__unit_price'),
+                    output_field=models.DecimalField()),
+                0, output_field=models.DecimalField()),
+        )
+
+
 class Cart(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = CartQuerySet.as_manager()
+
+
+class CartItemQuerySet(models.QuerySet):
+    def priced(self):
+        """
+        Lines with just the product columns they are rendered with and
+        their total_price computed by the database.
+        """
+        return self.select_related('product') \
+            .only('cart_id', 'quantity', 'product__title', 'product__unit_price') \
+            .annotate(total_price=models.ExpressionWrapper(
+                F('quantity') * F('product__unit_price'),
+                output_field=models.DecimalField()))
+
+    def add_items(self, cart_id, quantities):
+        """
+        Add `quantities` ({product_id: quantity}) to a cart with a single
+        INSERT ... SELECT that increments existing lines on conflict.
+
+        Lines whose product (or cart) does not exist are silently skipped;
+        the returned items tell which lines were written.
+        """
+        if not quantities:
+            return []
+        connection = connections[self.db]
+        ops = connection.ops
+        table = ops.quote_name(self.model._meta.db_table)
+        cart_table = ops.quote_name(Cart._meta.db_table)
+        product_table = ops.quote_name(Product._meta.db_table)
+        product_ids = ', '.join(str(int(pk)) for pk in quantities)
+        quantity_case = ' '.join(
+            f'WHEN {int(pk)} THEN {int(quantity)}'
+            for pk, quantity in quantities.items())
+
+        select = (
+            f'SELECT c.id AS cart_id, p.id AS product_id, '
+            f'CASE p.id {quantity_case} END AS quantity '
+            f'FROM {cart_table} c, {product_table} p '
+            f'WHERE c.id = %s AND p.id IN ({product_ids})')
+        if connection.vendor == 'mysql':
+            sql = (
+                f'INSERT INTO {table} (cart_id, product_id, quantity) '
+                f'SELECT * FROM ({select}) AS new '
+                f'ON DUPLICATE KEY UPDATE quantity = {table}.quantity + new.quantity')
+        else:
+            sql = (
+                f'INSERT INTO {table} (cart_id, product_id, quantity) {select} '
+                f'ON CONFLICT (cart_id, product_id) '
+                f'DO UPDATE SET quantity = {table}.quantity + excluded.quantity')
+
+        cart_value = Cart._meta.pk.get_db_prep_value(cart_id, connection)
+        returning = connection.features.can_return_columns_from_insert
+        if returning:
+            sql += ' RETURNING id, product_id, quantity'
+
+        with transaction.atomic(using=self.db), connection.cursor() as cursor:
+            cursor.execute(sql, [cart_value])
+            if returning:
+                rows = cursor.fetchall()
+            else:
+                rows = list(self.filter(cart_id=cart_id, product_id__in=quantities)
+                            .values_list('id', 'product_id', 'quantity'))
+        return [
+            self.model(id=pk, cart_id=cart_id, product_id=product_id, quantity=quantity)
+            for pk, product_id, quantity in rows
+        ]
+
 
 class CartItem(models.Model):
     cart = models.ForeignKey(
@@ -131,6 +385,8 @@ class CartItem(models.Model):
         validators=[MinValueValidator(1)]
     )
 
+    objects = CartItemQuerySet.as_manager()
+
     class Meta:
         unique_together = [['cart', 'product']]
 
@@ -148,3 +404,144 @@ class Review(models.Model):
 
     def __str__(self) -> str:
         return self.description + ", product_id = " + str(self.product_id)
+
+    class Meta:
+        # Includes the keyset pagination tie-breaker.
+        indexes = [models.Index(fields=['product', '-date', '-id'],
+                                name='review_product_date_idx')]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = (
+            instance.__dict__.get('product_id'), instance.__dict__.get('rate'))
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Product rating aggregates are updated by post_save handlers.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        self._loaded_rating = (self.product_id, self.rate)
+
+
+class IdempotencyKey(models.Model):
+    key = models.CharField(max_length=64, unique=True)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True)
+    response_body = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+
+class Job(models.Model):
+    """
+    A queued call of a `store.jobs` task. `run_at` is when it is next due;
+    a worker that claims a job pushes it out by the lease time, so a job
+    whose worker died is picked up again once the lease expires.
+    """
+    name = models.CharField(max_length=255)
+    payload = models.JSONField(default=dict)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now, db_index=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f'{self.name} #{self.pk}'
+
+
+class DeadJob(models.Model):
+    """A job that failed `max_attempts` times, kept for inspection or requeueing."""
+    name = models.CharField(max_length=255)
+    payload = models.JSONField(default=dict)
+    attempts = models.PositiveSmallIntegerField()
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+    failed_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self) -> str:
+        return f'{self.name} #{self.pk}'
+
+
+class DailySales(models.Model):
+    """Orders placed on a day, by their current payment status."""
+    date = models.DateField()
+    payment_status = models.CharField(
+        max_length=1, choices=Order.PAYMENT_STATUS_CHOICES)
+    # Plain integers: a status change decrements the old bucket, which
+    # may predate the rollups until they are backfilled.
+    orders = models.IntegerField(default=0)
+    units = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        unique_together = [['date', 'payment_status']]
+
+
+class DailyProductSales(models.Model):
+    date = models.DateField()
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name='daily_sales')
+    units = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        unique_together = [['date', 'product']]
+
+
+class DailyCollectionSales(models.Model):
+    """Sales by the collection the product was in when it was ordered."""
+    date = models.DateField()
+    collection = models.ForeignKey(
+        Collection, on_delete=models.CASCADE, related_name='daily_sales')
+    units = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        unique_together = [['date', 'collection']]
+
+
+class ProductPair(models.Model):
+    """How many orders had both products; stored once in each direction."""
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name='pairs')
+    related = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name='+')
+    orders = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = [['product', 'related']]
+        indexes = [
+            models.Index(fields=['product', '-orders'], name='product_pair_rank_idx'),
+        ]
+
+
+class ProductSalesQuerySet(models.QuerySet):
+    def reconcile_collection(self):
+        """Move rows whose product changed collection to its current one."""
+        current = Subquery(Product.objects.filter(pk=OuterRef('product_id'))
+                           .values('collection_id'))
+        return self.exclude(collection_id=current).update(collection_id=current)
+
+
+class ProductSales(models.Model):
+    """Units sold of a product, ranked within its current collection."""
+    product = models.OneToOneField(
+        Product, on_delete=models.CASCADE, primary_key=True, related_name='sales')
+    collection = models.ForeignKey(
+        Collection, on_delete=models.CASCADE, related_name='+')
+    units = models.PositiveIntegerField(default=0)
+
+    objects = ProductSalesQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['collection', '-units'], name='product_sales_rank_idx'),
+        ]
+
+
+class Watermark(models.Model):
+    """The last row a batch job has processed, so its next run resumes there."""
+    name = models.CharField(max_length=50, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
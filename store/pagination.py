@@ -1,5 +1,213 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    Keeps the microseconds DjangoJSONEncoder drops from datetimes, so a
+    cursor seeks from exactly the last row and skips none of its ties.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Seek-based pagination over the view ordering plus a `pk` tie-breaker.
+
+    Pages are fetched with `WHERE (ordering) > (last row)` instead of an
+    OFFSET and no total count is computed, so every page costs the same.
+    Ordering fields must be non-nullable.
+    """
+    page_size = 10
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        cursor = self.decode_cursor(request, queryset)
+        reverse = cursor is not None and cursor['reverse']
+        queryset = queryset.order_by(
+            *[self._flip(field) if reverse else field for field in self.ordering])
+        if cursor is not None:
+            queryset = queryset.filter(
+                self.get_keyset_filter(cursor['position'], reverse))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        return self.page
+
+    def iterate_queryset(self, queryset, request, view=None, chunk_size=None):
+        """
+        Yield every row of the queryset, reading it a keyset page at a
+        time. Unlike iterator(), which mysqlclient buffers in full, only
+        one page is ever held in memory.
+        """
+        self.ordering = self.get_ordering(request, queryset, view)
+        queryset = queryset.order_by(*self.ordering)
+        chunk_size = chunk_size or self.page_size
+        page = list(queryset[:chunk_size])
+        while page:
+            yield from page
+            if len(page) < chunk_size:
+                return
+            position = [self._value(page[-1], field.lstrip('-'))
+                        for field in self.ordering]
+            page = list(queryset.filter(
+                self.get_keyset_filter(position, False))[:chunk_size])
+
+    def get_ordering(self, request, queryset, view):
+        ordering = None
+        for backend in getattr(view, 'filter_backends', []):
+            if hasattr(backend, 'get_ordering'):
+                ordering = backend().get_ordering(request, queryset, view)
+                if ordering:
+                    break
+        if not ordering:
+            ordering = getattr(view, 'ordering', None)
+        if not ordering:
+            ordering = queryset.query.order_by or queryset.model._meta.ordering
+        if isinstance(ordering, str):
+            ordering = [ordering]
+
+        ordering = [field for field in ordering if isinstance(field, str)]
+        if not ordering:
+            ordering = ['pk']
+        pk_name = queryset.model._meta.pk.name
+        if not any(field.lstrip('-') in ('pk', pk_name) for field in ordering):
+            ordering.append('-pk' if ordering[0].startswith('-') else 'pk')
+        return ordering
+
+    def get_keyset_filter(self, position, reverse):
+        condition, prefix = Q(), Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            lookup = 'lt' if descending else 'gt'
+            condition |= prefix & Q(**{f'{name}__{lookup}': value})
+            prefix &= Q(**{name: value})
+        return condition
+
+    def decode_cursor(self, request, queryset):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            position = cursor['p']
+            reverse = bool(cursor['r'])
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        # Values of the wrong type (e.g. a cursor kept across an ?ordering
+        # change) would otherwise fail in the query.
+        try:
+            position = [
+                self.get_ordering_field(queryset, field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, position)]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if None in position:
+            raise NotFound(self.invalid_cursor_message)
+        return {'position': position, 'reverse': reverse}
+
+    def get_ordering_field(self, queryset, name):
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        model = queryset.model
+        *path, name = name.split('__')
+        for part in path:
+            model = model._meta.get_field(part).related_model
+        if name == 'pk':
+            return model._meta.pk
+        return model._meta.get_field(name)
+
+    def encode_cursor(self, obj, reverse):
+        position = [self._value(obj, field.lstrip('-'))
+                    for field in self.ordering]
+        data = json.dumps({'p': position, 'r': int(reverse)},
+                          cls=CursorEncoder, separators=(',', ':'))
+        encoded = urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def _flip(self, field):
+        return field[1:] if field.startswith('-') else '-' + field
+
+    def _value(self, obj, name):
+        for attr in name.split('__'):
+            obj = getattr(obj, attr)
+        return obj
+
+
+class ReviewPagination(KeysetPagination):
+    page_size = 20
+
+
+class OrderPagination(KeysetPagination):
+    page_size = 20
 
 
 class DefaultPagination(PageNumberPagination):
     page_size = 10
+    keyset_class = KeysetPagination
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,47 @@
+import codecs
+import csv
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class CSVParser(BaseParser):
+    """
+    Parses a CSV body with a header row into a lazy iterator of dicts, so
+    large uploads are never held in memory at once. Empty cells are left
+    out of the row.
+    """
+    media_type = 'text/csv'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        lines = codecs.getreader(encoding)(stream)
+        try:
+            for row in csv.DictReader(lines):
+                yield {field: value for field, value in row.items()
+                       if field and value not in (None, '')}
+        except (csv.Error, UnicodeDecodeError) as exc:
+            raise ParseError(f'CSV parse error - {exc}')
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses one JSON document per line into a lazy iterator. A line that
+    is not valid JSON yields a `ParseError` in its place.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            for line in codecs.getreader(encoding)(stream):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as exc:
+                    yield ParseError(f'JSON parse error - {exc}')
+        except UnicodeDecodeError as exc:
+            raise ParseError(f'NDJSON parse error - {exc}')
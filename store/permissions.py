@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.utils.crypto import constant_time_compare
 from rest_framework import permissions
 from .models import Review
 
@@ -14,3 +16,10 @@ class IsReviewerOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
         return bool(obj.reviewer.id == request.user.id)
+
+
+class HasMetricsToken(permissions.BasePermission):
+    def has_permission(self, request, view):
+        token = getattr(settings, 'STORE_METRICS_TOKEN', None)
+        supplied = request.headers.get('X-Metrics-Token', '')
+        return bool(token) and constant_time_compare(supplied, token)
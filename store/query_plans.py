@@ -0,0 +1,191 @@
+"""
+Representative queries of the store endpoints, checked with EXPLAIN by
+the `explain_queries` command so a missing index shows up as a full
+table scan.
+"""
+import json
+import re
+
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from . import search, views
+from .models import (CartItem, Customer, DailyCollectionSales, DailyProductSales,
+                     DailySales, Job, Order, ProductPair, ProductSales, User)
+
+PLANS = {}
+
+
+def plan(name, allow_scans=(), seek_only=False):
+    """
+    Register a function returning the queryset to check. `allow_scans`
+    names tables a full scan of is expected (e.g. tiny lookup tables).
+    With `seek_only`, walking a whole index counts as a full scan too.
+    """
+    def register(factory):
+        PLANS[name] = (factory, set(allow_scans), seek_only)
+        return factory
+    return register
+
+
+def first_page(view_class, params=None, user=None, **kwargs):
+    """
+    The first page query of a keyset-paginated list view, built from its
+    own get_queryset(), filter backends and paginator ordering.
+    """
+    request = APIRequestFactory().get('/', params or {})
+    if user is not None:
+        force_authenticate(request, user)
+    view = view_class()
+    view.setup(request, **kwargs)
+    view.request = view.initialize_request(request, **kwargs)
+    view.format_kwarg = None
+    queryset = view.filter_queryset(view.get_queryset())
+    paginator = view.paginator
+    ordering = paginator.get_ordering(view.request, queryset, view)
+    return queryset.order_by(*ordering)[:paginator.page_size + 1]
+
+
+@plan('product-list')
+def product_list():
+    return views.ProductList.queryset[:10]
+
+
+@plan('product-list-by-price')
+def product_list_by_price():
+    return views.ProductList.queryset.filter(unit_price__gt=10) \
+        .order_by('unit_price', 'id')[:10]
+
+
+@plan('product-list-by-collection')
+def product_list_by_collection():
+    return views.ProductList.queryset.filter(collection_id=1)[:10]
+
+
+@plan('product-search', seek_only=True)
+def product_search():
+    # Runs on every keystroke; the prefix match must seek the term index.
+    return search.search_products(views.ProductList.queryset, 'bread whe')[:10]
+
+
+@plan('product-detail')
+def product_detail():
+    return views.ProductDetail.queryset.filter(pk=1)
+
+
+@plan('collection-list')
+def collection_list():
+    return views.CollectionList.queryset
+
+
+@plan('product-review-list')
+def product_review_list():
+    return first_page(views.ProductReviewList, {'min_rate': 4}, pk=1)
+
+
+@plan('product-related')
+def product_related():
+    return ProductPair.objects.filter(product_id=1).select_related('related') \
+        .order_by('-orders')[:10]
+
+
+@plan('collection-bestsellers')
+def collection_bestsellers():
+    return ProductSales.objects.filter(collection_id=1).select_related('product') \
+        .order_by('-units')[:10]
+
+
+@plan('cart-detail')
+def cart_detail():
+    return CartItem.objects.filter(cart_id='00000000000000000000000000000000').priced()
+
+
+@plan('customer-list')
+def customer_list():
+    return Customer.objects.select_related('user')
+
+
+@plan('order-list')
+def order_list():
+    return first_page(views.OrderList, user=User(pk=1))
+
+
+@plan('orders-by-payment-status')
+def orders_by_payment_status():
+    return Order.objects.filter(
+        payment_status=Order.PAYMENT_STATUS_PENDING).order_by('-placed_at')[:10]
+
+
+@plan('sales-report-days')
+def sales_report_days():
+    return DailySales.objects.filter(date__range=('2024-01-01', '2024-01-31'))
+
+
+@plan('sales-report-products')
+def sales_report_products():
+    return DailyProductSales.objects.filter(date__range=('2024-01-01', '2024-01-31')) \
+        .values('product_id').annotate(revenue=Sum('revenue')).order_by('-revenue')[:10]
+
+
+@plan('sales-report-collections')
+def sales_report_collections():
+    return DailyCollectionSales.objects.filter(date__range=('2024-01-01', '2024-01-31')) \
+        .values('collection_id').annotate(revenue=Sum('revenue'))
+
+
+@plan('job-claim')
+def job_claim():
+    return Job.objects.filter(run_at__lte=timezone.now()).order_by('run_at')[:10]
+
+
+def explain(queryset):
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            # On small tables the planner prefers a sequential scan even
+            # when an index exists; only report scans it has no choice on.
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        if connection.vendor == 'mysql':
+            return queryset.explain(format='json')
+        return queryset.explain()
+
+
+def _mysql_full_scans(node, access_types):
+    if isinstance(node, dict):
+        if node.get('access_type') in access_types:
+            yield node['table_name']
+        for value in node.values():
+            yield from _mysql_full_scans(value, access_types)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _mysql_full_scans(value, access_types)
+
+
+def full_scans(output, seek_only=False):
+    """
+    Tables an EXPLAIN output of the current backend reads in full, and
+    with `seek_only` also those it reads by walking a whole index.
+    """
+    if connection.vendor == 'sqlite':
+        if seek_only:
+            return re.findall(r'\bSCAN (\w+)', output)
+        # `SCAN t` without `USING ... INDEX`; indexed scans walk an index in order.
+        return re.findall(r'\bSCAN (\w+)(?! USING)(?:\s|$)', output)
+    if connection.vendor == 'postgresql':
+        return re.findall(r'Seq Scan on (\w+)', output)
+    if connection.vendor == 'mysql':
+        access_types = ('ALL', 'index') if seek_only else ('ALL',)
+        return list(_mysql_full_scans(json.loads(output), access_types))
+    return []
+
+
+def check(names=None):
+    """Yield `(name, plan output, unexpected full scans)` for every plan."""
+    for name, (factory, allowed, seek_only) in PLANS.items():
+        if names and name not in names:
+            continue
+        output = explain(factory())
+        scans = sorted(set(full_scans(output, seek_only)) - allowed)
+        yield name, output, scans
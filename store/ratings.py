@@ -0,0 +1,89 @@
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from . import cache
+from .models import Product, Review
+
+RATES = range(1, 6)
+HISTOGRAM_FIELDS = [f'rating_{rate}' for rate in RATES]
+RATING_FIELDS = ['rating_count', 'rating_sum', 'rating_average',
+                 *HISTOGRAM_FIELDS]
+
+
+def summarize(rating_count, rating_sum, histogram):
+    values = {
+        'rating_count': rating_count,
+        'rating_sum': rating_sum,
+        'rating_average': Decimal(0),
+        **dict(zip(HISTOGRAM_FIELDS, histogram)),
+    }
+    if rating_count:
+        values['rating_average'] = (
+            Decimal(rating_sum) / rating_count).quantize(Decimal('0.01'))
+    return values
+
+
+def update_rating(product_id, added=(), removed=()):
+    """
+    Apply added/removed review rates to the stored aggregates of a product.
+    The product row is locked, so concurrent reviews are applied in turn.
+    """
+    with transaction.atomic():
+        product = Product.objects.select_for_update().filter(pk=product_id) \
+            .only('collection_id', 'rating_count', 'rating_sum',
+                  *HISTOGRAM_FIELDS).first()
+        if product is None:
+            return
+
+        rating_count, rating_sum = product.rating_count, product.rating_sum
+        histogram = [getattr(product, field) for field in HISTOGRAM_FIELDS]
+        changes = [(rate, 1) for rate in added] + [(rate, -1) for rate in removed]
+        for rate, sign in changes:
+            if rate not in RATES:
+                continue
+            rating_count += sign
+            rating_sum += sign * rate
+            histogram[rate - 1] += sign
+
+        Product.objects.filter(pk=product_id).update(
+            last_update=timezone.now(),
+            **summarize(rating_count, rating_sum, histogram))
+    cache.bump_product(product_id, product.collection_id)
+
+
+def rebuild_ratings(chunk_size=1000):
+    """Recompute the aggregates of every product from store_review."""
+    # executemany() of a plain UPDATE is far cheaper than bulk_update()'s
+    # CASE WHEN per column on large catalogs.
+    table = connection.ops.quote_name(Product._meta.db_table)
+    assignments = ', '.join(
+        f'{connection.ops.quote_name(field)} = %s' for field in RATING_FIELDS)
+    sql = f'UPDATE {table} SET {assignments} WHERE id = %s'
+
+    products = Product.objects.order_by('pk').values_list('pk', flat=True)
+    last_pk = 0
+    while True:
+        chunk = list(products.filter(pk__gt=last_pk)[:chunk_size])
+        if not chunk:
+            return
+        histograms = {}
+        rows = Review.objects.filter(product_id__in=chunk).order_by() \
+            .values('product_id', 'rate').annotate(count=Count('pk'))
+        for row in rows:
+            histogram = histograms.setdefault(row['product_id'], [0] * len(RATES))
+            histogram[row['rate'] - 1] = row['count']
+
+        params = []
+        for pk in chunk:
+            histogram = histograms.get(pk, [0] * len(RATES))
+            values = summarize(
+                sum(histogram),
+                sum(rate * count for rate, count in zip(RATES, histogram)),
+                histogram)
+            params.append([values[field] for field in RATING_FIELDS] + [pk])
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(sql, params)
+        last_pk = chunk[-1]
@@ -0,0 +1,97 @@
+"""
+"Frequently bought together" counts and per-collection bestsellers,
+folded in from the order lines by the `build_recommendations` batch so
+the related and bestseller endpoints read a few indexed rows.
+"""
+from collections import Counter, defaultdict
+from datetime import timedelta
+from itertools import permutations
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from . import cache
+from .models import Order, OrderItem, ProductPair, ProductSales, Watermark
+from .rollups import upsert_increment
+
+WATERMARK = 'recommendations'
+# Batches stop at the first order younger than this, so one whose
+# checkout committed after a newer order's is not passed by the watermark.
+SETTLE_TIME = timedelta(
+    seconds=getattr(settings, 'STORE_RECOMMENDATIONS_SETTLE_SECONDS', 5 * 60))
+# Pairs grow with the square of an order's products; bigger (bulk)
+# orders only count towards the bestsellers.
+MAX_PAIRED_PRODUCTS = getattr(settings, 'STORE_RECOMMENDATIONS_MAX_PAIRED_PRODUCTS', 50)
+# Browser/CDN lifetime of the responses; they only change when the batch runs.
+MAX_AGE = getattr(settings, 'STORE_RECOMMENDATIONS_MAX_AGE', 5 * 60)
+
+
+def update_batch(batch_size=1000, now=None):
+    """
+    Fold the next `batch_size` orders past the watermark into the counts
+    and move the watermark past them. Returns how many orders were read.
+    """
+    cutoff = (now or timezone.now()) - SETTLE_TIME
+    with transaction.atomic():
+        watermark, _ = Watermark.objects.select_for_update() \
+            .get_or_create(name=WATERMARK)
+        orders = Order.objects.filter(pk__gt=watermark.value)
+        # placed_at is set before the pk, so pk and placed_at orders can
+        # disagree: stop at the first unsettled order rather than skip it.
+        unsettled = orders.filter(placed_at__gt=cutoff) \
+            .aggregate(pk=Min('pk'))['pk']
+        if unsettled is not None:
+            orders = orders.filter(pk__lt=unsettled)
+        order_ids = list(orders.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not order_ids:
+            return 0
+
+        baskets, units, collections = defaultdict(set), Counter(), {}
+        for order_id, product_id, quantity, collection_id in OrderItem.objects \
+                .filter(order_id__gt=watermark.value, order_id__lte=order_ids[-1]) \
+                .values_list('order_id', 'product_id', 'quantity',
+                             'product__collection_id'):
+            baskets[order_id].add(product_id)
+            units[product_id] += quantity
+            collections[product_id] = collection_id
+        pairs = Counter()
+        for basket in baskets.values():
+            if len(basket) <= MAX_PAIRED_PRODUCTS:
+                pairs.update(permutations(basket, 2))
+
+        upsert_increment(ProductPair, ['product', 'related'], [
+            {'product': product_id, 'related': related_id, 'orders': orders}
+            for (product_id, related_id), orders in pairs.items()])
+        upsert_increment(ProductSales, ['product'], [
+            {'product': product_id, 'collection': collections[product_id],
+             'units': count}
+            for product_id, count in units.items()], replace=['collection'])
+
+        watermark.value = order_ids[-1]
+        watermark.save()
+        cache.bump_recommendations({product_id for product_id, _ in pairs},
+                                   set(collections.values()))
+    return len(order_ids)
+
+
+def update(batch_size=1000, progress=None):
+    """Fold in every settled order past the watermark, a batch at a time."""
+    processed = 0
+    while True:
+        batch = update_batch(batch_size)
+        if not batch:
+            return processed
+        processed += batch
+        if progress is not None:
+            progress(processed)
+
+
+def reset():
+    """Drop the counts and the watermark, so the next update starts over."""
+    with transaction.atomic():
+        ProductPair.objects.all().delete()
+        ProductSales.objects.all().delete()
+        Watermark.objects.filter(name=WATERMARK).delete()
+        transaction.on_commit(lambda: cache.bump_version('recommendations'))
@@ -0,0 +1,53 @@
+import csv
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+class CSVStreamRenderer(BaseRenderer):
+    """
+    Renders an iterable of flat dicts as CSV lines one at a time; list
+    values are joined with spaces.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Only reached for error responses, which are a single dict.
+        if not isinstance(data, dict):
+            return b''
+        return ''.join(self.stream(list(data), [data])).encode(self.charset)
+
+    def stream(self, fields, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(fields)
+        for row in rows:
+            yield writer.writerow([self._cell(row.get(field)) for field in fields])
+
+    def _cell(self, value):
+        if isinstance(value, (list, tuple)):
+            return ' '.join(str(item) for item in value)
+        return '' if value is None else value
+
+
+class NDJSONStreamRenderer(BaseRenderer):
+    """Renders an iterable of dicts as one JSON document per line."""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return ''.join(self.stream(None, [data])).encode(self.charset)
+
+    def stream(self, fields, rows):
+        for row in rows:
+            yield json.dumps(row, cls=JSONEncoder, separators=(',', ':')) + '\n'
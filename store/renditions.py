@@ -0,0 +1,55 @@
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+from . import cache
+from .models import Product, ProductImage
+
+# Bounding boxes; images are scaled down to fit, never up.
+SIZES = getattr(settings, 'STORE_IMAGE_RENDITIONS', {
+    'thumbnail': (160, 160),
+    'card': (480, 480),
+    'full': (1600, 1600),
+})
+QUALITY = getattr(settings, 'STORE_IMAGE_RENDITION_QUALITY', 80)
+PATH = 'store/images/renditions'
+
+
+def render(image, size):
+    """Return `image` fitted into `size` as WebP bytes, with its dimensions."""
+    image = image.copy()
+    image.thumbnail(size, Image.LANCZOS)
+    buffer = BytesIO()
+    image.save(buffer, 'WEBP', quality=QUALITY, method=4)
+    return buffer.getvalue(), image.size
+
+
+def generate(product_image):
+    """Write every rendition of a ProductImage and record them on it."""
+    with product_image.image.open('rb') as f:
+        source = ImageOps.exif_transpose(Image.open(f))
+        source = source.convert('RGBA' if source.mode in ('RGBA', 'LA', 'P') else 'RGB')
+    delete(product_image.renditions)
+
+    renditions = {}
+    for name, size in SIZES.items():
+        content, (width, height) = render(source, size)
+        path = default_storage.save(
+            f'{PATH}/{product_image.pk}-{name}.webp', ContentFile(content))
+        renditions[name] = {'name': path, 'width': width, 'height': height}
+
+    # update() rather than save(): post_save would queue the job again.
+    ProductImage.objects.filter(pk=product_image.pk).update(renditions=renditions)
+    product_image.renditions = renditions
+    collection_id = Product.objects.filter(pk=product_image.product_id) \
+        .values_list('collection_id', flat=True).first()
+    cache.bump_product(product_image.product_id, collection_id)
+    return renditions
+
+
+def delete(renditions):
+    for rendition in renditions.values():
+        default_storage.delete(rendition['name'])
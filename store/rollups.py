@@ -0,0 +1,186 @@
+"""
+Daily sales rollups, kept up to date by checkout and payment status
+changes so reports never scan the order tables.
+"""
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import (DailyCollectionSales, DailyProductSales, DailySales,
+                     Order, OrderItem, Product)
+
+
+def upsert_increment(model, keys, rows, replace=()):
+    """
+    Add each row's non-key values to the row with the same `keys`,
+    inserting it if there is none, in one executemany() statement.
+    Fields named in `replace` are overwritten instead.
+    """
+    if not rows:
+        return
+    fields = [model._meta.get_field(name) for name in rows[0]]
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    columns = ', '.join(qn(field.column) for field in fields)
+    values = ', '.join(['%s'] * len(fields))
+    updated = [(qn(field.column), field.name in replace)
+               for field in fields if field.name not in keys]
+    if connection.vendor == 'mysql':
+        updates = ', '.join(
+            f'{column} = VALUES({column})' if replaced
+            else f'{column} = {column} + VALUES({column})'
+            for column, replaced in updated)
+        conflict = f'ON DUPLICATE KEY UPDATE {updates}'
+    else:
+        updates = ', '.join(
+            f'{column} = EXCLUDED.{column}' if replaced
+            else f'{column} = {table}.{column} + EXCLUDED.{column}'
+            for column, replaced in updated)
+        targets = ', '.join(qn(model._meta.get_field(name).column) for name in keys)
+        conflict = f'ON CONFLICT ({targets}) DO UPDATE SET {updates}'
+    sql = f'INSERT INTO {table} ({columns}) VALUES ({values}) {conflict}'
+    params = [[field.get_db_prep_save(row[field.name], connection)
+               for field in fields] for row in rows]
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, params)
+
+
+def record_order(order, items):
+    """
+    Add a new order to the rollups. `items` are its OrderItems with
+    `product.collection_id` loaded.
+    """
+    date = timezone.localdate(order.placed_at)
+    products = defaultdict(lambda: [0, Decimal(0)])
+    collections = defaultdict(lambda: [0, Decimal(0)])
+    for item in items:
+        revenue = item.quantity * item.unit_price
+        for totals in (products[item.product_id],
+                       collections[item.product.collection_id]):
+            totals[0] += item.quantity
+            totals[1] += revenue
+
+    upsert_increment(DailySales, ['date', 'payment_status'], [{
+        'date': date, 'payment_status': order.payment_status, 'orders': 1,
+        'units': order.item_count, 'revenue': order.total_price}])
+    upsert_increment(DailyProductSales, ['date', 'product'], [
+        {'date': date, 'product': product_id, 'units': units, 'revenue': revenue}
+        for product_id, (units, revenue) in products.items()])
+    upsert_increment(DailyCollectionSales, ['date', 'collection'], [
+        {'date': date, 'collection': collection_id, 'units': units,
+         'revenue': revenue}
+        for collection_id, (units, revenue) in collections.items()])
+
+
+def move_order(order, old_status):
+    """Move an order from the `old_status` bucket to its current status."""
+    date = timezone.localdate(order.placed_at)
+    upsert_increment(DailySales, ['date', 'payment_status'], [
+        {'date': date, 'payment_status': status, 'orders': sign,
+         'units': sign * order.item_count, 'revenue': sign * order.total_price}
+        for status, sign in ((old_status, -1), (order.payment_status, 1))])
+
+
+def remove_order(order):
+    """
+    Take a deleted order out of the rollups. OrderItem protects its order,
+    so only orders without lines can be deleted and the per-product and
+    per-collection rollups have nothing to take back.
+    """
+    date = timezone.localdate(order.placed_at)
+    upsert_increment(DailySales, ['date', 'payment_status'], [{
+        'date': date, 'payment_status': order.payment_status, 'orders': -1,
+        'units': -order.item_count, 'revenue': -order.total_price}])
+
+
+def rebuild(since=None):
+    """
+    Recompute the rollups from the orders, for every day from `since` on
+    (or all of them), in one transaction.
+    """
+    orders = Order.objects.all()
+    items = OrderItem.objects.all()
+    if since is not None:
+        orders = orders.filter(placed_at__date__gte=since)
+        items = items.filter(order__placed_at__date__gte=since)
+    day = TruncDate('placed_at', tzinfo=timezone.get_current_timezone())
+    item_day = TruncDate('order__placed_at', tzinfo=timezone.get_current_timezone())
+    revenue = Sum(F('quantity') * F('unit_price'))
+
+    with transaction.atomic():
+        for model in (DailySales, DailyProductSales, DailyCollectionSales):
+            stale = model.objects.all()
+            if since is not None:
+                stale = stale.filter(date__gte=since)
+            stale.delete()
+
+        DailySales.objects.bulk_create([
+            DailySales(**row) for row in orders.order_by()
+            .annotate(date=day).values('date', 'payment_status')
+            .annotate(orders=Count('pk'), units=Sum('item_count'),
+                      revenue=Sum('total_price'))])
+        DailyProductSales.objects.bulk_create([
+            DailyProductSales(date=row['date'], product_id=row['product_id'],
+                              units=row['units'], revenue=row['revenue'])
+            for row in items.order_by().annotate(date=item_day)
+            .values('date', 'product_id')
+            .annotate(units=Sum('quantity'), revenue=revenue)], batch_size=1000)
+        DailyCollectionSales.objects.bulk_create([
+            DailyCollectionSales(
+                date=row['date'], collection_id=row['product__collection_id'],
+                units=row['units'], revenue=row['revenue'])
+            for row in items.order_by().annotate(date=item_day)
+            .values('date', 'product__collection_id')
+            .annotate(units=Sum('quantity'), revenue=revenue)], batch_size=1000)
+
+
+def _figures():
+    return {'orders': 0, 'units': 0, 'revenue': Decimal(0)}
+
+
+def report(start, end, limit=10):
+    """
+    Sales from `start` to `end` inclusive, read from the rollups only:
+    totals, per payment status and per day (days without sales included),
+    the `limit` best selling products and every collection that sold.
+    """
+    totals = _figures()
+    by_status = {status: _figures() for status, _ in Order.PAYMENT_STATUS_CHOICES}
+    daily = {start + timedelta(days=n): _figures()
+             for n in range((end - start).days + 1)}
+    for row in DailySales.objects.filter(date__range=(start, end)) \
+            .values('date', 'payment_status', 'orders', 'units', 'revenue'):
+        for figures in (totals, by_status[row['payment_status']], daily[row['date']]):
+            for name in ('orders', 'units', 'revenue'):
+                figures[name] += row[name]
+
+    products = list(
+        DailyProductSales.objects.filter(date__range=(start, end))
+        .values('product_id').annotate(units=Sum('units'), revenue=Sum('revenue'))
+        .order_by('-revenue', 'product_id')[:limit])
+    titles = dict(Product.objects.filter(pk__in=[row['product_id'] for row in products])
+                  .values_list('pk', 'title'))
+    collections = list(
+        DailyCollectionSales.objects.filter(date__range=(start, end))
+        .values('collection_id', 'collection__title')
+        .annotate(units=Sum('units'), revenue=Sum('revenue'))
+        .order_by('-revenue', 'collection_id'))
+
+    return {
+        'start': start,
+        'end': end,
+        'totals': totals,
+        'by_status': by_status,
+        'daily': [{'date': date, **figures} for date, figures in daily.items()],
+        'products': [{'id': row['product_id'], 'title': titles.get(row['product_id']),
+                      'units': row['units'], 'revenue': row['revenue']}
+                     for row in products],
+        'collections': [{'id': row['collection_id'], 'title': row['collection__title'],
+                         'units': row['units'], 'revenue': row['revenue']}
+                        for row in collections],
+    }
@@ -0,0 +1,96 @@
+import re
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models import OuterRef, Q, Subquery, Sum
+
+from .models import Product, ProductSearchTerm
+
+TOKEN_RE = re.compile(r'\w+')
+MAX_TERM_LENGTH = ProductSearchTerm._meta.get_field('term').max_length
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+
+
+def tokenize(text):
+    if not text:
+        return []
+    return [token[:MAX_TERM_LENGTH] for token in TOKEN_RE.findall(text.lower())]
+
+
+def product_terms(product):
+    weights = Counter()
+    for token in tokenize(product.title):
+        weights[token] += TITLE_WEIGHT
+    for token in tokenize(product.description):
+        weights[token] += DESCRIPTION_WEIGHT
+    return weights
+
+
+def _insert_terms(products):
+    # A plain executemany() skips the per-row model instances and SQL
+    # compilation of bulk_create(), which dominate full rebuilds.
+    ops = connection.ops
+    columns = ', '.join(ops.quote_name(field.column) for field in (
+        ProductSearchTerm._meta.get_field(name)
+        for name in ('term', 'product', 'weight')))
+    sql = (f'INSERT INTO {ops.quote_name(ProductSearchTerm._meta.db_table)} '
+           f'({columns}) VALUES (%s, %s, %s)')
+    rows = [
+        (term, product.pk, weight)
+        for product in products
+        for term, weight in product_terms(product).items()
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
+def index_products(products):
+    products = list(products)
+    with transaction.atomic():
+        ProductSearchTerm.objects.filter(
+            product_id__in=[product.pk for product in products]).delete()
+        _insert_terms(products)
+
+
+def rebuild_index(chunk_size=1000, progress=None):
+    ProductSearchTerm.objects.all().delete()
+    products = Product.objects.only('id', 'title', 'description').order_by('pk')
+    indexed, last_pk = 0, 0
+    while True:
+        chunk = list(products.filter(pk__gt=last_pk)[:chunk_size])
+        if not chunk:
+            return indexed
+        with transaction.atomic():
+            _insert_terms(chunk)
+        indexed += len(chunk)
+        last_pk = chunk[-1].pk
+        if progress is not None:
+            progress(indexed)
+
+
+def search_products(queryset, query):
+    """
+    Restrict `queryset` to products matching every token of `query` (the
+    last token as a prefix) and rank them by the summed term weights.
+    """
+    tokens = list(dict.fromkeys(tokenize(query)))
+    if not tokens:
+        return queryset
+
+    matched = Q()
+    for position, token in enumerate(tokens):
+        if position == len(tokens) - 1:
+            # A range rather than startswith: LIKE (LIKE BINARY on MySQL)
+            # cannot seek the (term, product) index, a range can.
+            lookup = Q(term__gte=token, term__lt=token + '\U0010ffff')
+        else:
+            lookup = Q(term=token)
+        queryset = queryset.filter(pk__in=ProductSearchTerm.objects.filter(
+            lookup).values('product_id'))
+        matched |= lookup
+
+    rank = ProductSearchTerm.objects.filter(matched, product=OuterRef('pk')) \
+        .values('product').annotate(total=Sum('weight')).values('total')
+    return queryset.annotate(search_rank=Subquery(rank)) \
+        .order_by('-search_rank', 'pk')
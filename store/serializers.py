@@ -1,10 +1,17 @@
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
 
 from rest_framework import serializers
+from rest_framework.exceptions import NotFound
 
-from decimal import Decimal
+from collections import Counter
+from datetime import timedelta
 from .models import *
+from .ratings import HISTOGRAM_FIELDS, RATES
+from . import inventory, jobs, renditions, rollups, tasks, tax
 
 User = get_user_model()
 
@@ -18,13 +25,52 @@ class CollectionSerializer(serializers.ModelSerializer):
 
 
 class ProductImageSerializer(serializers.ModelSerializer):
+    """
+    With `?image_size=<rendition>` each image is just its id and that
+    rendition (the original until the rendition has been generated).
+    """
+    renditions = serializers.SerializerMethodField()
+
     def create(self, validated_data):
         product_id = self.context['product_id']
         return ProductImage.objects.create(product_id=product_id, **validated_data)
 
     class Meta:
         model = ProductImage
-        fields = ['id', 'image']
+        fields = ['id', 'image', 'renditions']
+
+    def get_renditions(self, instance: ProductImage):
+        return {name: self.rendition_data(rendition)
+                for name, rendition in instance.renditions.items()}
+
+    def rendition_data(self, rendition):
+        url = default_storage.url(rendition['name'])
+        request = self.context.get('request')
+        if request is not None:
+            url = request.build_absolute_uri(url)
+        return {'url': url, 'width': rendition['width'],
+                'height': rendition['height']}
+
+    def get_image_size(self):
+        root = self.root
+        if not hasattr(root, '_image_size'):
+            request = self.context.get('request')
+            size = request.query_params.get('image_size') if request else None
+            if size and size not in renditions.SIZES:
+                raise serializers.ValidationError({'image_size': [
+                    f'Choose one of: {", ".join(renditions.SIZES)}.']})
+            root._image_size = size
+        return root._image_size
+
+    def to_representation(self, instance: ProductImage):
+        size = self.get_image_size()
+        if size is None:
+            return super().to_representation(instance)
+        rendition = instance.renditions.get(size)
+        if rendition is None:
+            return {'id': instance.pk,
+                    'image': self.fields['image'].to_representation(instance.image)}
+        return {'id': instance.pk, 'image': self.rendition_data(rendition)['url']}
 
 
 class ProductSerializer(serializers.ModelSerializer):
@@ -44,14 +90,37 @@ class ProductSerializer(serializers.ModelSerializer):
     price_with_tax = serializers.SerializerMethodField(
         method_name='calculate_tax')
 
+    rating = serializers.SerializerMethodField(method_name='get_rating')
+
     class Meta:
         model = Product
         fields = ['id', 'title', 'description', 'slug', 'inventory',
-                  'price', 'price_with_tax', 'collection', 'images', 'uploaded_images']
+                  'price', 'price_with_tax', 'collection', 'rating', 'images', 'uploaded_images']
         partial = True
 
     def calculate_tax(self, instance: Product):
-        return instance.unit_price * Decimal(1.1)
+        return self.get_tax_rates().price_with_tax(
+            instance.unit_price, instance.collection_id)
+
+    def get_tax_rates(self):
+        # The region's rates are resolved once per page and shared by every
+        # row through the root serializer; callers that cannot query (async
+        # views) pass them in as context['tax_rates'].
+        root = self.root
+        rates = getattr(root, '_tax_rates', None)
+        if rates is None:
+            rates = self.context.get('tax_rates') or tax.rates_for(
+                tax.get_region(self.context.get('request')))
+            root._tax_rates = rates
+        return rates
+
+    def get_rating(self, instance: Product):
+        return {
+            'count': instance.rating_count,
+            'average': instance.rating_average if instance.rating_count else None,
+            'histogram': {rate: getattr(instance, field)
+                          for rate, field in zip(RATES, HISTOGRAM_FIELDS)},
+        }
 
     def create(self, validated_data):
         upladed_images = validated_data.pop('uploaded_images')
@@ -62,17 +131,79 @@ class ProductSerializer(serializers.ModelSerializer):
                 ProductImage(product=product, image=image)
             )
 
-        ProductImage.objects.bulk_create(image_list)
+        image_list = ProductImage.objects.bulk_create(image_list)
+        if any(image.pk is None for image in image_list):
+            # Backends that cannot return ids from a bulk insert (MySQL).
+            image_list = list(product.images.all())
+        # bulk_create() sends no post_save, so the renditions are queued here.
+        for image in image_list:
+            jobs.enqueue(tasks.generate_image_renditions, image_id=image.pk)
 
         return product
 
 
+class ProductImportSerializer(serializers.ModelSerializer):
+    """
+    Validates one import row. Rows with an `id` update that product and
+    may carry any subset of fields; rows without one create a product.
+    Existing products and collection ids are looked up once per batch
+    and passed in through the context.
+    """
+    id = serializers.IntegerField(required=False)
+    collection = serializers.IntegerField(required=False)
+
+    required_on_create = ['title', 'unit_price', 'inventory', 'collection']
+
+    class Meta:
+        model = Product
+        fields = ['id', 'title', 'slug', 'description', 'unit_price',
+                  'inventory', 'collection']
+        extra_kwargs = {field: {'required': False}
+                        for field in ['title', 'unit_price', 'inventory']}
+
+    def validate_id(self, value):
+        if value not in self.context['products']:
+            raise serializers.ValidationError(
+                'No product with the given ID was found.')
+        return value
+
+    def validate_collection(self, value):
+        if value not in self.context['collection_ids']:
+            raise serializers.ValidationError(
+                'No collection with the given ID was found.')
+        return value
+
+    def validate(self, attrs):
+        if 'id' not in attrs:
+            missing = {field: ['This field is required.']
+                       for field in self.required_on_create if field not in attrs}
+            if missing:
+                raise serializers.ValidationError(missing)
+        return attrs
+
+
 class SimpleProductSerializer(serializers.ModelSerializer):
     class Meta:
         model = Product
         fields = ['id', 'title', 'unit_price']
 
 
+class RelatedProductSerializer(serializers.ModelSerializer):
+    product = SimpleProductSerializer(source='related')
+
+    class Meta:
+        model = ProductPair
+        fields = ['product', 'orders']
+
+
+class BestsellerSerializer(serializers.ModelSerializer):
+    product = SimpleProductSerializer()
+
+    class Meta:
+        model = ProductSales
+        fields = ['product', 'units']
+
+
 class ReviewSerializer(serializers.ModelSerializer):
     reviewer_id = serializers.IntegerField(read_only=True)
 
@@ -90,47 +221,49 @@ class ReviewSerializer(serializers.ModelSerializer):
 
 class CartItemSerializer(serializers.ModelSerializer):
     product = SimpleProductSerializer(read_only=True)
-    total_price = serializers.SerializerMethodField(
-        method_name='calc_price', read_only=True)
+    # Annotated by CartItem.objects.priced().
+    total_price = serializers.DecimalField(
+        max_digits=12, decimal_places=2, read_only=True)
 
     class Meta:
         model = CartItem
         fields = ['id', 'product', 'quantity', 'total_price']
 
-    def calc_price(self, instance: CartItem):
-        return instance.quantity * instance.product.unit_price
+
+def add_cart_items(cart_id, quantities):
+    with transaction.atomic():
+        items = CartItem.objects.add_items(cart_id, quantities)
+        missing = set(quantities) - {item.product_id for item in items}
+        if missing:
+            if not items and not Cart.objects.filter(pk=cart_id).exists():
+                raise NotFound('No cart with the given id was found')
+            raise serializers.ValidationError(
+                {'product_id': ['No product with the given id was found']})
+    return items
+
+
+class AddCartItemListSerializer(serializers.ListSerializer):
+    def save(self, **kwargs):
+        quantities = Counter()
+        for item in self.validated_data:
+            quantities[item['product_id']] += item['quantity']
+        self.instance = add_cart_items(self.context['cart_id'], quantities)
+        return self.instance
 
 
 class AddCartItemSerializer(serializers.ModelSerializer):
     product_id = serializers.IntegerField()
 
-    def validate_product_id(self, value):
-        if not Product.objects.filter(pk=value).exists():
-            raise serializers.ValidationError(
-                'No product with the given id was found')
-        return value
-
     class Meta:
         model = CartItem
         fields = ['id', 'product_id', 'quantity']
+        list_serializer_class = AddCartItemListSerializer
 
     def save(self, **kwargs):
-
         validated_data = {**self.validated_data}
         cart_id = self.context['cart_id']
-        product_id = validated_data['product_id']
-        quantity = validated_data['quantity']
-        try:
-            cart_item = CartItem.objects.get(
-                cart_id=cart_id, product_id=product_id)
-            cart_item.quantity += quantity
-            cart_item.save()
-            self.instance = cart_item
-
-        except CartItem.DoesNotExist:
-            self.instance = CartItem.objects.create(
-                cart_id=cart_id, **self.validated_data)
-
+        quantities = {validated_data['product_id']: validated_data['quantity']}
+        self.instance, = add_cart_items(cart_id, quantities)
         return self.instance
 
 
@@ -143,18 +276,25 @@ class UpdateCartItemSerializer(serializers.ModelSerializer):
 class CartSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(read_only=True)
     items = CartItemSerializer(read_only=True, many=True)
-    total_price = serializers.SerializerMethodField(
-        method_name='calc_price', read_only=True)
+    # Annotated by Cart.objects.with_totals(); a new cart has none.
+    total_price = serializers.DecimalField(
+        max_digits=12, decimal_places=2, read_only=True, default=0)
 
     class Meta:
         model = Cart
         fields = ['id', 'items', 'total_price']
 
-    def calc_price(self, instance: Cart):
-        price = 0
-        for item in instance.items.all():
-            price += item.quantity * item.product.unit_price
-        return price
+
+class CartTotalSerializer(serializers.ModelSerializer):
+    """A cart's totals without its lines (`?fields=total`)."""
+    id = serializers.UUIDField(read_only=True)
+    item_count = serializers.IntegerField(read_only=True)
+    total_price = serializers.DecimalField(
+        max_digits=12, decimal_places=2, read_only=True)
+
+    class Meta:
+        model = Cart
+        fields = ['id', 'item_count', 'total_price']
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -239,36 +379,75 @@ class OrderSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Order
-        fields = ['id', 'customer_id', 'placed_at', 'payment_status', 'items']
+        fields = ['id', 'customer_id', 'placed_at', 'payment_status',
+                  'item_count', 'total_price', 'items']
+
+
+class OrderSummarySerializer(serializers.ModelSerializer):
+    customer_id = serializers.IntegerField()
+
+    class Meta:
+        model = Order
+        fields = ['id', 'customer_id', 'placed_at', 'payment_status',
+                  'item_count', 'total_price']
 
 
 class CreateOrderSerializer(serializers.Serializer):
     cart_id = serializers.UUIDField()
 
-    def validate_cart_id(self, cart_id):
-        if not Cart.objects.filter(pk=cart_id).exists():
+    def lock_cart_items(self, cart_id):
+        """
+        Lock the cart and read its lines. A concurrent checkout of the same
+        cart waits on the lock and then finds it deleted; line writes wait
+        too, so the order is placed with the quantities that are deleted.
+        """
+        carts = Cart.objects.filter(pk=cart_id)
+        if connection.features.has_select_for_update:
+            found = list(carts.select_for_update().values_list('pk', flat=True))
+        else:
+            # SQLite: writing takes the database lock up front, rather than
+            # on the first write after several reads, where concurrent
+            # checkouts would wait out the busy timeout on each other.
+            found = carts.update(created_at=F('created_at'))
+        if not found:
             raise serializers.ValidationError(
-                'No cart with the given ID was found.')
-        if CartItem.objects.filter(cart_id=cart_id).count() == 0:
-            raise serializers.ValidationError('The cart is empty.')
-        return cart_id
+                {'cart_id': ['No cart with the given ID was found.']})
+        cart_items = list(
+            CartItem.objects.filter(cart_id=cart_id).select_related('product')
+            .only('quantity', 'product__title', 'product__unit_price',
+                  'product__collection_id'))
+        if not cart_items:
+            raise serializers.ValidationError({'cart_id': ['The cart is empty.']})
+        return cart_items
 
     def save(self, **kwargs):
         with transaction.atomic():
             validated_data = {**self.validated_data}
             cart_id = validated_data['cart_id']
-
-            customer = Customer.objects.get(
-                user_id=self.context['user_id'])
-
-            order = Order.objects.create(customer=customer)
-
-            cart_items = CartItem.objects.select_related(
-                'product').filter(cart_id=cart_id)
+            self.cart_items = self.lock_cart_items(cart_id)
+
+            customer_id = Customer.objects.filter(
+                user_id=self.context['user_id']).values_list('pk', flat=True).get()
+
+            try:
+                inventory.reserve(
+                    {item.product_id: item.quantity for item in self.cart_items})
+            except inventory.InsufficientStock as error:
+                raise serializers.ValidationError({'items': [
+                    f"Only {line['available']} left in stock for product "
+                    f"{line['product_id']}, {line['requested']} requested."
+                    for line in error.shortages
+                ]})
+
+            order = Order.objects.create(
+                customer_id=customer_id,
+                item_count=sum(item.quantity for item in self.cart_items),
+                total_price=sum(item.quantity * item.product.unit_price
+                                for item in self.cart_items))
 
             order_items = []
 
-            for item in cart_items:
+            for item in self.cart_items:
                 order_items.append(
                     OrderItem(
                         order=order,
@@ -278,10 +457,21 @@ class CreateOrderSerializer(serializers.Serializer):
                     )
                 )
 
-            OrderItem.objects.bulk_create(order_items)
+            order_items = OrderItem.objects.bulk_create(order_items)
+            if any(item.pk is None for item in order_items):
+                # Backends that cannot return ids from a bulk insert (MySQL).
+                order_items = list(order.items.select_related('product')
+                                   .only('quantity', 'unit_price', 'order_id',
+                                         'product__title', 'product__unit_price',
+                                         'product__collection_id'))
 
+            rollups.record_order(order, order_items)
             Cart.objects.filter(pk=cart_id).delete()
+            jobs.enqueue(tasks.send_order_confirmation, order_id=order.pk)
 
+            # Serve order.items from the rows just written instead of
+            # reading them back for the response.
+            order._prefetched_objects_cache = {'items': order_items}
             return order
 
 
@@ -290,6 +480,64 @@ class UpdateOrderSerializer(serializers.ModelSerializer):
         model = Order
         fields = ['payment_status']
 
+    def update(self, instance, validated_data):
+        status = validated_data.get('payment_status', instance.payment_status)
+        with transaction.atomic():
+            # Locked, so concurrent updates move the rollups from the right bucket.
+            old_status = Order.objects.filter(pk=instance.pk) \
+                .select_for_update().values_list('payment_status', flat=True).get()
+            if status != old_status:
+                Order.objects.filter(pk=instance.pk).update(payment_status=status)
+                instance.payment_status = status
+                rollups.move_order(instance, old_status)
+        return instance
+
+
+class SalesReportQuerySerializer(serializers.Serializer):
+    """The report's date range; the last 30 days by default."""
+    MAX_DAYS = 366
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+    def validate(self, data):
+        data.setdefault('end', timezone.localdate())
+        data.setdefault('start', data['end'] - timedelta(days=29))
+        if data['start'] > data['end']:
+            raise serializers.ValidationError('start must not be after end.')
+        if (data['end'] - data['start']).days >= self.MAX_DAYS:
+            raise serializers.ValidationError(
+                f'The range must not be longer than {self.MAX_DAYS} days.')
+        return data
+
+
+class SalesSerializer(serializers.Serializer):
+    orders = serializers.IntegerField()
+    units = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class DailySalesSerializer(SalesSerializer):
+    date = serializers.DateField()
+
+
+class ItemSalesSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    units = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class SalesReportSerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+    totals = SalesSerializer()
+    by_status = serializers.DictField(child=SalesSerializer())
+    daily = DailySalesSerializer(many=True)
+    products = ItemSalesSerializer(many=True)
+    collections = ItemSalesSerializer(many=True)
+
 
 class PasswordResetSerializer(serializers.Serializer):
     email = serializers.EmailField()
@@ -1,9 +1,127 @@
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
-from store.models import Customer
+from store import cache, jobs, ratings, renditions, rollups, search, tasks, tax
+from store.models import (Collection, Customer, Order, Product, ProductImage,
+                          ProductSales, Review, TaxRate)
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_customer_for_new_user(sender, **kwargs):
   if kwargs['created']:
-    Customer.objects.create(user=kwargs['instance'])
\ No newline at end of file
+    Customer.objects.create(user=kwargs['instance'])
+
+
+@receiver([post_save, post_delete], sender=Product)
+def invalidate_product_cache(sender, instance, **kwargs):
+  cache.bump_product(instance.pk, instance.collection_id,
+                     getattr(instance, '_loaded_collection_id', None))
+
+
+@receiver([post_save, post_delete], sender=ProductImage)
+def invalidate_product_image_cache(sender, instance, **kwargs):
+  collection_id = Product.objects.filter(pk=instance.product_id) \
+      .values_list('collection_id', flat=True).first()
+  cache.bump_product(instance.product_id, collection_id)
+
+
+@receiver(post_save, sender=ProductImage)
+def queue_image_renditions(sender, instance, **kwargs):
+  if instance.image:
+    jobs.enqueue(tasks.generate_image_renditions, image_id=instance.pk)
+
+
+@receiver(post_delete, sender=ProductImage)
+def delete_image_renditions(sender, instance, **kwargs):
+  transaction.on_commit(lambda: renditions.delete(instance.renditions))
+
+
+@receiver([post_save, post_delete], sender=Collection)
+def invalidate_collection_cache(sender, instance, **kwargs):
+  cache.bump_collection(instance.pk)
+
+
+@receiver(post_save, sender=Product)
+def index_product_search_terms(sender, instance, update_fields=None, **kwargs):
+  if update_fields is None or {'title', 'description'} & set(update_fields):
+    search.index_products([instance])
+
+
+@receiver(post_save, sender=Product)
+def count_created_or_moved_product(sender, instance, created, **kwargs):
+  if created:
+    Collection.objects.adjust_product_count({instance.collection_id: 1})
+    return
+  previous = getattr(instance, '_loaded_collection_id', instance.collection_id)
+  if previous != instance.collection_id:
+    Collection.objects.adjust_product_count(
+        {previous: -1, instance.collection_id: 1})
+
+
+@receiver(post_save, sender=Product)
+def move_product_sales(sender, instance, created, **kwargs):
+  # Bestsellers rank products in their current collection.
+  previous = getattr(instance, '_loaded_collection_id', instance.collection_id)
+  if not created and previous != instance.collection_id:
+    ProductSales.objects.filter(pk=instance.pk) \
+        .update(collection_id=instance.collection_id)
+
+
+@receiver(post_delete, sender=Product)
+def count_deleted_product(sender, instance, **kwargs):
+  Collection.objects.adjust_product_count({instance.collection_id: -1})
+
+
+@receiver(post_save, sender=Review)
+def rate_product(sender, instance, created, **kwargs):
+  if created:
+    ratings.update_rating(instance.product_id, added=[instance.rate])
+    return
+  product_id, rate = getattr(
+      instance, '_loaded_rating', (instance.product_id, instance.rate))
+  if product_id == instance.product_id:
+    if rate != instance.rate:
+      ratings.update_rating(
+          product_id, added=[instance.rate], removed=[rate])
+  else:
+    ratings.update_rating(product_id, removed=[rate])
+    ratings.update_rating(instance.product_id, added=[instance.rate])
+
+
+@receiver(post_delete, sender=Review)
+def unrate_product(sender, instance, **kwargs):
+  ratings.update_rating(instance.product_id, removed=[instance.rate])
+
+
+@receiver([post_save, post_delete], sender=Review)
+def invalidate_review_cache(sender, instance, **kwargs):
+  product_id, _ = getattr(instance, '_loaded_rating', (instance.product_id, None))
+  cache.bump_reviews(instance.product_id, product_id)
+
+
+@receiver(pre_save, sender=Order)
+def lock_order_status(sender, instance, raw=False, **kwargs):
+  # Orders saved outside checkout (e.g. from the admin) move between the
+  # rollup buckets like status updates do; the lock orders concurrent ones.
+  if instance.pk is None or raw:
+    return
+  instance._stored_payment_status = Order.objects.select_for_update() \
+      .filter(pk=instance.pk).values_list('payment_status', flat=True).first()
+
+
+@receiver(post_save, sender=Order)
+def move_saved_order(sender, instance, created, **kwargs):
+  old_status = getattr(instance, '_stored_payment_status', None)
+  if not created and old_status not in (None, instance.payment_status):
+    rollups.move_order(instance, old_status)
+  instance._stored_payment_status = None
+
+
+@receiver(post_delete, sender=Order)
+def remove_deleted_order(sender, instance, **kwargs):
+  rollups.remove_order(instance)
+
+
+@receiver([post_save, post_delete], sender=TaxRate)
+def invalidate_tax_rates(sender, instance, **kwargs):
+  tax.invalidate_rates()
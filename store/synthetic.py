@@ -0,0 +1,189 @@
+import random
+from decimal import Decimal
+from itertools import islice
+from uuid import UUID
+
+from django.utils import timezone
+
+from . import ratings, rollups, search
+from .models import (Cart, CartItem, Collection, Customer, Order, OrderItem,
+                     Product, Review, User)
+
+DEFAULT_SIZES = {
+    'collections': 10,
+    'products': 2000,
+    'customers': 100,
+    'reviews': 5000,
+    'orders': 500,
+    'carts': 50,
+}
+
+WORDS = (
+    'bread wheat flour rice basmati milk cheese butter apple orange lemon '
+    'coffee tea sugar salt pepper chili garlic onion tomato potato carrot '
+    'shampoo soap brush towel pencil paper notebook marker puppy kitten '
+    'treat leash ball doll puzzle magazine weekly monthly organic fresh '
+    'frozen dried sliced whole mini classic premium regular'
+).split()
+
+
+def _sentence(rng, length):
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+def _price(rng):
+    return Decimal(rng.randint(100, 99999)) / 100
+
+
+def _chunks(objs, chunk_size):
+    objs = iter(objs)
+    while True:
+        chunk = list(islice(objs, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class Generator:
+    """
+    Deterministic synthetic store data, written in chunks so any volume
+    fits in memory. Only primary keys of products and customers are kept
+    around to pick related rows from.
+    """
+
+    def __init__(self, sizes, seed=0, chunk_size=5000, progress=None):
+        self.sizes = {**DEFAULT_SIZES, **sizes}
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.rng = random.Random(seed)
+
+    def generate(self):
+        collection_ids = self.create_collections()
+        product_ids = self.create_products(collection_ids)
+        user_ids, customer_ids = self.create_customers()
+        self.create_reviews(product_ids, customer_ids)
+        self.create_orders(product_ids, customer_ids)
+        cart_ids = self.create_carts(product_ids)
+
+        # bulk_create() skips the signals that keep these in sync.
+        self.report('ratings', 0, None)
+        ratings.rebuild_ratings(self.chunk_size)
+        total = Product.objects.count()
+        search.rebuild_index(
+            self.chunk_size,
+            lambda done: self.report('search index', done, total))
+
+        return {
+            'collection_ids': collection_ids,
+            'product_ids': product_ids,
+            'user_ids': user_ids,
+            'customer_ids': customer_ids,
+            'cart_ids': cart_ids,
+        }
+
+    def report(self, label, done, total):
+        if self.progress is not None:
+            self.progress(label, done, total)
+
+    def write(self, label, model, objs, total):
+        done = 0
+        for chunk in _chunks(objs, self.chunk_size):
+            model.objects.bulk_create(chunk)
+            done += len(chunk)
+            self.report(label, done, total)
+
+    def new_ids(self, model, last_pk):
+        return list(model.objects.filter(pk__gt=last_pk).order_by('pk')
+                    .values_list('pk', flat=True))
+
+    def iter_ids(self, model, last_pk):
+        # Keyset chunks rather than a server-side cursor, so inserting while
+        # iterating behaves the same on every backend.
+        while True:
+            ids = list(model.objects.filter(pk__gt=last_pk).order_by('pk')
+                       .values_list('pk', flat=True)[:self.chunk_size])
+            if not ids:
+                return
+            yield from ids
+            last_pk = ids[-1]
+
+    def last_pk(self, model):
+        return model.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+
+    def create_collections(self):
+        total = self.sizes['collections']
+        last_pk = self.last_pk(Collection)
+        self.write('collections', Collection, (
+            Collection(title=f'Collection {n}') for n in range(total)), total)
+        return self.new_ids(Collection, last_pk)
+
+    def create_products(self, collection_ids):
+        rng, total = self.rng, self.sizes['products']
+        last_pk = self.last_pk(Product)
+        self.write('products', Product, (
+            Product(title=_sentence(rng, 3).title(), slug='-',
+                    description=_sentence(rng, 12), unit_price=_price(rng),
+                    inventory=1_000_000, collection_id=rng.choice(collection_ids))
+            for _ in range(total)), total)
+        return self.new_ids(Product, last_pk)
+
+    def create_customers(self):
+        total = self.sizes['customers']
+        prefix = f'synthetic-{self.seed}-{self.last_pk(User)}-'
+        self.write('users', User, (
+            User(username=f'{prefix}{n}', email=f'{prefix}{n}@example.com',
+                 password='!')
+            for n in range(total)), total)
+        user_ids = list(User.objects.filter(username__startswith=prefix)
+                        .order_by('pk').values_list('pk', flat=True))
+
+        last_pk = self.last_pk(Customer)
+        self.write('customers', Customer, (
+            Customer(user_id=user_id) for user_id in user_ids), total)
+        return user_ids, self.new_ids(Customer, last_pk)
+
+    def create_reviews(self, product_ids, customer_ids):
+        rng, total = self.rng, self.sizes['reviews']
+        self.write('reviews', Review, (
+            Review(product_id=rng.choice(product_ids),
+                   reviewer_id=rng.choice(customer_ids),
+                   name=_sentence(rng, 2), description=_sentence(rng, 20),
+                   rate=rng.randint(1, 5))
+            for _ in range(total)), total)
+
+    def create_orders(self, product_ids, customer_ids):
+        rng, total = self.rng, self.sizes['orders']
+        last_pk = self.last_pk(Order)
+        self.write('orders', Order, (
+            Order(customer_id=rng.choice(customer_ids),
+                  payment_status=rng.choice('PCF'))
+            for _ in range(total)), total)
+
+        self.write('order items', OrderItem, (
+            OrderItem(order_id=order_id, product_id=product_id,
+                      unit_price=_price(rng), quantity=rng.randint(1, 5))
+            for order_id in self.iter_ids(Order, last_pk)
+            for product_id in rng.sample(product_ids, min(len(product_ids),
+                                                          rng.randint(1, 4)))),
+            None)
+        Order.objects.filter(pk__gt=last_pk).summarize()
+        # The orders are all placed today; recount just that day.
+        rollups.rebuild(since=timezone.localdate())
+
+    def create_carts(self, product_ids):
+        rng, total = self.rng, self.sizes['carts']
+        cart_ids = [UUID(int=rng.getrandbits(128), version=4) for _ in range(total)]
+        self.write('carts', Cart, (Cart(id=pk) for pk in cart_ids), total)
+        self.write('cart items', CartItem, (
+            CartItem(cart_id=cart_id, product_id=product_id,
+                     quantity=rng.randint(1, 5))
+            for cart_id in cart_ids
+            for product_id in rng.sample(product_ids, min(len(product_ids),
+                                                          rng.randint(1, 8)))),
+            None)
+        return cart_ids
+
+
+def generate(sizes, seed=0, chunk_size=5000, progress=None):
+    return Generator(sizes, seed, chunk_size, progress).generate()
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import send_mail
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from . import renditions
+from .jobs import task
+from .models import Order, ProductImage, User
+
+
+@task
+def send_password_reset_email(user_id):
+    user = User.objects.filter(pk=user_id).first()
+    if user is None:
+        return
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
+    # Made when the mail is sent, so a retried job never mails a token
+    # that a password change in between has already invalidated.
+    token = default_token_generator.make_token(user)
+    reset_url = f"http://localhost:8000//api/auth/reset-password/{uid}/{token}"
+    send_mail(
+        'Reset Your Password',
+        f'Please click on this link to reset your password: {reset_url}',
+        settings.EMAIL_HOST_USER,
+        [user.email],
+    )
+
+
+@task
+def send_order_confirmation(order_id):
+    order = Order.objects.select_related('customer__user') \
+        .prefetch_related('items__product').filter(pk=order_id).first()
+    if order is None:
+        return
+    lines = [f'{item.quantity} x {item.product.title} @ {item.unit_price}'
+             for item in order.items.all()]
+    total = sum(item.quantity * item.unit_price for item in order.items.all())
+    send_mail(
+        f'Order #{order.pk} confirmed',
+        '\n'.join(['Thank you for your order.', '', *lines, '',
+                   f'Total: {total}']),
+        settings.EMAIL_HOST_USER,
+        [order.customer.user.email],
+    )
+
+
+@task
+def generate_image_renditions(image_id):
+    image = ProductImage.objects.filter(pk=image_id).first()
+    if image is None or not image.image:
+        return
+    renditions.generate(image)
@@ -0,0 +1,74 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.conf import settings
+from django.db import transaction
+
+from . import cache
+from .models import TaxRate
+
+REGION_HEADER = 'X-Tax-Region'
+REGION_QUERY_PARAM = 'region'
+DEFAULT_REGION = getattr(settings, 'STORE_TAX_DEFAULT_REGION', 'DEFAULT')
+# Used when neither the region nor DEFAULT_REGION has a rate.
+FALLBACK_RATE = Decimal(getattr(settings, 'STORE_TAX_FALLBACK_RATE', '0.10'))
+CENT = Decimal('0.01')
+MAX_REGION_LENGTH = TaxRate._meta.get_field('region').max_length
+
+
+def get_region(request):
+    """Region from the `?region=` parameter, else the X-Tax-Region header."""
+    if request is None:
+        return DEFAULT_REGION
+    region = request.query_params.get(REGION_QUERY_PARAM) \
+        or request.headers.get(REGION_HEADER) or ''
+    region = region.strip().upper()
+    if not region or len(region) > MAX_REGION_LENGTH:
+        return DEFAULT_REGION
+    return region
+
+
+def get_rate_table():
+    """
+    Return `{region: {collection_id or None: rate}}`, read from the cache
+    under the current `tax` version so edits take effect immediately.
+    """
+    version, = cache.get_versions(('tax',))
+    key = f'store:tax:rates:{version}'
+    table = cache.get_cache().get(key)
+    if table is None:
+        table = {}
+        for region, collection_id, rate in TaxRate.objects.values_list(
+                'region', 'collection_id', 'rate'):
+            table.setdefault(region, {})[collection_id] = rate
+        cache.get_cache().set(key, table, cache.RESPONSE_TIMEOUT)
+    return table
+
+
+class RegionRates:
+    """
+    Rates of one region. A collection's rate is looked up in the region,
+    then the region-wide rate, then the same two in DEFAULT_REGION.
+    """
+
+    def __init__(self, region, table):
+        self.region = region
+        self.chain = [table.get(region, {}), table.get(DEFAULT_REGION, {})]
+
+    def rate(self, collection_id):
+        for rates in self.chain:
+            for key in (collection_id, None):
+                if key in rates:
+                    return rates[key]
+        return FALLBACK_RATE
+
+    def price_with_tax(self, unit_price, collection_id):
+        return (unit_price * (1 + self.rate(collection_id))).quantize(
+            CENT, rounding=ROUND_HALF_UP)
+
+
+def rates_for(region):
+    return RegionRates(region, get_rate_table())
+
+
+def invalidate_rates():
+    transaction.on_commit(lambda: cache.bump_version('tax'))
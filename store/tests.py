@@ -1,3 +1,1789 @@
-from django.test import TestCase
+from django.core import mail
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import OperationalError, close_old_connections, connection
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from asgiref.sync import async_to_sync
+from PIL import Image
+from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+import asyncio
+import csv
+import json
+import os
+import tempfile
+from base64 import urlsafe_b64encode
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import mock
+from uuid import uuid4
+
+from . import (benchmarks, checks, jobs, metrics, query_plans, recommendations,
+               synthetic, tax, views)
+from .cache import CachedResponseMixin, get_cache, get_stats
+from .management.commands.seed_db import iter_statements
+from .models import (Cart, CartItem, Collection, DailyProductSales, DailySales,
+                     DeadJob, IdempotencyKey, Job, Order, Product, ProductImage,
+                     ProductPair, ProductQuerySet, ProductSales, ProductSearchTerm,
+                     Review, TaxRate, User, Watermark)
+from .serializers import CreateOrderSerializer
+
+
+class ProductResponseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.flowers = Collection.objects.create(title='Flowers')
+        self.grocery = Collection.objects.create(title='Grocery')
+        self.product = Product.objects.create(
+            title='Rose', unit_price=5, inventory=10, collection=self.flowers)
+
+    def update_product(self, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            for name, value in fields.items():
+                setattr(self.product, name, value)
+            self.product.save()
+
+    def test_repeated_get_is_served_from_cache(self):
+        first = self.client.get('/api/products/?page=1&ordering=id')
+        second = self.client.get('/api/products/?ordering=id&page=1')
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(get_stats('product-list'),
+                         {'product-list': {'hit': 1, 'miss': 1}})
+
+    def test_product_write_invalidates_detail_and_list(self):
+        self.client.get(f'/api/products/{self.product.id}/')
+        self.client.get('/api/products/')
+
+        self.update_product(title='Tulip')
+
+        detail = self.client.get(f'/api/products/{self.product.id}/')
+        listing = self.client.get('/api/products/')
+        self.assertEqual(detail['X-Cache'], 'MISS')
+        self.assertEqual(detail.json()['title'], 'Tulip')
+        self.assertEqual(listing['X-Cache'], 'MISS')
+
+    def test_collection_lists_are_invalidated_precisely(self):
+        url = '/api/products/?collection={}'
+        other = Product.objects.create(
+            title='Rice', unit_price=2, inventory=3, collection=self.grocery)
+        self.client.get(url.format(self.flowers.id))
+        self.client.get(url.format(self.grocery.id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.title = 'Brown rice'
+            other.save()
+
+        self.assertEqual(
+            self.client.get(url.format(self.flowers.id))['X-Cache'], 'HIT')
+        self.assertEqual(
+            self.client.get(url.format(self.grocery.id))['X-Cache'], 'MISS')
+
+        self.update_product(collection=self.grocery)
+
+        flowers = self.client.get(url.format(self.flowers.id))
+        grocery = self.client.get(url.format(self.grocery.id))
+        self.assertEqual(flowers['X-Cache'], 'MISS')
+        self.assertEqual(flowers.json()['count'], 0)
+        self.assertEqual(grocery.json()['count'], 2)
+
+    def test_padded_collection_ids_are_invalidated(self):
+        url = f'/api/products/?collection=0{self.flowers.id}'
+        self.assertEqual(self.client.get(url).json()['count'], 1)
+
+        self.update_product(title='Tulip')
+
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['results'][0]['title'], 'Tulip')
+
+    def test_cached_views_must_declare_their_scopes(self):
+        with self.assertRaises(ImproperlyConfigured):
+            type('Unscoped', (CachedResponseMixin, generics.ListAPIView),
+                 {'cache_namespace': 'unscoped'})
+
+
+class SharedCacheCheckTests(APITestCase):
+    def test_process_local_caches_are_refused(self):
+        for backend in ('django.core.cache.backends.locmem.LocMemCache',
+                        'django.core.cache.backends.dummy.DummyCache'):
+            with override_settings(STORE_ALLOW_LOCAL_CACHE=False,
+                                   CACHES={'default': {'BACKEND': backend}}):
+                self.assertEqual(
+                    [error.id for error in checks.check_shared_cache(None)],
+                    ['store.E002'])
+
+    def test_shared_caches_pass(self):
+        with override_settings(STORE_ALLOW_LOCAL_CACHE=False, CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+                'LOCATION': 'store_cache'}}):
+            self.assertEqual(checks.check_shared_cache(None), [])
+
+
+class ProductSearchTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.collection = Collection.objects.create(title='Grocery')
+        self.bread = self.create_product(
+            'Bread Ww Cluster', 'whole wheat loaf')
+        self.wheat = self.create_product(
+            'Wheat Flour', 'stone ground flour for bread')
+        self.rice = self.create_product('Basmati Rice', 'long grain')
+
+    def create_product(self, title, description):
+        return Product.objects.create(
+            title=title, description=description, unit_price=3,
+            inventory=5, collection=self.collection)
+
+    def search(self, query, **params):
+        response = self.client.get(
+            '/api/products/', {'search': query, **params})
+        return [product['id'] for product in response.json()['results']]
+
+    def test_results_are_ranked_by_relevance(self):
+        self.assertEqual(self.search('bread'), [self.bread.id, self.wheat.id])
+        self.assertEqual(self.search('wheat'), [self.wheat.id, self.bread.id])
+
+    def test_last_token_matches_as_prefix(self):
+        self.assertEqual(self.search('basm'), [self.rice.id])
+        self.assertEqual(self.search('whe flour'), [])
+        self.assertEqual(self.search('flour whe'), [self.wheat.id])
+
+    def test_explicit_ordering_overrides_rank(self):
+        self.assertEqual(self.search('bread', ordering='id'),
+                         [self.bread.id, self.wheat.id])
+
+    def test_index_follows_product_writes(self):
+        self.rice.title = 'Jasmine Rice'
+        self.rice.save()
+        self.assertEqual(self.search('basmati'), [])
+        self.assertEqual(self.search('jasmine'), [self.rice.id])
+
+        self.rice.delete()
+        self.assertEqual(self.search('rice'), [])
+
+
+class CollectionProductCountTests(APITestCase):
+    def setUp(self):
+        self.flowers = Collection.objects.create(title='Flowers')
+        self.grocery = Collection.objects.create(title='Grocery')
+
+    def assertCounts(self, flowers, grocery):
+        self.flowers.refresh_from_db()
+        self.grocery.refresh_from_db()
+        self.assertEqual(
+            (self.flowers.product_count, self.grocery.product_count),
+            (flowers, grocery))
+
+    def product(self, collection, title='Rose'):
+        return Product(title=title, unit_price=5, inventory=1,
+                       collection=collection)
+
+    def test_counter_follows_single_row_writes(self):
+        rose = self.product(self.flowers)
+        rose.save()
+        self.assertCounts(1, 0)
+
+        rose.collection = self.grocery
+        rose.save()
+        self.assertCounts(0, 1)
+
+        rose.delete()
+        self.assertCounts(0, 0)
+
+    def test_counter_follows_bulk_writes(self):
+        Product.objects.bulk_create(
+            [self.product(self.flowers) for _ in range(3)])
+        self.assertCounts(3, 0)
+
+        moved = list(Product.objects.all()[:1])
+        moved[0].collection = self.grocery
+        Product.objects.bulk_update(moved, ['collection'])
+        self.assertCounts(2, 1)
+
+        Product.objects.filter(collection=self.flowers).update(
+            collection=self.grocery)
+        self.assertCounts(0, 3)
+
+        Product.objects.all().delete()
+        self.assertCounts(0, 0)
+
+    def test_reconcile_repairs_drift(self):
+        Product.objects.bulk_create([self.product(self.flowers)])
+        Collection.objects.filter(pk=self.flowers.pk).update(product_count=7)
+
+        self.assertEqual(
+            Collection.objects.reconcile_product_count(), [self.flowers.pk])
+        self.assertCounts(1, 0)
+
+    def test_endpoints_read_stored_counter(self):
+        self.product(self.flowers).save()
+
+        response = self.client.get(f'/api/collections/{self.flowers.id}/')
+        self.assertEqual(response.json()['product_count'], 1)
+
+
+class ProductRatingTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        collection = Collection.objects.create(title='Flowers')
+        self.rose = Product.objects.create(
+            title='Rose', unit_price=5, inventory=1, collection=collection)
+        self.tulip = Product.objects.create(
+            title='Tulip', unit_price=5, inventory=1, collection=collection)
+        self.customer = User.objects.create(
+            username='reviewer', email='reviewer@example.com').customer
+
+    def review(self, product, rate):
+        return Review.objects.create(
+            product=product, reviewer=self.customer, name='n',
+            description='d', rate=rate)
+
+    def test_aggregates_follow_review_writes(self):
+        first = self.review(self.rose, 5)
+        self.review(self.rose, 2)
+        first.rate = 4
+        first.save()
+        self.review(self.rose, 1).delete()
+
+        rating = self.client.get(
+            f'/api/products/{self.rose.id}/').json()['rating']
+        self.assertEqual(rating['count'], 2)
+        self.assertEqual(rating['average'], 3)
+        self.assertEqual(rating['histogram'],
+                         {'1': 0, '2': 1, '3': 0, '4': 1, '5': 0})
+
+    def test_filter_and_order_by_average(self):
+        self.review(self.rose, 3)
+        self.review(self.tulip, 5)
+
+        response = self.client.get(
+            '/api/products/', {'min_rating': 3, 'ordering': '-rating_average'})
+        self.assertEqual([product['id'] for product in response.json()['results']],
+                         [self.tulip.id, self.rose.id])
+        response = self.client.get('/api/products/', {'min_rating': 4})
+        self.assertEqual([product['id'] for product in response.json()['results']],
+                         [self.tulip.id])
+
+
+class CartItemUpsertTests(APITestCase):
+    def setUp(self):
+        collection = Collection.objects.create(title='Grocery')
+        self.bread = Product.objects.create(
+            title='Bread', unit_price=2, inventory=9, collection=collection)
+        self.milk = Product.objects.create(
+            title='Milk', unit_price=1, inventory=9, collection=collection)
+        self.cart = Cart.objects.create()
+        self.url = f'/api/cart/{self.cart.id}/items/'
+
+    def quantities(self):
+        return dict(CartItem.objects.filter(cart=self.cart)
+                    .values_list('product_id', 'quantity'))
+
+    def test_adding_twice_increments_in_one_statement(self):
+        self.client.post(self.url, {'product_id': self.bread.id, 'quantity': 2})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                self.url, {'product_id': self.bread.id, 'quantity': 3})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['quantity'], 5)
+        statements = [query['sql'] for query in queries
+                      if 'SAVEPOINT' not in query['sql']]
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith('INSERT'))
+        self.assertEqual(self.quantities(), {self.bread.id: 5})
+
+    def test_batch_add_merges_lines(self):
+        self.client.post(self.url, {'product_id': self.milk.id, 'quantity': 1})
+        response = self.client.post(self.url, [
+            {'product_id': self.bread.id, 'quantity': 1},
+            {'product_id': self.milk.id, 'quantity': 2},
+            {'product_id': self.bread.id, 'quantity': 4},
+        ], format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(self.quantities(), {self.bread.id: 5, self.milk.id: 3})
+
+    def test_unknown_product_rejects_whole_batch(self):
+        response = self.client.post(self.url, [
+            {'product_id': self.bread.id, 'quantity': 1},
+            {'product_id': 0, 'quantity': 1},
+        ], format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.quantities(), {})
+
+    def test_unknown_cart_is_not_found(self):
+        response = self.client.post(
+            f'/api/cart/{uuid4()}/items/',
+            {'product_id': self.bread.id, 'quantity': 1})
+
+        self.assertEqual(response.status_code, 404)
+
+
+class CheckoutInventoryTests(APITestCase):
+    def setUp(self):
+        collection = Collection.objects.create(title='Grocery')
+        self.bread = Product.objects.create(
+            title='Bread', unit_price=2, inventory=3, collection=collection)
+        self.milk = Product.objects.create(
+            title='Milk', unit_price=1, inventory=1, collection=collection)
+        self.buyer = User.objects.create(username='buyer', email='buyer@example.com')
+        self.client.force_authenticate(self.buyer)
+
+    def checkout(self, **quantities):
+        cart = Cart.objects.create()
+        CartItem.objects.add_items(cart.id, {
+            getattr(self, name).id: quantity
+            for name, quantity in quantities.items()})
+        return self.client.post('/api/orders/', {'cart_id': cart.id})
+
+    def test_checkout_decrements_inventory(self):
+        response = self.checkout(bread=2, milk=1)
+
+        self.assertEqual(response.status_code, 200)
+        self.bread.refresh_from_db()
+        self.milk.refresh_from_db()
+        self.assertEqual((self.bread.inventory, self.milk.inventory), (1, 0))
+
+    def test_cart_checked_out_twice_is_ordered_once(self):
+        cart = Cart.objects.create()
+        CartItem.objects.add_items(cart.id, {self.bread.id: 1})
+        first, second = [
+            CreateOrderSerializer(data={'cart_id': cart.id},
+                                  context={'user_id': self.buyer.id})
+            for _ in range(2)]
+        first.is_valid(raise_exception=True)
+        second.is_valid(raise_exception=True)
+
+        first.save()
+        with self.assertRaises(ValidationError):
+            second.save()
+
+        self.bread.refresh_from_db()
+        self.assertEqual(self.bread.inventory, 2)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_cart_edited_after_validation_is_ordered_as_edited(self):
+        cart = Cart.objects.create()
+        CartItem.objects.add_items(cart.id, {self.bread.id: 1})
+        serializer = CreateOrderSerializer(
+            data={'cart_id': cart.id}, context={'user_id': self.buyer.id})
+        serializer.is_valid(raise_exception=True)
+        CartItem.objects.filter(cart=cart).update(quantity=3)
+
+        order = serializer.save()
+
+        self.assertEqual(order.item_count, 3)
+        self.bread.refresh_from_db()
+        self.assertEqual(self.bread.inventory, 0)
+
+    def test_short_lines_are_reported_and_nothing_is_written(self):
+        response = self.checkout(bread=4, milk=2)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.json()['items']), 2)
+        self.bread.refresh_from_db()
+        self.assertEqual(self.bread.inventory, 3)
+        self.assertFalse(Order.objects.exists())
+
+
+class ConcurrentCheckoutTests(TransactionTestCase):
+    buyers = 12
+    stock = 5
+
+    def setUp(self):
+        collection = Collection.objects.create(title='Flash sale')
+        self.product = Product.objects.create(
+            title='Console', unit_price=300, inventory=self.stock,
+            collection=collection)
+        self.checkouts = []
+        for n in range(self.buyers):
+            user = User.objects.create(
+                username=f'buyer{n}', email=f'buyer{n}@example.com')
+            cart = Cart.objects.create()
+            CartItem.objects.add_items(cart.id, {self.product.id: 1})
+            self.checkouts.append((user, cart.id))
+
+    def checkout(self, user, cart_id):
+        serializer = CreateOrderSerializer(
+            data={'cart_id': cart_id}, context={'user_id': user.id})
+        try:
+            while True:
+                try:
+                    serializer.is_valid(raise_exception=True)
+                    serializer.save()
+                    return 'ordered'
+                except ValidationError:
+                    return 'rejected'
+                except OperationalError:
+                    # SQLite reports lock contention instead of waiting;
+                    # every checkout attempt is atomic, so just retry.
+                    serializer = CreateOrderSerializer(
+                        data={'cart_id': cart_id}, context={'user_id': user.id})
+        finally:
+            close_old_connections()
+
+    def test_parallel_checkouts_never_oversell(self):
+        with ThreadPoolExecutor(max_workers=self.buyers) as pool:
+            statuses = list(pool.map(lambda args: self.checkout(*args), self.checkouts))
+
+        self.product.refresh_from_db()
+        self.assertEqual(statuses.count('ordered'), self.stock)
+        self.assertEqual(statuses.count('rejected'), self.buyers - self.stock)
+        self.assertEqual(self.product.inventory, 0)
+        self.assertEqual(Order.objects.count(), self.stock)
+
+
+class CheckoutQueryBudgetTests(APITestCase):
+    def setUp(self):
+        collection = Collection.objects.create(title='Grocery')
+        self.products = [
+            Product.objects.create(title=f'Item {n}', unit_price=n + 1,
+                                   inventory=10, collection=collection)
+            for n in range(5)]
+        self.client.force_authenticate(User.objects.create(
+            username='buyer', email='buyer@example.com'))
+        self.cart = Cart.objects.create()
+        CartItem.objects.add_items(
+            self.cart.id, {product.id: 2 for product in self.products})
+
+    def test_checkout_runs_a_fixed_number_of_queries(self):
+        # cart lock, cart lines, customer, stock lock, stock update, order,
+        # order items, three sales rollup upserts, three statements to
+        # delete the cart, the confirmation job and the savepoint pair.
+        with self.assertNumQueries(16):
+            response = self.client.post('/api/orders/', {'cart_id': self.cart.id})
+
+        self.assertEqual(response.status_code, 200)
+        order = response.json()
+        self.assertEqual(len(order['items']), 5)
+        self.assertTrue(all(item['id'] for item in order['items']))
+        self.assertEqual(
+            sorted(item['product']['title'] for item in order['items']),
+            [product.title for product in self.products])
+        self.assertFalse(Cart.objects.filter(pk=self.cart.id).exists())
+
+    def test_missing_and_empty_carts_are_rejected(self):
+        empty = Cart.objects.create()
+
+        missing = self.client.post('/api/orders/', {'cart_id': uuid4()})
+        emptied = self.client.post('/api/orders/', {'cart_id': empty.id})
+
+        self.assertEqual(missing.json(), {
+            'cart_id': ['No cart with the given ID was found.']})
+        self.assertEqual(emptied.json(), {'cart_id': ['The cart is empty.']})
+
+
+class IdempotencyKeyTests(APITestCase):
+    def setUp(self):
+        collection = Collection.objects.create(title='Grocery')
+        self.product = Product.objects.create(
+            title='Bread', unit_price=2, inventory=10, collection=collection)
+        self.client.force_authenticate(User.objects.create(
+            username='buyer', email='buyer@example.com'))
+        self.cart = Cart.objects.create()
+        CartItem.objects.add_items(self.cart.id, {self.product.id: 1})
+
+    def post(self, url, data, key):
+        return self.client.post(url, data, format='json',
+                                HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retried_checkout_replays_the_first_order(self):
+        first = self.post('/api/orders/', {'cart_id': self.cart.id}, 'k1')
+        retry = self.post('/api/orders/', {'cart_id': self.cart.id}, 'k1')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_retried_cart_add_does_not_double_quantity(self):
+        url = f'/api/cart/{self.cart.id}/items/'
+        for _ in range(3):
+            self.post(url, {'product_id': self.product.id, 'quantity': 2}, 'k2')
+
+        self.assertEqual(CartItem.objects.get(cart=self.cart).quantity, 3)
+
+    def test_key_reused_with_other_payload_is_rejected(self):
+        url = f'/api/cart/{self.cart.id}/items/'
+        self.post(url, {'product_id': self.product.id, 'quantity': 2}, 'k3')
+        response = self.post(
+            url, {'product_id': self.product.id, 'quantity': 5}, 'k3')
+
+        self.assertEqual(response.status_code, 422)
+
+    def test_in_flight_duplicate_gets_conflict(self):
+        first = self.client.post('/api/cart/', HTTP_IDEMPOTENCY_KEY='k4')
+        IdempotencyKey.objects.update(status_code=None)
+
+        second = self.client.post('/api/cart/', HTTP_IDEMPOTENCY_KEY='k4')
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 409)
+
+    def test_anonymous_cart_creation_is_never_replayed(self):
+        self.client.force_authenticate(None)
+        first = self.client.post('/api/cart/', HTTP_IDEMPOTENCY_KEY='k6')
+        second = self.client.post('/api/cart/', HTTP_IDEMPOTENCY_KEY='k6')
+
+        self.assertEqual(second.status_code, 201)
+        self.assertNotEqual(second.json()['id'], first.json()['id'])
+        self.assertNotIn('Idempotent-Replayed', second)
+
+    def test_anonymous_keys_are_scoped_to_the_cart(self):
+        self.client.force_authenticate(None)
+        url = f'/api/cart/{self.cart.id}/items/'
+        for _ in range(2):
+            self.post(url, {'product_id': self.product.id, 'quantity': 2}, 'k7')
+        other = Cart.objects.create()
+        self.post(f'/api/cart/{other.id}/items/',
+                  {'product_id': self.product.id, 'quantity': 2}, 'k7')
+
+        self.assertEqual(CartItem.objects.get(cart=self.cart).quantity, 3)
+        self.assertEqual(CartItem.objects.get(cart=other).quantity, 2)
+
+    def test_purge_removes_expired_keys(self):
+        self.client.post('/api/cart/', HTTP_IDEMPOTENCY_KEY='k5')
+        IdempotencyKey.objects.update(
+            created_at=timezone.now() - timedelta(days=2))
+
+        call_command('purge_idempotency_keys', stdout=StringIO())
+
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+
+@override_settings(STORE_METRICS_TOKEN='secret')
+class MetricsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        metrics.registry.reset()
+        collection = Collection.objects.create(title='Grocery')
+        Product.objects.create(
+            title='Bread', unit_price=2, inventory=10, collection=collection)
+
+    def test_metrics_require_token_or_staff(self):
+        self.assertIn(self.client.get('/api/_metrics').status_code, (401, 403))
+        self.assertIn(self.client.get(
+            '/api/_metrics', HTTP_X_METRICS_TOKEN='wrong').status_code, (401, 403))
+
+    def test_routes_are_reported_in_prometheus_format(self):
+        self.client.get('/api/products/')
+        self.client.get('/api/products/')
+
+        body = self.client.get(
+            '/api/_metrics', HTTP_X_METRICS_TOKEN='secret').content.decode()
+
+        self.assertIn('store_http_requests_total{route="product-list",'
+                      'method="GET",status="200"} 2', body)
+        self.assertIn('store_http_request_db_queries_count{route="product-list",'
+                      'method="GET"} 2', body)
+        self.assertIn('store_http_request_serializer_duration_seconds_bucket'
+                      '{route="product-list",method="GET",le="+Inf"} 2', body)
+        self.assertIn('store_response_cache_total{namespace="product-list",'
+                      'outcome="hit"} 1', body)
+
+    @override_settings(STORE_METRICS_QUERY_BUDGET=0)
+    def test_query_budget_overruns_are_logged(self):
+        with self.assertLogs('store.middleware', 'WARNING') as logs:
+            self.client.get('/api/products/')
+
+        self.assertIn('over the budget of 0', logs.output[0])
+
+
+class BenchmarkSmokeTests(APITestCase):
+    def test_every_scenario_runs_against_a_tiny_dataset(self):
+        sizes = dict(collections=2, products=20, customers=3, reviews=30,
+                     orders=5, carts=3)
+        dataset = synthetic.generate(sizes, seed=1)
+
+        self.assertEqual(Product.objects.count(), 20)
+        self.assertEqual(Review.objects.count(),
+                         sum(Product.objects.values_list('rating_count', flat=True)))
+        results = benchmarks.run_benchmarks(dataset, iterations=2, seed=1)
+        self.assertEqual(set(results), {
+            'product-list', 'product-list-cursor', 'product-list-filtered',
+            'product-search', 'product-detail', 'cart-add', 'cart-read',
+            'checkout', 'order-history'})
+        for name, result in results.items():
+            self.assertEqual(result['errors'], 0, name)
+
+
+class SeedDatabaseTests(APITestCase):
+    def test_statements_are_split_outside_quotes_and_comments(self):
+        lines = ["insert into t values ('a;b'); -- c;d\n",
+                 "insert into t\n", "values ('it''s');\n"]
+
+        self.assertEqual(list(iter_statements(lines)), [
+            "insert into t values ('a;b')",
+            "insert into t\nvalues ('it''s')"])
+
+    def test_seed_file_loads_into_the_migrated_schema(self):
+        # seed.sql must list every NOT NULL column: the stored counters
+        # only have Python-side defaults.
+        call_command('seed_db', stdout=StringIO())
+
+        self.assertEqual(Product.objects.count(), 1000)
+        self.assertEqual(
+            sum(Collection.objects.values_list('product_count', flat=True)), 1000)
+        self.assertFalse(Product.objects.exclude(rating_count=0).exists())
+        self.assertTrue(ProductSearchTerm.objects.exists())
+
+    def test_synthetic_data_is_generated_with_derived_columns(self):
+        call_command('seed_db', '--synthetic', '--collections=2',
+                     '--products=30', '--customers=4', '--reviews=50',
+                     '--orders=6', '--carts=2', '--chunk-size=7',
+                     stdout=StringIO())
+
+        self.assertEqual(Product.objects.count(), 30)
+        self.assertEqual(
+            sum(Collection.objects.values_list('product_count', flat=True)), 30)
+        self.assertEqual(
+            sum(Product.objects.values_list('rating_count', flat=True)), 50)
+        self.assertEqual(Order.objects.count(), 6)
+        self.assertTrue(ProductSearchTerm.objects.exists())
+
+
+class ProductExportTests(APITestCase):
+    def setUp(self):
+        self.grocery = Collection.objects.create(title='Grocery')
+        self.flowers = Collection.objects.create(title='Flowers')
+        self.bread = Product.objects.create(
+            title='Bread', unit_price=2, inventory=10, collection=self.grocery)
+        self.rose = Product.objects.create(
+            title='Rose', unit_price=5, inventory=3, collection=self.flowers)
+        ProductImage.objects.create(product=self.bread, image='store/images/bread.png')
+        self.client.force_authenticate(
+            User.objects.create(username='admin', email='admin@example.com',
+                                is_staff=True))
+
+    def export(self, **params):
+        response = self.client.get('/api/products/export/', params)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content).decode()
+
+    def test_export_is_admin_only(self):
+        self.client.force_authenticate(
+            User.objects.create(username='bob', email='bob@example.com'))
+
+        response = self.client.get('/api/products/export/')
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_csv_export_streams_every_product_with_image_urls(self):
+        rows = list(csv.DictReader(StringIO(self.export())))
+
+        self.assertEqual([row['title'] for row in rows], ['Bread', 'Rose'])
+        self.assertEqual(rows[0]['images'],
+                         'http://testserver/media/store/images/bread.png')
+        self.assertEqual(rows[1]['images'], '')
+
+    def test_ndjson_export_honours_product_filter(self):
+        lines = self.export(format='ndjson', collection=self.flowers.pk).splitlines()
+
+        self.assertEqual([json.loads(line)['title'] for line in lines], ['Rose'])
+        self.assertEqual(json.loads(lines[0])['unit_price'], 5)
+
+    def test_query_count_does_not_grow_with_the_catalog(self):
+        for n in range(20):
+            product = Product.objects.create(
+                title=f'Product {n}', unit_price=1, inventory=1,
+                collection=self.grocery)
+            ProductImage.objects.create(product=product, image=f'{n}.png')
+
+        with self.assertNumQueries(2):
+            self.assertEqual(len(self.export(format='ndjson').splitlines()), 22)
+
+    def test_export_reads_the_catalog_in_bounded_chunks(self):
+        for n in range(20):
+            Product.objects.create(title=f'Product {n}', unit_price=n % 3,
+                                   inventory=1, collection=self.grocery)
+
+        for ordering, expected in (('id', ['id']),
+                                   ('-unit_price', ['-unit_price', '-id'])):
+            with mock.patch.object(views.ProductExport, 'chunk_size', 5), \
+                    CaptureQueriesContext(connection) as queries:
+                lines = self.export(format='ndjson', ordering=ordering).splitlines()
+
+            ids = [json.loads(line)['id'] for line in lines]
+            expected = Product.objects.order_by(*expected).values_list('id', flat=True)
+            self.assertEqual(ids, list(expected))
+            product_queries = [query['sql'] for query in queries
+                               if 'FROM "store_product"' in query['sql']]
+            # 22 products: four full chunks and a short one.
+            self.assertEqual(len(product_queries), 5)
+            self.assertTrue(all('LIMIT 5' in sql for sql in product_queries))
+
+
+class ProductImportTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.grocery = Collection.objects.create(title='Grocery')
+        self.flowers = Collection.objects.create(title='Flowers')
+        self.bread = Product.objects.create(
+            title='Bread', unit_price=2, inventory=10, collection=self.grocery)
+        self.rose = Product.objects.create(
+            title='Rose', unit_price=5, inventory=3, collection=self.flowers)
+        self.client.force_authenticate(
+            User.objects.create(username='admin', email='admin@example.com',
+                                is_staff=True))
+
+    def post(self, body, content_type, **params):
+        url = '/api/products/import/'
+        if params:
+            url += '?' + '&'.join(f'{k}={v}' for k, v in params.items())
+        return self.client.generic('POST', url, body, content_type=content_type)
+
+    def test_csv_rows_update_and_create_products(self):
+        before = Product.objects.get(pk=self.rose.pk).last_update
+        body = (
+            'id,title,unit_price,inventory,collection\n'
+            f'{self.bread.pk},,2.50,,\n'
+            f'{self.rose.pk},,5,3,\n'
+            ',Tulip,3,7,' f'{self.flowers.pk}\n')
+
+        response = self.post(body, 'text/csv')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {
+            'created': 1, 'updated': 1, 'unchanged': 1, 'errors': []})
+        self.bread.refresh_from_db()
+        self.assertEqual(self.bread.unit_price, Decimal('2.50'))
+        self.assertEqual(self.bread.inventory, 10)
+        self.assertGreater(self.bread.last_update, before)
+        self.assertEqual(Product.objects.get(pk=self.rose.pk).last_update, before)
+        self.assertEqual(Product.objects.get(title='Tulip').inventory, 7)
+        self.assertEqual(
+            Collection.objects.get(pk=self.flowers.pk).product_count, 2)
+
+    def test_invalid_rows_are_reported_and_the_rest_applied(self):
+        body = '\n'.join([
+            json.dumps({'id': self.bread.pk, 'inventory': 4}),
+            json.dumps({'id': 999999, 'inventory': 4}),
+            json.dumps({'title': 'Tulip', 'unit_price': 0.5, 'inventory': 1,
+                        'collection': self.flowers.pk}),
+            '{not json',
+            json.dumps({'title': 'Lily'}),
+        ])
+
+        response = self.post(body, 'application/x-ndjson')
+
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual(response.data['created'], 0)
+        errors = {error['row']: error['errors'] for error in response.data['errors']}
+        self.assertEqual(set(errors), {2, 3, 4, 5})
+        self.assertIn('id', errors[2])
+        self.assertIn('unit_price', errors[3])
+        self.assertIn('non_field_errors', errors[4])
+        self.assertEqual(set(errors[5]), {'unit_price', 'inventory', 'collection'})
+        self.assertEqual(Product.objects.get(pk=self.bread.pk).inventory, 4)
+
+    def test_moves_update_counts_search_index_and_cache(self):
+        self.client.get(f'/api/products/{self.bread.pk}/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post(json.dumps([{'id': self.bread.pk, 'title': 'Baguette',
+                                   'collection': self.flowers.pk}]),
+                      'application/json')
+
+        self.assertEqual(Collection.objects.get(pk=self.grocery.pk).product_count, 0)
+        self.assertEqual(Collection.objects.get(pk=self.flowers.pk).product_count, 2)
+        self.assertEqual(
+            self.client.get('/api/products/', {'search': 'bagu'}).data['count'], 1)
+        response = self.client.get(f'/api/products/{self.bread.pk}/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['title'], 'Baguette')
+
+    def test_created_ids_are_read_back_without_returning_inserts(self):
+        create = ProductQuerySet.bulk_create
+
+        def bulk_create(queryset, objs, *args, **kwargs):
+            objs = create(queryset, objs, *args, **kwargs)
+            # Another writer inserting while the import runs.
+            Product.objects.create(title='Lily', unit_price=4, inventory=1,
+                                   collection=self.flowers)
+            return objs
+
+        body = 'title,slug,unit_price,inventory,collection\n' \
+            f'Tulip,tulip,3,7,{self.flowers.pk}\nIris,,3,2,{self.flowers.pk}\n'
+        with mock.patch.object(type(connection.features),
+                               'can_return_rows_from_bulk_insert',
+                               new_callable=mock.PropertyMock, return_value=False), \
+                mock.patch.object(ProductQuerySet, 'bulk_create', bulk_create):
+            response = self.post(body, 'text/csv')
+
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(
+            dict(Product.objects.filter(title__in=['Tulip', 'Iris'])
+                 .values_list('title', 'slug')),
+            {'Tulip': 'tulip', 'Iris': ''})
+        self.assertEqual(
+            self.client.get('/api/products/', {'search': 'iri'}).data['count'], 1)
+
+    def test_dry_run_writes_nothing(self):
+        response = self.post(f'id,inventory\n{self.bread.pk},1\n', 'text/csv',
+                             dry_run=1)
+
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual(Product.objects.get(pk=self.bread.pk).inventory, 10)
+
+    def test_import_is_admin_only(self):
+        self.client.force_authenticate(
+            User.objects.create(username='bob', email='bob@example.com'))
+
+        response = self.post('id,inventory\n1,1\n', 'text/csv')
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_import_command_reads_a_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'products.csv')
+        with open(path, 'w') as f:
+            f.write(f'id,inventory\n{self.rose.pk},42\n')
+        out = StringIO()
+
+        call_command('import_products', path, stdout=out)
+
+        self.assertIn('0 created, 1 updated', out.getvalue())
+        self.assertEqual(Product.objects.get(pk=self.rose.pk).inventory, 42)
+
+
+class ConditionalRequestTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.grocery = Collection.objects.create(title='Grocery')
+        self.bread = Product.objects.create(
+            title='Bread', unit_price=2, inventory=10, collection=self.grocery)
+        self.admin = User.objects.create(
+            username='admin', email='admin@example.com', is_staff=True)
+
+    def test_unchanged_product_returns_304_without_queries(self):
+        url = f'/api/products/{self.bread.pk}/'
+        response = self.client.get(url)
+        etag = response['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_changes_produce_a_new_etag(self):
+        urls = ['/api/products/', f'/api/products/{self.bread.pk}/',
+                '/api/collections/', f'/api/collections/{self.grocery.pk}/']
+        etags = {url: self.client.get(url)['ETag'] for url in urls}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bread.unit_price = 3
+            self.bread.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.grocery.title = 'Food'
+            self.grocery.save()
+
+        for url in urls:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+            self.assertEqual(response.status_code, 200, url)
+            self.assertNotEqual(response['ETag'], etags[url], url)
+
+    def test_if_modified_since(self):
+        url = f'/api/collections/{self.grocery.pk}/'
+        last_modified = self.client.get(url)['Last-Modified']
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_patch_with_stale_if_match_is_rejected(self):
+        url = f'/api/products/{self.bread.pk}/'
+        etag = self.client.get(url)['ETag']
+        self.client.force_authenticate(self.admin)
+
+        response = self.client.patch(url, {'inventory': 5}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.patch(url, {'inventory': 6}, HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(Product.objects.get(pk=self.bread.pk).inventory, 5)
+
+    def test_cart_etag_follows_its_lines(self):
+        cart = Cart.objects.create()
+        item = CartItem.objects.create(cart=cart, product=self.bread, quantity=1)
+        url = f'/api/cart/{cart.pk}/'
+        etag = self.client.get(url)['ETag']
+
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        item.quantity = 2
+        item.save()
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self.assertEqual(
+            self.client.get('/api/cart/not-a-uuid/').status_code, 404)
+
+    def test_cart_etag_tells_apart_lines_with_the_same_checksum(self):
+        cart = Cart.objects.create()
+        milk = Product.objects.create(
+            title='Milk', unit_price=Decimal('1.25'), inventory=10,
+            collection=self.bread.collection)
+        CartItem.objects.create(id=1001, cart=cart, product=self.bread, quantity=4)
+        CartItem.objects.create(id=3003, cart=cart, product=milk, quantity=1)
+        url = f'/api/cart/{cart.pk}/'
+        etag = self.client.get(url)['ETag']
+
+        # 1001 * 4 + 3003 * 1 == 1001 * 1 + 3003 * 2
+        CartItem.objects.filter(pk=1001).update(quantity=1)
+        CartItem.objects.filter(pk=3003).update(quantity=2)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total_price'], Decimal('4.50'))
+
+
+ASYNC_URLCONF = benchmarks.get_urlconf(async_reads=True)
+
+
+class AsyncReadViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.grocery = Collection.objects.create(title='Grocery')
+        self.bread = Product.objects.create(
+            title='Bread', unit_price=2, inventory=10, collection=self.grocery)
+        self.cart = Cart.objects.create()
+        CartItem.objects.create(cart=self.cart, product=self.bread, quantity=2)
+
+    def async_get(self, url, **extra):
+        # Django 4.1's AsyncClient takes raw header names, not META keys.
+        headers = {name[5:].replace('_', '-'): value
+                   for name, value in extra.items()}
+        async def get():
+            return await self.async_client.get(url, **headers)
+        with self.settings(ROOT_URLCONF=ASYNC_URLCONF):
+            return async_to_sync(get)()
+
+    def test_responses_match_the_sync_views(self):
+        urls = ['/api/products/', f'/api/products/?collection={self.grocery.pk}',
+                f'/api/products/{self.bread.pk}/', '/api/collections/',
+                f'/api/cart/{self.cart.pk}/', f'/api/cart/{self.cart.pk}/items/',
+                f'/api/cart/{self.cart.pk}/?fields=total',
+                f'/api/cart/{self.cart.pk}/items/?fields=total']
+        for url in urls:
+            expected = self.client.get(url, HTTP_X_TAX_REGION='EU')
+            response = self.async_get(url, HTTP_X_TAX_REGION='EU')
+
+            self.assertEqual(response.status_code, 200, url)
+            self.assertEqual(response.json(), expected.json(), url)
+            for header in ('Content-Type', 'ETag', 'Vary', 'Allow'):
+                self.assertEqual(response.get(header), expected.get(header),
+                                 (url, header))
+
+    def test_cache_miss_is_stored_for_the_sync_views(self):
+        url = f'/api/products/{self.bread.pk}/'
+
+        self.assertEqual(self.async_get(url)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+    def test_cache_is_not_called_synchronously_on_the_event_loop(self):
+        store_cache = get_cache()
+
+        def off_the_loop(method):
+            def call(*args, **kwargs):
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    return method(*args, **kwargs)
+                raise AssertionError(f'{method.__name__}() blocked the event loop')
+            return call
+
+        url = f'/api/products/{self.bread.pk}/'
+        with mock.patch.multiple(store_cache, **{
+                name: off_the_loop(getattr(store_cache, name))
+                for name in ('get', 'get_many', 'set', 'add', 'incr')}):
+            self.assertEqual(self.async_get(url)['X-Cache'], 'MISS')
+            self.assertEqual(self.async_get(url)['X-Cache'], 'HIT')
+
+    def test_unchanged_resources_return_304(self):
+        for url, queries in [(f'/api/products/{self.bread.pk}/', 0),
+                             (f'/api/cart/{self.cart.pk}/', 1)]:
+            etag = self.async_get(url)['ETag']
+
+            with self.assertNumQueries(queries):
+                response = self.async_get(url, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(response.status_code, 304, url)
+
+    def test_errors_and_writes_use_the_sync_views(self):
+        empty = Cart.objects.create()
+
+        self.assertEqual(self.async_get('/api/products/0/').status_code, 404)
+        self.assertEqual(self.async_get('/api/cart/not-a-uuid/').status_code, 404)
+        self.assertEqual(self.async_get(f'/api/cart/{uuid4()}/items/').status_code, 404)
+        self.assertEqual(self.async_get(f'/api/cart/{empty.pk}/items/').json(), [])
+        async def post():
+            return await self.async_client.post(
+                f'/api/cart/{empty.pk}/items/',
+                {'product_id': self.bread.pk, 'quantity': 1},
+                content_type='application/json')
+        with self.settings(ROOT_URLCONF=ASYNC_URLCONF):
+            response = async_to_sync(post)()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(empty.items.get().quantity, 1)
+
+
+class TaxTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.grocery = Collection.objects.create(title='Grocery')
+        self.books = Collection.objects.create(title='Books')
+        self.bread = Product.objects.create(
+            title='Bread', unit_price=Decimal('9.99'), inventory=10,
+            collection=self.grocery)
+        self.novel = Product.objects.create(
+            title='Novel', unit_price=Decimal('20.00'), inventory=10,
+            collection=self.books)
+
+    def prices(self, **extra):
+        response = self.client.get('/api/products/', **extra)
+        return {row['title']: row['price_with_tax']
+                for row in response.data['results']}
+
+    def test_fallback_rate_is_rounded_to_cents(self):
+        self.assertEqual(self.prices(),
+                         {'Bread': Decimal('10.99'), 'Novel': Decimal('22.00')})
+
+    def test_region_and_collection_rates(self):
+        TaxRate.objects.create(region='DE', rate=Decimal('0.19'))
+        TaxRate.objects.create(region='DE', collection=self.books,
+                               rate=Decimal('0.07'))
+        TaxRate.objects.create(region='DEFAULT', rate=Decimal('0.05'))
+
+        self.assertEqual(self.prices(HTTP_X_TAX_REGION='de'),
+                         {'Bread': Decimal('11.89'), 'Novel': Decimal('21.40')})
+        self.assertEqual(self.client.get(
+            f'/api/products/{self.novel.pk}/', {'region': 'DE'}
+        ).data['price_with_tax'], Decimal('21.40'))
+        self.assertEqual(self.prices(HTTP_X_TAX_REGION='FR'),
+                         {'Bread': Decimal('10.49'), 'Novel': Decimal('21.00')})
+
+    def test_rates_cost_no_queries_per_product(self):
+        for n in range(10):
+            Product.objects.create(title=f'Product {n}', unit_price=1,
+                                   inventory=1, collection=self.books)
+        self.prices()
+        cache.clear()
+        tax.get_rate_table()
+
+        with self.assertNumQueries(3):
+            self.prices(HTTP_X_TAX_REGION='DE')
+
+    def test_rate_changes_invalidate_cached_prices(self):
+        self.assertEqual(
+            self.prices(HTTP_X_TAX_REGION='DE')['Bread'], Decimal('10.99'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TaxRate.objects.create(region='DE', rate=Decimal('0.19'))
+
+        self.assertEqual(
+            self.prices(HTTP_X_TAX_REGION='DE')['Bread'], Decimal('11.89'))
+        self.assertEqual(self.prices()['Bread'], Decimal('10.99'))
+
+
+@jobs.task
+def failing_task(message):
+    raise RuntimeError(message)
+
+
+class JobQueueTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='bob', email='bob@example.com')
+
+    def test_password_reset_mail_is_sent_by_the_worker(self):
+        known = self.client.post('/api/auth/reset-password/',
+                                 {'email': 'bob@example.com'})
+        unknown = self.client.post('/api/auth/reset-password/',
+                                   {'email': 'nobody@example.com'})
+
+        self.assertEqual(known.status_code, 200)
+        self.assertEqual(unknown.json(), known.json())
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(Job.objects.count(), 1)
+
+        call_command('run_jobs', '--once', stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['bob@example.com'])
+        self.assertIn('/api/auth/reset-password/', mail.outbox[0].body)
+        self.assertFalse(Job.objects.exists())
+
+    def test_checkout_queues_an_order_confirmation(self):
+        collection = Collection.objects.create(title='Grocery')
+        product = Product.objects.create(
+            title='Bread', unit_price=2, inventory=10, collection=collection)
+        cart = Cart.objects.create()
+        CartItem.objects.add_items(cart.pk, {product.pk: 3})
+        self.client.force_authenticate(self.user)
+
+        order_id = self.client.post('/api/orders/', {'cart_id': cart.pk}).json()['id']
+        self.assertEqual(len(mail.outbox), 0)
+        jobs.run_pending()
+
+        self.assertEqual(mail.outbox[0].subject, f'Order #{order_id} confirmed')
+        self.assertIn('3 x Bread @ 2.00', mail.outbox[0].body)
+        self.assertEqual(mail.outbox[0].to, ['bob@example.com'])
+
+    def test_failures_are_retried_with_backoff_then_dead_lettered(self):
+        job = jobs.enqueue(failing_task, max_attempts=2, message='boom')
+
+        with self.assertLogs('store.jobs', 'WARNING'):
+            self.assertEqual(jobs.run_pending(), (0, 1))
+        job.refresh_from_db()
+        self.assertEqual(job.attempts, 1)
+        self.assertIn('RuntimeError: boom', job.last_error)
+        self.assertGreater(job.run_at, timezone.now() + timedelta(seconds=8))
+        self.assertEqual(jobs.run_pending(), (0, 0))
+
+        Job.objects.update(run_at=timezone.now())
+        with self.assertLogs('store.jobs', 'ERROR'):
+            self.assertEqual(jobs.run_pending(), (0, 1))
+
+        self.assertFalse(Job.objects.exists())
+        dead = DeadJob.objects.get()
+        self.assertEqual((dead.name, dead.payload, dead.attempts),
+                         (job.name, {'message': 'boom'}, 2))
+
+        jobs.requeue([dead])
+        self.assertEqual(Job.objects.get().attempts, 0)
+        self.assertFalse(DeadJob.objects.exists())
+
+    def test_claimed_jobs_are_leased(self):
+        jobs.enqueue(failing_task, message='boom')
+
+        self.assertEqual(len(jobs.claim(10)), 1)
+        self.assertEqual(jobs.claim(10), [])
+
+
+def make_png(width, height):
+    buffer = BytesIO()
+    Image.new('RGB', (width, height), 'red').save(buffer, 'PNG')
+    return SimpleUploadedFile('photo.png', buffer.getvalue(), 'image/png')
+
+
+class ImageRenditionTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings = override_settings(MEDIA_ROOT=media.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        collection = Collection.objects.create(title='Grocery')
+        self.product = Product.objects.create(
+            title='Bread', unit_price=2, inventory=10, collection=collection)
+
+    def test_upload_queues_webp_renditions(self):
+        self.product.images.create(image=make_png(2000, 1000))
+        self.assertEqual(Job.objects.get().name, 'store.tasks.generate_image_renditions')
+
+        jobs.run_pending()
+
+        image = self.product.images.get()
+        self.assertEqual(
+            {name: (r['width'], r['height']) for name, r in image.renditions.items()},
+            {'thumbnail': (160, 80), 'card': (480, 240), 'full': (1600, 800)})
+        with Image.open(default_storage.open(image.renditions['card']['name'])) as f:
+            self.assertEqual(f.format, 'WEBP')
+
+    def test_list_returns_only_the_requested_size(self):
+        image = self.product.images.create(image=make_png(100, 100))
+        pending = self.client.get('/api/products/?image_size=card').json()
+        self.assertTrue(
+            pending['results'][0]['images'][0]['image'].endswith('.png'))
+
+        jobs.run_pending()
+        cache.clear()
+        full = self.client.get('/api/products/').json()['results'][0]['images'][0]
+        card = self.client.get('/api/products/?image_size=card').json()['results'][0]
+
+        self.assertEqual(set(full['renditions']), {'thumbnail', 'card', 'full'})
+        # Smaller than the box: kept at its own size.
+        self.assertEqual(full['renditions']['card']['width'], 100)
+        self.assertEqual(card['images'], [{
+            'id': image.pk,
+            'image': f'http://testserver/media/store/images/renditions/{image.pk}-card.webp'}])
+        self.assertEqual(
+            self.client.get('/api/products/?image_size=huge').status_code, 400)
+
+
+class QueryPlanTests(APITestCase):
+    def test_every_plan_uses_an_index(self):
+        out = StringIO()
+        call_command('explain_queries', '--check', stdout=out)
+        self.assertIn('product-list: ok', out.getvalue())
+
+    def test_full_scans_are_flagged(self):
+        output = query_plans.explain(
+            Product.objects.filter(description__contains='bread').order_by('pk'))
+
+        self.assertEqual(query_plans.full_scans(output), ['store_product'])
+
+    def test_index_walks_are_flagged_in_seek_only_plans(self):
+        output = query_plans.explain(
+            ProductSearchTerm.objects.filter(term__startswith='bre')
+            .values('product_id'))
+
+        self.assertEqual(query_plans.full_scans(output), [])
+        self.assertEqual(query_plans.full_scans(output, seek_only=True),
+                         ['store_productsearchterm'])
+
+    def test_keyset_pages_are_read_in_index_order(self):
+        for name in ('order-list', 'product-review-list'):
+            output = query_plans.explain(query_plans.PLANS[name][0]())
+            self.assertNotIn('TEMP B-TREE', output, name)
+        self.assertIn('"store_customer"."user_id" = 1',
+                      str(query_plans.PLANS['order-list'][0]().query))
+
+    def test_allowed_scans_are_not_flagged(self):
+        self.addCleanup(query_plans.PLANS.pop, 'unindexed')
+        query_plans.plan('unindexed', allow_scans=['store_cart'])(
+            lambda: Cart.objects.order_by('created_at'))
+
+        self.assertEqual(list(query_plans.check(['unindexed']))[0][2], [])
+
+
+class ProductReviewListTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        collection = Collection.objects.create(title='Flowers')
+        self.rose = Product.objects.create(
+            title='Rose', unit_price=5, inventory=1, collection=collection)
+        self.customer = User.objects.create(
+            username='reviewer', email='reviewer@example.com').customer
+        today = timezone.now().date()
+        for n in range(25):
+            review = Review.objects.create(
+                product=self.rose, reviewer=self.customer, name=f'r{n}',
+                description='d', rate=n % 5 + 1)
+            Review.objects.filter(pk=review.pk).update(
+                date=today - timedelta(days=n // 2))
+        self.url = f'/api/products/{self.rose.pk}/reviews/'
+
+    def test_reviews_are_paged_newest_first(self):
+        with self.assertNumQueries(1):
+            first = self.client.get(self.url).json()
+        second = self.client.get(first['next']).json()
+
+        names = [row['name'] for row in first['results'] + second['results']]
+        self.assertEqual(len(first['results']), 20)
+        self.assertIsNone(second['next'])
+        self.assertEqual(names, list(
+            Review.objects.order_by('-date', '-id').values_list('name', flat=True)))
+
+    def test_rate_filters(self):
+        exact = self.client.get(self.url, {'rate': 5}).json()['results']
+        minimum = self.client.get(self.url, {'min_rate': 4}).json()['results']
+
+        self.assertEqual({row['rate'] for row in exact}, {5})
+        self.assertEqual(len(exact), 5)
+        self.assertEqual({row['rate'] for row in minimum}, {4, 5})
+        self.assertEqual(len(minimum), 10)
+
+    def test_missing_product_is_404(self):
+        self.assertEqual(
+            self.client.get('/api/products/0/reviews/').status_code, 404)
+        self.assertEqual(
+            self.client.get('/api/products/0/reviews/top/').status_code, 404)
+
+    def test_top_reviews_are_cached_until_a_review_changes(self):
+        url = f'/api/products/{self.rose.pk}/reviews/top/'
+        top = self.client.get(url)
+        self.assertEqual([row['rate'] for row in top.json()], [5] * 5)
+        self.assertEqual(top['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            newest = Review.objects.create(
+                product=self.rose, reviewer=self.customer, name='new',
+                description='d', rate=5)
+        response = self.client.get(url)
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()[0]['id'], newest.pk)
+
+
+class OrderHistoryTests(APITestCase):
+    def setUp(self):
+        collection = Collection.objects.create(title='Grocery')
+        self.bread = Product.objects.create(
+            title='Bread', unit_price=Decimal('2.50'), inventory=100,
+            collection=collection)
+        self.milk = Product.objects.create(
+            title='Milk', unit_price=Decimal('1.25'), inventory=100,
+            collection=collection)
+        self.buyer = User.objects.create(username='buyer', email='buyer@example.com')
+        self.client.force_authenticate(self.buyer)
+        self.order_ids = [self.checkout({self.bread.pk: 2, self.milk.pk: 1})
+                          for _ in range(25)]
+
+    def checkout(self, quantities):
+        cart = Cart.objects.create()
+        CartItem.objects.add_items(cart.pk, quantities)
+        return self.client.post('/api/orders/', {'cart_id': cart.pk}).json()['id']
+
+    def test_checkout_stores_the_summary(self):
+        order = Order.objects.get(pk=self.order_ids[0])
+
+        self.assertEqual(order.item_count, 3)
+        self.assertEqual(order.total_price, Decimal('6.25'))
+
+    def test_history_is_paged_newest_first_in_one_query(self):
+        with self.assertNumQueries(1):
+            first = self.client.get('/api/orders/').json()
+        second = self.client.get(first['next']).json()
+
+        ids = [row['id'] for row in first['results'] + second['results']]
+        self.assertEqual(ids, self.order_ids[::-1])
+        self.assertEqual(first['results'][0]['item_count'], 3)
+        self.assertEqual(first['results'][0]['total_price'], Decimal('6.25'))
+        self.assertNotIn('items', first['results'][0])
+
+    def test_detail_loads_only_the_rendered_product_columns(self):
+        url = f'/api/orders/{self.order_ids[0]}/'
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn('description', queries[1]['sql'])
+        self.assertEqual(
+            sorted(item['product']['title'] for item in response.json()['items']),
+            ['Bread', 'Milk'])
+
+    def test_customers_only_see_their_own_orders(self):
+        other = User.objects.create(username='other', email='other@example.com')
+        self.client.force_authenticate(other)
+
+        self.assertEqual(self.client.get('/api/orders/').json()['results'], [])
+        self.assertEqual(
+            self.client.get(f'/api/orders/{self.order_ids[0]}/').status_code, 404)
+
+
+class KeysetPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        collection = Collection.objects.create(title='Grocery')
+        for n in range(25):
+            Product.objects.create(title=f'Product {n}', unit_price=n % 3,
+                                   inventory=1, collection=collection)
+        self.buyer = User.objects.create(username='buyer', email='buyer@example.com')
+        self.client.force_authenticate(self.buyer)
+        placed_at = timezone.now()
+        for _ in range(25):
+            Order.objects.create(customer=self.buyer.customer)
+        # Equal ordering values leave only the pk tie-breaker to page on.
+        Order.objects.update(placed_at=placed_at)
+
+    def walk(self, url, link):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append([row['id'] for row in response.json()['results']])
+            url = response.json()[link]
+        return pages
+
+    def test_products_page_forward_and_back(self):
+        expected = list(Product.objects.order_by('unit_price', 'id')
+                        .values_list('id', flat=True))
+
+        pages = self.walk('/api/products/?ordering=unit_price&cursor=', 'next')
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        self.assertEqual(sum(pages, []), expected)
+
+        last = self.client.get(
+            '/api/products/?ordering=unit_price&cursor=').json()
+        while last['next']:
+            last = self.client.get(last['next']).json()
+        back = self.walk(last['previous'], 'previous')
+        self.assertEqual(back, pages[-2::-1])
+
+    def test_orders_with_equal_ordering_values_page_on_the_pk(self):
+        expected = list(Order.objects.order_by('-id').values_list('id', flat=True))
+
+        pages = self.walk('/api/orders/', 'next')
+        self.assertEqual([len(page) for page in pages], [20, 5])
+        self.assertEqual(sum(pages, []), expected)
+
+        second = self.client.get(self.client.get('/api/orders/').json()['next']).json()
+        self.assertEqual(self.walk(second['previous'], 'previous'), [pages[0]])
+
+    def test_invalid_cursor_is_not_found(self):
+        wrong_length = urlsafe_b64encode(b'{"p":[1],"r":0}').decode()
+        for url in ('/api/products/', '/api/orders/'):
+            for cursor in ('not-a-cursor', wrong_length):
+                response = self.client.get(url, {'cursor': cursor})
+                self.assertEqual(response.status_code, 404, (url, cursor))
+
+    def test_cursor_values_of_the_wrong_type_are_not_found(self):
+        def cursor(position):
+            return urlsafe_b64encode(
+                json.dumps({'p': position, 'r': 0}).encode()).decode()
+
+        products = {'ordering': 'unit_price'}
+        for url, params, position in [('/api/products/', products, ['x', 1]),
+                                      ('/api/products/', products, [None, 1]),
+                                      ('/api/orders/', {}, ['yesterday', 1]),
+                                      ('/api/orders/', {}, [[], 1])]:
+            response = self.client.get(url, {**params, 'cursor': cursor(position)})
+            self.assertEqual(response.status_code, 404, (url, position))
+
+        # A cursor kept across an ?ordering change.
+        next_url = self.client.get('/api/orders/').json()['next']
+        cursor = next_url.split('cursor=')[1]
+        response = self.client.get(
+            '/api/products/', {'ordering': 'unit_price', 'cursor': cursor})
+        self.assertEqual(response.status_code, 404)
+
+    def test_pages_run_no_count_query(self):
+        for url in ('/api/products/?cursor=', '/api/orders/'):
+            with CaptureQueriesContext(connection) as queries:
+                next_url = self.client.get(url).json()['next']
+                self.client.get(next_url)
+
+            self.assertTrue(queries)
+            self.assertFalse(
+                [query['sql'] for query in queries if 'COUNT(' in query['sql']], url)
+
+
+class SalesReportTests(APITestCase):
+    def setUp(self):
+        grocery = Collection.objects.create(title='Grocery')
+        toys = Collection.objects.create(title='Toys')
+        self.bread = Product.objects.create(
+            title='Bread', unit_price=Decimal('2.50'), inventory=100,
+            collection=grocery)
+        self.ball = Product.objects.create(
+            title='Ball', unit_price=Decimal('10.00'), inventory=100,
+            collection=toys)
+        self.admin = User.objects.create(
+            username='admin', email='admin@example.com', is_staff=True)
+        self.client.force_authenticate(self.admin)
+        self.first = self.checkout({self.bread.pk: 2, self.ball.pk: 1})
+        self.second = self.checkout({self.bread.pk: 4})
+
+    def checkout(self, quantities):
+        cart = Cart.objects.create()
+        CartItem.objects.add_items(cart.pk, quantities)
+        return self.client.post('/api/orders/', {'cart_id': cart.pk}).json()['id']
+
+    def get_report(self, **params):
+        response = self.client.get('/api/reports/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_checkout_updates_the_rollups(self):
+        # Days by status, top products, their titles and collections;
+        # never the order tables.
+        with CaptureQueriesContext(connection) as queries:
+            report = self.get_report()
+        self.assertEqual(len(queries), 4)
+        self.assertFalse(any('store_order' in query['sql'] for query in queries))
+
+        self.assertEqual(report['totals'],
+                         {'orders': 2, 'units': 7, 'revenue': Decimal('25.00')})
+        self.assertEqual(report['by_status']['P'],
+                         {'orders': 2, 'units': 7, 'revenue': Decimal('25.00')})
+        self.assertEqual(len(report['daily']), 30)
+        self.assertEqual(report['daily'][-1]['date'], str(timezone.localdate()))
+        self.assertEqual(report['daily'][-1]['revenue'], Decimal('25.00'))
+        self.assertEqual(report['daily'][0]['orders'], 0)
+        self.assertEqual(
+            [(row['title'], row['units'], row['revenue']) for row in report['products']],
+            [('Bread', 6, Decimal('15.00')), ('Ball', 1, Decimal('10.00'))])
+        self.assertEqual(
+            [(row['title'], row['revenue']) for row in report['collections']],
+            [('Grocery', Decimal('15.00')), ('Toys', Decimal('10.00'))])
+
+    def test_status_changes_move_the_order_between_buckets(self):
+        response = self.client.patch(f'/api/orders/{self.first}/',
+                                     {'payment_status': 'C'})
+        self.assertEqual(response.status_code, 200)
+        self.client.patch(f'/api/orders/{self.first}/', {'payment_status': 'C'})
+
+        by_status = self.get_report()['by_status']
+        self.assertEqual(by_status['P'], {'orders': 1, 'units': 4, 'revenue': Decimal('10.00')})
+        self.assertEqual(by_status['C'], {'orders': 1, 'units': 3, 'revenue': Decimal('15.00')})
+        self.assertEqual(by_status['F'], {'orders': 0, 'units': 0, 'revenue': Decimal('0.00')})
+
+    def test_admin_edits_move_the_order_between_buckets(self):
+        self.admin.is_superuser = True
+        self.admin.save()
+        self.client.force_login(self.admin)
+        order = Order.objects.get(pk=self.first)
+
+        response = self.client.post(f'/admin/store/order/{order.pk}/change/', {
+            'customer': order.customer_id, 'payment_status': 'C',
+            'item_count': 100, 'total_price': '1.00'})
+
+        self.assertEqual(response.status_code, 302)
+        order.refresh_from_db()
+        self.assertEqual((order.item_count, order.total_price), (3, Decimal('15.00')))
+        by_status = self.get_report()['by_status']
+        self.assertEqual(by_status['P'], {'orders': 1, 'units': 4, 'revenue': Decimal('10.00')})
+        self.assertEqual(by_status['C'], {'orders': 1, 'units': 3, 'revenue': Decimal('15.00')})
+
+    def test_deleted_orders_leave_the_rollups(self):
+        before = self.get_report()
+        response = self.client.delete(f'/api/orders/{self.first}/')
+        self.assertEqual(response.status_code, 405)
+
+        self.admin.is_superuser = True
+        self.admin.save()
+        self.client.force_login(self.admin)
+        self.client.post('/admin/store/order/add/', {
+            'customer': self.admin.customer.pk, 'payment_status': 'P'})
+        added = Order.objects.latest('pk')
+        self.assertEqual(self.get_report()['totals']['orders'], 3)
+
+        response = self.client.delete(f'/api/orders/{added.pk}/')
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.get_report(), before)
+
+    def test_rebuild_matches_the_incremental_rollups(self):
+        self.client.patch(f'/api/orders/{self.second}/', {'payment_status': 'F'})
+        before = self.get_report()
+        DailySales.objects.all().delete()
+        DailyProductSales.objects.update(units=0)
+
+        call_command('rebuild_rollups', stdout=StringIO())
+
+        self.assertEqual(self.get_report(), before)
+
+    def test_range_and_limit(self):
+        today = timezone.localdate()
+        report = self.get_report(start=str(today - timedelta(days=2)),
+                                 end=str(today), limit=1)
+        self.assertEqual(len(report['daily']), 3)
+        self.assertEqual([row['title'] for row in report['products']], ['Bread'])
+
+        report = self.get_report(start=str(today - timedelta(days=7)),
+                                 end=str(today - timedelta(days=1)))
+        self.assertEqual(report['totals']['orders'], 0)
+        self.assertEqual(report['products'], [])
+
+        response = self.client.get('/api/reports/', {'start': str(today),
+                                                     'end': str(today - timedelta(days=1))})
+        self.assertEqual(response.status_code, 400)
+
+    def test_admins_only(self):
+        customer = User.objects.create(username='buyer', email='buyer@example.com')
+        self.client.force_authenticate(customer)
+
+        self.assertEqual(self.client.get('/api/reports/').status_code, 403)
+
+
+class RecommendationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.grocery = Collection.objects.create(title='Grocery')
+        self.toys = Collection.objects.create(title='Toys')
+        self.bread, self.milk, self.butter = [
+            Product.objects.create(title=title, unit_price=Decimal('2.00'),
+                                   inventory=100, collection=self.grocery)
+            for title in ('Bread', 'Milk', 'Butter')]
+        self.ball = Product.objects.create(
+            title='Ball', unit_price=Decimal('10.00'), inventory=100,
+            collection=self.toys)
+        self.client.force_authenticate(
+            User.objects.create(username='buyer', email='buyer@example.com'))
+
+    def checkout(self, quantities):
+        cart = Cart.objects.create()
+        CartItem.objects.add_items(cart.pk, quantities)
+        self.client.post('/api/orders/', {'cart_id': cart.pk})
+
+    def build(self):
+        # Let the orders settle.
+        Order.objects.update(placed_at=timezone.now() - timedelta(hours=1))
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('build_recommendations', '--batch-size', '2',
+                         stdout=StringIO())
+
+    def related(self, product):
+        response = self.client.get(f'/api/products/{product.pk}/related/')
+        self.assertEqual(response.status_code, 200)
+        return [(row['product']['title'], row['orders']) for row in response.json()]
+
+    def test_related_products_are_ranked_by_shared_orders(self):
+        self.checkout({self.bread.pk: 1, self.milk.pk: 1})
+        self.checkout({self.bread.pk: 1, self.milk.pk: 1, self.butter.pk: 1})
+        self.checkout({self.bread.pk: 1, self.ball.pk: 1})
+        self.build()
+
+        self.assertEqual(self.related(self.bread),
+                         [('Milk', 2), ('Butter', 1), ('Ball', 1)])
+        self.assertEqual(self.related(self.ball), [('Bread', 1)])
+
+    def test_runs_only_fold_in_new_settled_orders(self):
+        self.checkout({self.bread.pk: 1, self.milk.pk: 1})
+        self.build()
+        self.checkout({self.bread.pk: 1, self.milk.pk: 1})
+        # Not settled yet.
+        call_command('build_recommendations', stdout=StringIO())
+        self.assertEqual(self.related(self.bread), [('Milk', 1)])
+
+        self.build()
+        self.build()
+        self.assertEqual(self.related(self.bread), [('Milk', 2)])
+        self.assertEqual(Watermark.objects.get(name='recommendations').value,
+                         Order.objects.latest('pk').pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('build_recommendations', '--reset', stdout=StringIO())
+        self.assertEqual(self.related(self.bread), [('Milk', 2)])
+
+    def test_watermark_stops_at_the_first_unsettled_order(self):
+        self.checkout({self.bread.pk: 1, self.milk.pk: 1})
+        self.checkout({self.bread.pk: 1, self.butter.pk: 1})
+        first, second = Order.objects.order_by('pk')
+        now = timezone.now()
+        # The lower pk got the later placed_at.
+        Order.objects.filter(pk=first.pk).update(placed_at=now - timedelta(minutes=4))
+        Order.objects.filter(pk=second.pk).update(placed_at=now - timedelta(minutes=6))
+
+        self.assertEqual(recommendations.update_batch(now=now), 0)
+        self.assertEqual(recommendations.update_batch(
+            now=now + timedelta(minutes=2)), 2)
+        self.assertEqual(ProductPair.objects.filter(product=self.bread).count(), 2)
+
+    def test_bestsellers_follow_units_sold_and_moved_products(self):
+        self.checkout({self.bread.pk: 1, self.milk.pk: 5, self.ball.pk: 2})
+        self.checkout({self.bread.pk: 2})
+        self.build()
+
+        response = self.client.get(f'/api/collections/{self.grocery.pk}/bestsellers/')
+        self.assertEqual(
+            [(row['product']['title'], row['units']) for row in response.json()],
+            [('Milk', 5), ('Bread', 3)])
+
+        self.milk.collection = self.toys
+        self.milk.save()
+        response = self.client.get(f'/api/collections/{self.toys.pk}/bestsellers/')
+        self.assertEqual([row['product']['title'] for row in response.json()],
+                         ['Milk', 'Ball'])
+
+    def test_bestsellers_follow_products_moved_by_import(self):
+        self.checkout({self.milk.pk: 5, self.ball.pk: 2})
+        self.build()
+        admin = User.objects.create(
+            username='admin', email='admin@example.com', is_staff=True)
+        self.client.force_authenticate(admin)
+
+        response = self.client.generic(
+            'POST', '/api/products/import/',
+            f'id,collection\n{self.milk.pk},{self.toys.pk}\n',
+            content_type='text/csv')
+
+        self.assertEqual(response.json()['updated'], 1)
+        self.assertEqual(ProductSales.objects.get(pk=self.milk.pk).collection_id,
+                         self.toys.pk)
+        response = self.client.get(f'/api/collections/{self.toys.pk}/bestsellers/')
+        self.assertEqual([row['product']['title'] for row in response.json()],
+                         ['Milk', 'Ball'])
+        self.assertEqual(
+            self.client.get(f'/api/collections/{self.grocery.pk}/bestsellers/').json(),
+            [])
+
+        Product.objects.filter(pk=self.milk.pk).update(collection=self.grocery)
+        self.assertEqual(ProductSales.objects.get(pk=self.milk.pk).collection_id,
+                         self.grocery.pk)
+
+    def test_responses_are_cached_until_the_next_run(self):
+        self.checkout({self.bread.pk: 1, self.milk.pk: 1})
+        self.build()
+        url = f'/api/products/{self.bread.pk}/related/'
+
+        first = self.client.get(url)
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(first['Cache-Control'], 'public, max-age=300')
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        self.checkout({self.bread.pk: 1, self.butter.pk: 1})
+        self.build()
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        self.assertEqual(self.related(self.bread), [('Milk', 1), ('Butter', 1)])
+
+    def test_unknown_product_or_collection(self):
+        self.assertEqual(self.client.get('/api/products/999/related/').status_code, 404)
+        self.assertEqual(
+            self.client.get('/api/collections/999/bestsellers/').status_code, 404)
+        self.assertEqual(
+            self.client.get(f'/api/products/{self.ball.pk}/related/').json(), [])
+
+
+class CartTotalTests(APITestCase):
+    def setUp(self):
+        collection = Collection.objects.create(title='Grocery')
+        self.bread = Product.objects.create(
+            title='Bread', description='Baked daily', unit_price=Decimal('2.50'),
+            inventory=100, collection=collection)
+        self.milk = Product.objects.create(
+            title='Milk', description='Whole', unit_price=Decimal('1.25'),
+            inventory=100, collection=collection)
+        self.cart = Cart.objects.create()
+        CartItem.objects.add_items(self.cart.pk, {self.bread.pk: 3, self.milk.pk: 2})
+
+    def test_totals_are_summed_by_the_database(self):
+        url = f'/api/cart/{self.cart.pk}/'
+        with CaptureQueriesContext(connection) as queries:
+            cart = self.client.get(url).json()
+
+        # ETag state, the cart with its total, its lines.
+        self.assertEqual(len(queries), 3)
+        self.assertNotIn('description', queries[2]['sql'])
+        self.assertEqual(cart['total_price'], Decimal('10.00'))
+        self.assertEqual(
+            sorted((item['product']['title'], item['total_price'])
+                   for item in cart['items']),
+            [('Bread', Decimal('7.50')), ('Milk', Decimal('2.50'))])
+
+        items = self.client.get(f'{url}items/').json()
+        self.assertEqual(sorted(item['total_price'] for item in items),
+                         [Decimal('2.50'), Decimal('7.50')])
+        item = self.client.get(f'{url}items/{items[0]["id"]}').json()
+        self.assertEqual(item['total_price'], items[0]['total_price'])
+
+    def test_totals_only(self):
+        expected = {'id': str(self.cart.pk), 'item_count': 5,
+                    'total_price': Decimal('10.00')}
+        url = f'/api/cart/{self.cart.pk}/'
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'fields': 'total'})
+
+        self.assertEqual(response.json(), expected)
+        self.assertNotEqual(response['ETag'], self.client.get(url)['ETag'])
+        self.assertEqual(self.client.get(f'{url}items/', {'fields': 'total'}).json(),
+                         expected)
+
+    def test_empty_and_new_carts_total_zero(self):
+        empty = Cart.objects.create()
+        self.assertEqual(
+            self.client.get(f'/api/cart/{empty.pk}/', {'fields': 'total'}).json(),
+            {'id': str(empty.pk), 'item_count': 0, 'total_price': 0})
+        self.assertEqual(self.client.post('/api/cart/').json()['total_price'], 0)
+        self.assertEqual(
+            self.client.get(f'/api/cart/{uuid4()}/items/', {'fields': 'total'}).status_code,
+            404)
@@ -1,49 +1,137 @@
-from django.conf import settings
-from django.http import Http404
-from django.db.models.aggregates import Count
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
-from django.core.mail import send_mail
-from django.utils.encoding import force_bytes
-from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
+from django.utils.http import urlsafe_base64_decode
 from django.shortcuts import get_object_or_404
+from django.db.models import Prefetch
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django.contrib.auth.tokens import default_token_generator
-from django.utils.encoding import force_bytes, force_str
+from django.utils.encoding import force_str
 
 ##############################################################
 
 from rest_framework import status
+from rest_framework.exceptions import ParseError
 from rest_framework import generics
 from rest_framework import permissions
+from rest_framework.parsers import JSONParser
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 
 ##############################################################
 
 from . import serializers
 from .models import *
-from .filters import ProductFilter
-from .pagination import DefaultPagination
+from .filters import ProductFilter, ProductSearchFilter, ReviewFilter
+from .pagination import (DefaultPagination, KeysetPagination, OrderPagination,
+                         ReviewPagination)
+from .parsers import CSVParser, NDJSONParser
+from .renderers import CSVStreamRenderer, NDJSONStreamRenderer
+from . import cache, importer, jobs, metrics, recommendations, rollups, tasks, tax
+from .cache import CachedResponseMixin
+from .idempotency import idempotent
 from .permissions import *
 from datetime import datetime, timedelta
+import hashlib
+from types import GeneratorType
+from uuid import UUID
 
 
-class ProductList(generics.ListCreateAPIView):
+class ProductList(CachedResponseMixin, generics.ListCreateAPIView):
     queryset = Product.objects.prefetch_related('images').all()
     serializer_class = serializers.ProductSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend,
+                       ProductSearchFilter, OrderingFilter]
     pagination_class = DefaultPagination
     filterset_class = ProductFilter
-    search_fields = ['title', 'description']
-    ordering_fields = ['unit_price', 'id']
+    ordering_fields = ['unit_price', 'id', 'rating_average', 'rating_count']
     permission_classes = [IsAdminOrReadOnly]
+    cache_namespace = 'product-list'
+    cache_extra_scopes = [('tax',)]
+    cache_vary_headers = [tax.REGION_HEADER]
 
+    def get_cache_scopes(self, request):
+        # Normalized like the filter does, so `?collection=01` is keyed on
+        # the version `bump_collection(1)` invalidates.
+        try:
+            return [('collection', int(request.query_params['collection']))]
+        except (KeyError, ValueError):
+            # Every product change bumps the catalog.
+            return [('catalog',)]
+
+    def get_cache_variant(self, request):
+        return [tax.get_region(request)]
+
+
+class ProductExport(generics.GenericAPIView):
+    queryset = Product.objects.prefetch_related('images').order_by('pk')
+    filter_backends = [DjangoFilterBackend,
+                       ProductSearchFilter, OrderingFilter]
+    filterset_class = ProductFilter
+    ordering_fields = ['unit_price', 'id', 'rating_average', 'rating_count']
+    renderer_classes = [CSVStreamRenderer, NDJSONStreamRenderer]
+    permission_classes = [permissions.IsAdminUser]
+    swagger_schema = None
+    chunk_size = 2000
+    fields = ['id', 'title', 'slug', 'description', 'unit_price', 'inventory',
+              'collection_id', 'rating_count', 'rating_average',
+              'last_update', 'images']
+
+    def get(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = request.accepted_renderer
+        # Keyset chunks keep one chunk of products (and their prefetched
+        # images) in memory at a time instead of the whole catalog.
+        products = KeysetPagination().iterate_queryset(
+            queryset, request, self, self.chunk_size)
+        rows = (self.get_row(product) for product in products)
+        response = StreamingHttpResponse(
+            renderer.stream(self.fields, rows),
+            content_type=f'{renderer.media_type}; charset={renderer.charset}')
+        response['Content-Disposition'] = \
+            f'attachment; filename="products.{renderer.format}"'
+        return response
+
+    def get_row(self, product):
+        row = {field: getattr(product, field) for field in self.fields[:-1]}
+        row['images'] = [self.request.build_absolute_uri(image.image.url)
+                         for image in product.images.all() if image.image]
+        return row
+
+
+class ProductImport(APIView):
+    parser_classes = [CSVParser, NDJSONParser, JSONParser]
+    permission_classes = [permissions.IsAdminUser]
+    swagger_schema = None
+    chunk_size = 1000
+
+    def post(self, request):
+        rows = request.data
+        if isinstance(rows, dict):
+            rows = [rows]
+        if not isinstance(rows, (list, GeneratorType)):
+            raise ParseError('Expected a list of products.')
+        dry_run = request.query_params.get('dry_run') in ('1', 'true')
+        result = importer.import_products(rows, self.chunk_size, dry_run)
+        return Response(result.as_dict())
 
-class ProductDetail(generics.RetrieveUpdateDestroyAPIView):
+
+class ProductDetail(CachedResponseMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Product.objects.prefetch_related('images').all()
     serializer_class = serializers.ProductSerializer
     permission_classes = [IsAdminOrReadOnly]
     partial = True
+    cache_namespace = 'product-detail'
+    cache_extra_scopes = [('tax',)]
+    cache_vary_headers = [tax.REGION_HEADER]
+
+    def get_cache_scopes(self, request, pk):
+        return [('product', pk)]
+
+    def get_cache_variant(self, request):
+        return [tax.get_region(request)]
 
     def delete(self, request, pk):
         product = get_object_or_404(Product, pk=pk)
@@ -54,32 +142,67 @@ class ProductDetail(generics.RetrieveUpdateDestroyAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class CollectionList(generics.ListCreateAPIView):
-    queryset = Collection.objects.annotate(
-        product_count=Count('products')).all()
+class CollectionList(CachedResponseMixin, generics.ListCreateAPIView):
+    queryset = Collection.objects.all()
 
     serializer_class = serializers.CollectionSerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_namespace = 'collection-list'
+    # Product changes bump the catalog version and may move counts.
+    cache_scopes = [('collections',), ('catalog',)]
 
 
-class CollectionDetail(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Collection.objects.annotate(
-        product_count=Count('products')).all()
+class CollectionDetail(CachedResponseMixin, generics.RetrieveUpdateDestroyAPIView):
+    queryset = Collection.objects.all()
 
     serializer_class = serializers.CollectionSerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_namespace = 'collection-detail'
+
+    def get_cache_scopes(self, request, pk):
+        return [('collection', pk)]
 
     def delete(self, request, pk):
         collection = get_object_or_404(Collection, pk=pk)
-        if collection.products.count() > 0:
+        if collection.product_count > 0:
             return Response({'error': 'Collection cannot be deleted because it includes one or more products.'},
                             status=status.HTTP_405_METHOD_NOT_ALLOWED)
         collection.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class ProductReviewList(generics.ListCreateAPIView):
+class CollectionBestsellers(CachedResponseMixin, generics.ListAPIView):
+    """The collection's products with the most units sold."""
+    serializer_class = serializers.BestsellerSerializer
+    cache_namespace = 'collection-bestsellers'
+    cache_extra_scopes = [('catalog',), ('recommendations',)]
+    cache_max_age = recommendations.MAX_AGE
+    size = 10
+
+    def get_cache_scopes(self, request, pk):
+        return [('bestsellers', pk)]
+
+    def get_queryset(self):
+        return ProductSales.objects.filter(collection_id=self.kwargs['pk']) \
+            .select_related('product') \
+            .only('units', 'product__title', 'product__unit_price') \
+            .order_by('-units', 'product_id')[:self.size]
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if not response.data and not Collection.objects.filter(
+                pk=self.kwargs['pk']).exists():
+            raise Http404
+        return response
+
+
+class ProductReviewList(CachedResponseMixin, generics.ListCreateAPIView):
     serializer_class = serializers.ReviewSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = ReviewFilter
+    pagination_class = ReviewPagination
+    ordering = ['-date', '-id']
+    cache_namespace = 'product-review-list'
 
     def get_permissions(self):
         if self.request.method in permissions.SAFE_METHODS:
@@ -87,18 +210,72 @@ class ProductReviewList(generics.ListCreateAPIView):
         elif self.request.method == 'POST':
             return [permissions.IsAuthenticated()]
 
+    def get_cache_scopes(self, request, pk):
+        return [('reviews', pk)]
+
     def get_queryset(self):
-        product_id = self.kwargs['pk']
-        if Product.objects.filter(pk=product_id).exists():
-            self.queryset = Review.objects.filter(product=product_id)
-            return self.queryset
-        raise Http404
+        return Review.objects.filter(product_id=self.kwargs['pk'])
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        # Only an empty page can be a missing product, so the existence
+        # check stays off the common path.
+        if not response.data['results'] and not Product.objects.filter(
+                pk=self.kwargs['pk']).exists():
+            raise Http404
+        return response
 
     def get_serializer_context(self):
         return {"product_id": self.kwargs["pk"],
                 "reviewer_id": self.request.user.id}
 
 
+class TopProductReviews(CachedResponseMixin, generics.ListAPIView):
+    """The product's best rated reviews, newest first among equal rates."""
+    serializer_class = serializers.ReviewSerializer
+    cache_namespace = 'product-review-top'
+    size = 5
+
+    def get_cache_scopes(self, request, pk):
+        return [('reviews', pk)]
+
+    def get_queryset(self):
+        return Review.objects.filter(product_id=self.kwargs['pk']) \
+            .order_by('-rate', '-date', '-id')[:self.size]
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if not response.data and not Product.objects.filter(
+                pk=self.kwargs['pk']).exists():
+            raise Http404
+        return response
+
+
+class RelatedProducts(CachedResponseMixin, generics.ListAPIView):
+    """Products most often ordered together with this one."""
+    serializer_class = serializers.RelatedProductSerializer
+    cache_namespace = 'product-related'
+    cache_extra_scopes = [('catalog',), ('recommendations',)]
+    cache_max_age = recommendations.MAX_AGE
+    size = 10
+
+    def get_cache_scopes(self, request, pk):
+        return [('related', pk)]
+
+    def get_queryset(self):
+        return ProductPair.objects.filter(product_id=self.kwargs['pk']) \
+            .select_related('related') \
+            .only('orders', 'related__title', 'related__unit_price') \
+            .order_by('-orders', 'related_id')[:self.size]
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if not response.data and not Product.objects.filter(
+                pk=self.kwargs['pk']).exists():
+            raise Http404
+        return response
+
+
 class ProductReviewDetail(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = serializers.ReviewSerializer
 
@@ -114,13 +291,61 @@ class CartCreate(generics.CreateAPIView):
     serializer_class = serializers.CartSerializer
     queryset = Cart.objects.all()
 
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
 
+def cart_state(pk):
+    # The cart's lines in id order, narrowed to what the body depends on
+    # instead of serializing them: any added, removed or requantified line
+    # changes the rows, a price change the product's last_update. An empty
+    # cart is a single row of NULLs, a missing one no row at all.
+    return Cart.objects.filter(pk=pk).order_by('items__id').values_list(
+        'items__id', 'items__product_id', 'items__quantity',
+        'items__product__last_update')
+
+
+def cart_totals_only(request):
+    return request.GET.get('fields') == 'total'
+
+
+def format_cart_etag(pk, state, totals_only=False):
+    digest = hashlib.sha1(repr((pk, *state, totals_only)).encode('utf-8')).hexdigest()
+    return f'W/"{digest}"'
+
+
+def cart_etag(request, pk):
+    try:
+        UUID(pk)
+    except ValueError:
+        return None
+    state = tuple(cart_state(pk))
+    if not state:
+        return None
+    return format_cart_etag(pk, state, cart_totals_only(request))
+
+
+@method_decorator(condition(etag_func=cart_etag), name='get')
 class CartRetrieve(generics.RetrieveDestroyAPIView):
-    serializer_class = serializers.CartSerializer
-    queryset = Cart.objects.prefetch_related('items__product').all()
+    """`?fields=total` returns the cart's totals without its lines."""
+
+    def get_queryset(self):
+        carts = Cart.objects.with_totals()
+        if cart_totals_only(self.request):
+            return carts
+        return carts.prefetch_related(
+            Prefetch('items', queryset=CartItem.objects.priced()))
+
+    def get_serializer_class(self):
+        if cart_totals_only(self.request):
+            return serializers.CartTotalSerializer
+        return serializers.CartSerializer
 
 
 class CartItemsList(generics.GenericAPIView):
+    # The cart id in the path is the anonymous client's credential.
+    idempotent_anonymous = True
 
     def get_serializer_class(self):
         if self.request.method == 'GET':
@@ -133,20 +358,27 @@ class CartItemsList(generics.GenericAPIView):
             return self.queryset
         pk = self.kwargs['pk']
         if Cart.objects.filter(pk=pk).exists():
-            self.queryset = CartItem.objects.filter(
-                cart_id=pk).select_related('product')
+            self.queryset = CartItem.objects.filter(cart_id=pk).priced()
             return self.queryset
         raise Http404()
 
     def get(self, request, pk):
+        if cart_totals_only(request):
+            cart = get_object_or_404(Cart.objects.with_totals(), pk=pk)
+            return Response(serializers.CartTotalSerializer(cart).data)
         obj = self.get_queryset()
         serializer = self.get_serializer(obj, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @idempotent
     def post(self, request, pk):
-        context = {"cart_id": pk}
+        try:
+            context = {"cart_id": UUID(pk)}
+        except ValueError:
+            raise Http404()
         serializer = self.get_serializer(
-            data=request.data, context=context)
+            data=request.data, many=isinstance(request.data, list),
+            context=context)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
@@ -160,7 +392,7 @@ class CartItemDetail(generics.GenericAPIView):
             return serializers.UpdateCartItemSerializer
 
     def get(self, request, cart_id, pk):
-        obj = get_object_or_404(CartItem, pk=pk, cart_id=cart_id)
+        obj = get_object_or_404(CartItem.objects.priced(), pk=pk, cart_id=cart_id)
         serializer = self.get_serializer(obj)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -237,22 +469,13 @@ class PasswordReset(generics.GenericAPIView):
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
         email = serializer.validated_data['email']
-        try:
-            user = User.objects.get(email=email)
-            uid = urlsafe_base64_encode(force_bytes(user.pk))
-
-            token = default_token_generator.make_token(user)
-            reset_url = f"http://localhost:8000//api/auth/reset-password/{uid}/{token}"
-            send_mail(
-                'Reset Your Password',
-                f'Please click on this link to reset your password: {reset_url}',
-                settings.EMAIL_HOST_USER,
-                [email],
-            )
-        except User.DoesNotExist:
-            return Response({'no user found with given email'}, status=status.HTTP_400_BAD_REQUEST)
-
-        return Response({'success': 'Password reset Email sent to the specified email address'})
+        # Same answer whether or not the address is registered; the mail
+        # is sent by the job worker.
+        user_id = User.objects.filter(email=email) \
+            .values_list('pk', flat=True).first()
+        if user_id is not None:
+            jobs.enqueue(tasks.send_password_reset_email, user_id=user_id)
+        return Response({'success': 'If the email address is registered, a password reset email has been sent to it'})
 
 
 class PasswordResetConfirmation(generics.GenericAPIView):
@@ -309,21 +532,20 @@ class CustomerProfile(generics.GenericAPIView):
         return Response(serializer.data)
 
 
+def customer_orders(user):
+    if user.is_staff:
+        return Order.objects.all()
+    return Order.objects.filter(customer__user_id=user.id)
+
+
 class OrderList(generics.ListCreateAPIView):
+    """Order summaries, newest first; the lines are on the order detail."""
+    ordering = ['-placed_at', '-id']
 
     def get_queryset(self):
-        if self.queryset is not None:
-            return self.queryset
-        user = self.request.user
-        if user.is_staff:
-            self.queryset = Order.objects.prefetch_related(
-                'items__product').all()
-        else:
-            customer_id = Customer.objects.get(user_id=user.id)
-            self.queryset = Order.objects.prefetch_related(
-                'items__product').filter(customer_id=customer_id)
-        return self.queryset
+        return customer_orders(self.request.user)
 
+    @idempotent
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(
             data=request.data,
@@ -336,15 +558,22 @@ class OrderList(generics.ListCreateAPIView):
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return serializers.CreateOrderSerializer
-        return serializers.OrderSerializer
+        return serializers.OrderSummarySerializer
 
-    pagination_class = DefaultPagination
+    pagination_class = OrderPagination
     permission_classes = [permissions.IsAuthenticated]
 
 
 class OrderDetail(generics.RetrieveUpdateDestroyAPIView):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
-    queryset = Order.objects.all()
+
+    def get_queryset(self):
+        # Only the product columns SimpleProductSerializer renders.
+        items = OrderItem.objects.select_related('product').only(
+            'order_id', 'quantity', 'unit_price',
+            'product__title', 'product__unit_price')
+        return customer_orders(self.request.user).prefetch_related(
+            Prefetch('items', queryset=items))
 
     def get_serializer_class(self):
         if self.request.method == 'PATCH':
@@ -356,6 +585,14 @@ class OrderDetail(generics.RetrieveUpdateDestroyAPIView):
             return [permissions.IsAdminUser()]
         return [permissions.IsAuthenticated()]
 
+    def delete(self, request, pk):
+        order = self.get_object()
+        if order.items.exists():
+            return Response({'error': 'Order cannot be deleted because it has order items.'},
+                            status=status.HTTP_405_METHOD_NOT_ALLOWED)
+        order.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
 
 class ProductImagesList(generics.ListAPIView):
     def get_serializer_context(self):
@@ -388,3 +625,25 @@ class ProductImageDetail(generics.RetrieveUpdateDestroyAPIView):
                 pk=image_id, product_id=product_id)
             return self.queryset
         raise Http404
+
+
+class SalesReport(APIView):
+    """Sales over a date range, answered from the daily rollups."""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        query = serializers.SalesReportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        report = rollups.report(**query.validated_data)
+        return Response(serializers.SalesReportSerializer(report).data)
+
+
+class Metrics(APIView):
+    permission_classes = [HasMetricsToken | permissions.IsAdminUser]
+    swagger_schema = None
+
+    def get(self, request):
+        body = metrics.registry.render(extra=metrics.response_cache_lines(
+            cache.get_stats(*cache.NAMESPACES)))
+        return HttpResponse(
+            body, content_type='text/plain; version=0.0.4; charset=utf-8')
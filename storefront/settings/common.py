@@ -39,6 +39,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'store.middleware.MetricsMiddleware',
     'debug_toolbar.middleware.DebugToolbarMiddleware',
     'django.middleware.security.SecurityMiddleware',
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -99,6 +100,35 @@ REST_FRAMEWORK = {
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     )
 }
+# Scrapers authenticate to /api/_metrics with an X-Metrics-Token header.
+STORE_METRICS_TOKEN = os.environ.get('STORE_METRICS_TOKEN')
+# Requests running more queries than this are logged as warnings.
+STORE_METRICS_QUERY_BUDGET = 25
+# Serve the catalog and cart reads from store.async_views; run under ASGI.
+STORE_ASYNC_VIEWS = os.environ.get('STORE_ASYNC_VIEWS') == '1'
+
+# The response cache, its version counters and the hit/miss stats must be
+# shared by every web worker and by the management commands that bump
+# them, so a per-process cache (LocMemCache) is refused by a system check.
+# Redis is used when STORE_REDIS_URL is set (needs the `redis` package),
+# else a database table created with `python manage.py createcachetable`.
+if os.environ.get('STORE_REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['STORE_REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'store_cache',
+            # Culling evicts the version counters along with the responses.
+            'OPTIONS': {'MAX_ENTRIES': 100000},
+        }
+    }
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=5),
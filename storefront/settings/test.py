@@ -0,0 +1,25 @@
+from .common import *
+
+DEBUG = False
+SECRET_KEY = 'django-insecure-test-only'
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'test.sqlite3',
+    }
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+# Tests run in one process, so the local-memory cache is shared enough.
+STORE_ALLOW_LOCAL_CACHE = True
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'